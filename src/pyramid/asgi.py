@@ -0,0 +1,238 @@
+import asyncio
+import inspect
+from io import BytesIO
+import sys
+import types
+
+from pyramid.threadlocal import RequestContext
+
+LOOP_KEY = 'pyramid.asgi.loop'
+EXECUTOR_KEY = 'pyramid.asgi.executor'
+
+
+def environ_from_scope(scope, body):
+    """ Return a :term:`WSGI` environment built from the ``scope`` of an
+    :term:`ASGI` HTTP connection and the complete request ``body`` as bytes.
+
+    As in any WSGI environment, text values are native strings holding the
+    latin-1 decoded bytes of the request.  The original ``scope`` is
+    available as ``asgi.scope``."""
+    path = scope.get('path', '/')
+    root_path = scope.get('root_path', '')
+    if root_path and path.startswith(root_path):
+        path = path[len(root_path) :]
+    server = scope.get('server') or ('localhost', 80)
+    client = scope.get('client')
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': root_path.encode('utf-8').decode('latin-1'),
+        'PATH_INFO': path.encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': 'HTTP/%s' % scope.get('http_version', '1.1'),
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False,
+        'asgi.scope': scope,
+    }
+    if client:
+        environ['REMOTE_ADDR'] = client[0]
+        environ['REMOTE_PORT'] = str(client[1])
+    for name, value in scope.get('headers', ()):
+        name = name.decode('latin-1').upper().replace('-', '_')
+        value = value.decode('latin-1')
+        if name not in ('CONTENT_TYPE', 'CONTENT_LENGTH'):
+            name = 'HTTP_' + name
+        if name in environ:
+            value = environ[name] + ',' + value
+        environ[name] = value
+    if body and 'CONTENT_LENGTH' not in environ:
+        # the body was sent with chunked transfer encoding
+        environ['CONTENT_LENGTH'] = str(len(body))
+    return environ
+
+
+async def receive_body(receive):
+    """ Read the complete request body of an :term:`ASGI` HTTP connection.
+    Return ``None`` if the client disconnects before sending all of it."""
+    chunks = []
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            return None
+        chunks.append(message.get('body', b''))
+        if not message.get('more_body', False):
+            return b''.join(chunks)
+
+
+async def send_response(response, environ, send):
+    """ Send ``response`` to an :term:`ASGI` client.
+
+    The response is called as a WSGI application so that conditional and
+    ``HEAD`` requests are handled exactly as they would be by a WSGI server.
+    Body iterators that are not lists are iterated in the thread pool, as
+    they may perform blocking I/O (e.g. a :class:`pyramid.response.FileIter`).
+    """
+    started = []
+
+    def start_response(status, headerlist, exc_info=None):
+        started[:] = [status, headerlist]
+
+    app_iter = response(environ, start_response)
+    try:
+        status, headerlist = started
+        await send(
+            {
+                'type': 'http.response.start',
+                'status': int(status.split(' ', 1)[0]),
+                'headers': [
+                    (name.lower().encode('latin-1'), value.encode('latin-1'))
+                    for name, value in headerlist
+                ],
+            }
+        )
+        if isinstance(app_iter, (list, tuple)):
+            for chunk in app_iter:
+                if chunk:
+                    await _send_chunk(send, chunk)
+        else:
+            loop = asyncio.get_running_loop()
+            executor = environ.get(EXECUTOR_KEY)
+            chunks = iter(app_iter)
+            while True:
+                chunk = await loop.run_in_executor(
+                    executor, next, chunks, None
+                )
+                if chunk is None:
+                    break
+                if chunk:
+                    await _send_chunk(send, chunk)
+        await send({'type': 'http.response.body', 'body': b''})
+    finally:
+        close = getattr(app_iter, 'close', None)
+        if close is not None:
+            close()
+
+
+async def _send_chunk(send, chunk):
+    await send(
+        {'type': 'http.response.body', 'body': chunk, 'more_body': True}
+    )
+
+
+async def run_in_threadpool(request, fn, *args):
+    """ Call ``fn(*args)`` in the bounded thread pool of the :term:`router`
+    handling ``request`` and return its result.  The :term:`thread local`
+    request and registry are set to those of ``request`` while ``fn``
+    runs."""
+    loop = asyncio.get_running_loop()
+    executor = request.environ.get(EXECUTOR_KEY)
+
+    def call():
+        with RequestContext(request):
+            return fn(*args)
+
+    return await loop.run_in_executor(executor, call)
+
+
+@types.coroutine
+def in_request_context(request, awaitable):
+    """ Await ``awaitable`` with the :term:`thread local` request and
+    registry set to those of ``request`` whenever its code runs.
+
+    The requests handled on the event loop share its thread, so the thread
+    locals cannot stay set while ``awaitable`` waits: they are set each time
+    it resumes and unset each time it suspends."""
+    iterator = awaitable.__await__()
+    value = error = None
+    while True:
+        with RequestContext(request):
+            try:
+                if error is None:
+                    future = iterator.send(value)
+                else:
+                    future, error = iterator.throw(error), None
+            except StopIteration as stop:
+                return stop.value
+        try:
+            value = yield future
+        except GeneratorExit:
+            with RequestContext(request):
+                iterator.close()
+            raise
+        except BaseException as exc:
+            value, error = None, exc
+
+
+def run_in_loop(request, awaitable):
+    """ Wait for ``awaitable`` to complete on the event loop handling
+    ``request`` and return its result.  This must be called from a thread
+    of the thread pool, never from the event loop itself."""
+    loop = request.environ[LOOP_KEY]
+    return asyncio.run_coroutine_threadsafe(
+        _await(request, awaitable), loop
+    ).result()
+
+
+async def _await(request, awaitable):
+    return await in_request_context(request, awaitable)
+
+
+def then(request, awaitable, callback):
+    """ Return an awaitable which awaits ``awaitable`` and returns the result
+    of calling ``callback`` with its result, awaiting that too if needed.
+    The :term:`thread local` request and registry are set to those of
+    ``request`` while ``callback`` runs.  Used by :term:`view deriver`
+    wrappers to post-process the result of an ``async def`` view."""
+
+    async def awaited():
+        result = await awaitable
+        with RequestContext(request):
+            result = callback(result)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    return awaited()
+
+
+def is_async_callable(ob):
+    """ Return ``True`` if calling ``ob`` returns an awaitable, i.e. if it is
+    a coroutine function or an object with an ``async def __call__``."""
+    return asyncio.iscoroutinefunction(ob) or asyncio.iscoroutinefunction(
+        getattr(ob, '__call__', None)
+    )
+
+
+def blocking_handler(handler):
+    """ Return a synchronous request handler which calls ``handler`` and,
+    if it returns an awaitable (e.g. the result of an ``async def``
+    :term:`view callable`), waits for it on the event loop.  Used for the
+    part of the asynchronous request pipeline which runs in the thread
+    pool."""
+
+    def blocking(request):
+        response = handler(request)
+        if inspect.isawaitable(response):
+            response = run_in_loop(request, response)
+        return response
+
+    return blocking
+
+
+def threaded_handler(handler):
+    """ Return a coroutine function which calls the synchronous ``handler``
+    in the thread pool and awaits its result if it is itself awaitable."""
+
+    async def threaded(request):
+        response = await run_in_threadpool(request, handler, request)
+        if inspect.isawaitable(response):
+            response = await in_request_context(request, response)
+        return response
+
+    return threaded
@@ -13,6 +13,7 @@ from zope.interface import implementer
 from pyramid.authorization import Authenticated, Everyone
 from pyramid.interfaces import IAuthenticationPolicy, IDebugLogger
 from pyramid.util import (
+    LRUCache,
     SimpleSerializer,
     ascii_,
     bytes_,
@@ -959,10 +960,25 @@ class AuthTktCookieHelper(object):
         Default: ``'Lax'``.  The 'samesite' option of the session cookie. Set
         the value to ``None`` to turn off the samesite option. Optional.
 
+    ``cache_size``
+
+        Default: ``1000``.  The number of verified tickets kept in memory, so
+        that a ticket sent again from the same address is not parsed and its
+        digest not computed again.  Tickets are looked up by a digest of the
+        whole cookie, the least recently used being discarded first, and are
+        discarded once they time out.  The ``timeout`` and ``reissue_time``
+        of a ticket are checked on every request whether it was found in the
+        cache or not.  If this value is ``0``, no tickets are cached.
+        Optional.
+
     .. versionchanged:: 2.0
 
         The default ``hashalg`` was changed from ``md5`` to ``sha512``.
 
+    .. versionchanged:: 2.0
+
+        Added the ``cache_size`` option.
+
     """
 
     parse_ticket = staticmethod(parse_ticket)  # for tests
@@ -999,6 +1015,7 @@ class AuthTktCookieHelper(object):
         parent_domain=False,
         domain=None,
         samesite='Lax',
+        cache_size=1000,
     ):
         self.cookie_profile = CookieProfile(
             cookie_name=cookie_name,
@@ -1023,6 +1040,22 @@ class AuthTktCookieHelper(object):
         self.parent_domain = parent_domain
         self.domain = domain
         self.hashalg = hashalg
+        self.ticket_cache = None
+        if cache_size:
+            self.ticket_cache = LRUCache(int(cache_size))
+
+    def cache_stats(self):
+        """ Return a dictionary describing the cache of verified tickets: the
+        number of ``hits`` and ``misses`` of lookups in it and their
+        ``hit_ratio``, the number of ``evictions`` of least recently used
+        tickets, its current ``size`` and its ``maxsize``.  Return ``None``
+        if tickets are not cached."""
+        if self.ticket_cache is None:
+            return None
+        stats = self.ticket_cache.stats()
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
 
     def _get_cookies(self, request, value, max_age=None):
         cur_domain = request.domain
@@ -1063,30 +1096,52 @@ class AuthTktCookieHelper(object):
         else:
             remote_addr = '0.0.0.0'
 
-        try:
-            timestamp, userid, tokens, user_data = self.parse_ticket(
-                self.secret, cookie, remote_addr, self.hashalg
+        cache = self.ticket_cache
+        ticket = None
+        if cache is not None:
+            key = (
+                hashlib.sha256(bytes_(cookie, 'utf-8')).digest(),
+                remote_addr,
             )
-        except self.BadTicket:
-            return None
+            ticket = cache.get(key)
 
         now = self.now  # service tests
 
         if now is None:
             now = time_mod.time()
 
-        if self.timeout and ((timestamp + self.timeout) < now):
-            # the auth_tkt data has expired
-            return None
+        if ticket is not None:
+            timestamp, userid, tokens, user_data = ticket
+            tokens = list(tokens)
+
+            if self.timeout and ((timestamp + self.timeout) < now):
+                # the auth_tkt data has expired
+                cache.pop(key)
+                return None
 
-        userid_typename = 'userid_type:'
-        user_data_info = user_data.split('|')
-        for datum in filter(None, user_data_info):
-            if datum.startswith(userid_typename):
-                userid_type = datum[len(userid_typename) :]
-                decoder = self.userid_type_decoders.get(userid_type)
-                if decoder:
-                    userid = decoder(userid)
+        else:
+            try:
+                timestamp, userid, tokens, user_data = self.parse_ticket(
+                    self.secret, cookie, remote_addr, self.hashalg
+                )
+            except self.BadTicket:
+                return None
+
+            if self.timeout and ((timestamp + self.timeout) < now):
+                # the auth_tkt data has expired
+                return None
+
+            userid_typename = 'userid_type:'
+            user_data_info = user_data.split('|')
+            for datum in filter(None, user_data_info):
+                if datum.startswith(userid_typename):
+                    userid_type = datum[len(userid_typename) :]
+                    decoder = self.userid_type_decoders.get(userid_type)
+                    if decoder:
+                        userid = decoder(userid)
+
+            if cache is not None:
+                cache.put(key, (timestamp, userid, tuple(tokens), user_data))
 
         reissue = self.reissue_time is not None
 
@@ -3,7 +3,7 @@ from zope.interface import implementer
 
 from pyramid.interfaces import IAuthorizationPolicy
 from pyramid.location import lineage
-from pyramid.util import is_nonstr_iter
+from pyramid.util import FIFOCache, is_nonstr_iter
 
 # the simplest way to deprecate the attributes in security.py is to
 # leave them defined there and then import/re-export them here because
@@ -57,6 +57,13 @@ class ACLAuthorizationPolicy(object):
     Objects of this class implement the
     :class:`pyramid.interfaces.IAuthorizationPolicy` interface.
 
+    Its ``cache`` attribute is the :class:`.ACLCache` shared by its checks,
+    or ``None`` (the default) to search each ACL anew.  When the policy is
+    registered with
+    :meth:`pyramid.config.Configurator.set_authorization_policy`, a cache
+    holding at most ``pyramid.acl_cache_size`` ACLs is used if that setting
+    is not ``0`` (see :ref:`acl_cache_size_setting`).
+
     .. deprecated:: 2.0
 
         Authorization policies have been deprecated by the new security system.
@@ -66,13 +73,34 @@ class ACLAuthorizationPolicy(object):
 
     def __init__(self):
         self.helper = ACLHelper()
+        self.cache = None
+
+    def set_cache_size(self, maxsize):
+        """ Replace the ``cache`` by an :class:`.ACLCache` holding at most
+        ``maxsize`` ACLs, or remove it if ``maxsize`` is ``0``.
+
+        .. versionadded:: 2.0
+
+        """
+        self.cache = ACLCache(maxsize) if maxsize else None
 
     def permits(self, context, principals, permission):
         """ Return an instance of
         :class:`pyramid.authorization.ACLAllowed` instance if the policy
         permits access, return an instance of
         :class:`pyramid.authorization.ACLDenied` if not."""
-        return self.helper.permits(context, principals, permission)
+        return self.helper.permits(context, principals, permission, self.cache)
+
+    def permits_many(self, contexts, principals, permission):
+        """ Return a list of the results of :meth:`permits` for each
+        context of ``contexts``.  See :meth:`.ACLHelper.permits_many`.
+
+        .. versionadded:: 2.0
+
+        """
+        return self.helper.permits_many(
+            contexts, principals, permission, self.cache
+        )
 
     def principals_allowed_by_permission(self, context, permission):
         """ Return the set of principals explicitly granted the
@@ -93,7 +121,7 @@ class ACLHelper:
 
     """
 
-    def permits(self, context, principals, permission):
+    def permits(self, context, principals, permission, cache=None):
         """ Return an instance of :class:`pyramid.authorization.ACLAllowed` if
         the ACL allows access a user with the given principals, return an
         instance of :class:`pyramid.authorization.ACLDenied` if not.
@@ -118,6 +146,23 @@ class ACLHelper:
         access, return an instance of
         :class:`pyramid.authorization.ACLDenied` (equals ``False``).
 
+        ``cache`` may be an :class:`.ACLCache`, in which each ACL is indexed
+        by permission and principal the first time it is searched.  Checks
+        passed the same cache share these indexes, so that ACLs with the same
+        ACEs, such as those of common parents, are not searched again.  The
+        cache is keyed on the contents of the ACLs, so it may be kept for the
+        lifetime of the application, but each lookup hashes the whole ACL:
+        it only pays off for long ACLs checked often.
+
+        .. code-block:: python
+
+           acl_cache = ACLCache()
+           helper.permits(context, principals, permission, acl_cache)
+
+        .. versionchanged:: 2.0
+
+           Added the ``cache`` argument.
+
         """
         acl = '<No ACL found on any object in resource lineage>'
 
@@ -130,20 +175,19 @@ class ACLHelper:
             if acl and callable(acl):
                 acl = acl()
 
-            for ace in acl:
-                ace_action, ace_principal, ace_permissions = ace
-                if ace_principal in principals:
-                    if not is_nonstr_iter(ace_permissions):
-                        ace_permissions = [ace_permissions]
-                    if permission in ace_permissions:
-                        if ace_action == Allow:
-                            return ACLAllowed(
-                                ace, acl, permission, principals, location
-                            )
-                        else:
-                            return ACLDenied(
-                                ace, acl, permission, principals, location
-                            )
+            if cache is None:
+                ace = _find_ace(acl, principals, permission)
+            else:
+                ace = cache.find_ace(acl, principals, permission)
+            if ace is not None:
+                if ace[0] == Allow:
+                    return ACLAllowed(
+                        ace, acl, permission, principals, location
+                    )
+                else:
+                    return ACLDenied(
+                        ace, acl, permission, principals, location
+                    )
 
         # default deny (if no ACL in lineage at all, or if none of the
         # principals were mentioned in any ACE we found)
@@ -151,6 +195,20 @@ class ACLHelper:
             '<default deny>', acl, permission, principals, context
         )
 
+    def permits_many(self, contexts, principals, permission, cache=None):
+        """ Return a list of the results of :meth:`permits` for each
+        context of ``contexts`` with ``principals`` and ``permission``.
+
+        The checks share ``cache``, as described in :meth:`permits`.
+
+        .. versionadded:: 2.0
+
+        """
+        return [
+            self.permits(context, principals, permission, cache)
+            for context in contexts
+        ]
+
     def principals_allowed_by_permission(self, context, permission):
         """ Return the set of principals explicitly granted the permission
         named ``permission`` according to the ACL directly attached to the
@@ -207,3 +265,107 @@ class ACLHelper:
             allowed.update(allowed_here)
 
         return allowed
+
+
+def _find_ace(acl, principals, permission):
+    """ Return the first ACE of ``acl`` granting or denying ``permission`` to
+    any of ``principals`` or ``None``."""
+    for ace in acl:
+        ace_action, ace_principal, ace_permissions = ace
+        if ace_principal in principals:
+            if not is_nonstr_iter(ace_permissions):
+                ace_permissions = [ace_permissions]
+            if permission in ace_permissions:
+                return ace
+
+
+class ACLCache(object):
+    """ A cache of ACLs indexed by permission and principal, for use with
+    :meth:`.ACLHelper.permits`.
+
+    ACLs are keyed on their ACEs, so an ACL modified in place or replaced
+    by another object is indexed anew, and ACLs with the same ACEs share
+    their index.  Lists of permissions are compared as tuples; ACLs with
+    other unhashable ACE members are searched without the cache.
+    At most ``maxsize`` ACLs are kept in a :class:`pyramid.util.FIFOCache`.
+    ``stats()`` returns its hits, misses, evictions and size.
+
+    .. versionadded:: 2.0
+
+    """
+
+    def __init__(self, maxsize=1000):
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+        self.data = FIFOCache(maxsize)
+
+    def find_ace(self, acl, principals, permission):
+        """ Return the first ACE of ``acl`` granting or denying
+        ``permission`` to any of ``principals`` or ``None``."""
+        aces = acl if type(acl) is tuple else tuple(acl)
+        try:
+            key = aces
+            compiled = self.data.get(key)
+        except TypeError:
+            try:
+                key = _hashable_aces(aces)
+                compiled = self.data.get(key)
+            except TypeError:
+                return _find_ace(aces, principals, permission)
+        if compiled is None:
+            compiled = _CompiledACL(aces)
+            self.data.put(key, compiled)
+        return compiled.find_ace(principals, permission)
+
+    def clear(self):
+        """ Forget all ACLs and reset the statistics."""
+        self.data.clear()
+
+    def stats(self):
+        return self.data.stats()
+
+
+def _hashable_aces(aces):
+    # ``aces`` with lists of permissions made into tuples
+    return tuple(
+        (action, principal, tuple(permissions))
+        if type(permissions) is list
+        else (action, principal, permissions)
+        for action, principal, permissions in aces
+    )
+
+
+class _CompiledACL(object):
+    """ An ACL indexed by permission and principal.
+
+    For each permission looked up, the position of the first ACE mentioning
+    each principal is remembered, so finding the first ACE which matches
+    any of a set of principals does not require scanning the ACL again.
+    """
+
+    def __init__(self, acl):
+        self.acl = acl
+        self.aces = []
+        for ace in acl:
+            ace_action, ace_principal, ace_permissions = ace
+            if not is_nonstr_iter(ace_permissions):
+                ace_permissions = [ace_permissions]
+            self.aces.append((ace, ace_principal, ace_permissions))
+        self.positions = {}
+
+    def find_ace(self, principals, permission):
+        try:
+            positions = self.positions.get(permission)
+            if positions is None:
+                positions = {}
+                for i, (ace, principal, permissions) in enumerate(self.aces):
+                    if permission in permissions:
+                        positions.setdefault(principal, i)
+                self.positions[permission] = positions
+            found = [positions.get(principal) for principal in principals]
+        except TypeError:
+            # unhashable ACE principals
+            return _find_ace(self.acl, principals, permission)
+        found = [i for i in found if i is not None]
+        if found:
+            return self.aces[min(found)][0]
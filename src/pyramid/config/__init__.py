@@ -1,6 +1,9 @@
+import importlib.machinery
 import inspect
+import json
 import logging
 import os
+import sys
 import threading
 import venusian
 from webob.exc import WSGIHTTPException as WebobWSGIHTTPException
@@ -37,7 +40,12 @@ from pyramid.interfaces import (
     IExceptionResponse,
 )
 from pyramid.path import DottedNameResolver, caller_package, package_of
-from pyramid.registry import Introspectable, Introspector, Registry
+from pyramid.registry import (
+    Introspectable,
+    Introspector,
+    Registry,
+    make_view_lookup_miss_cache,
+)
 from pyramid.router import Router
 from pyramid.settings import aslist
 from pyramid.threadlocal import manager
@@ -452,8 +460,8 @@ class Configurator(
     def _fix_registry(self):
         """ Fix up a ZCA component registry that is not a
         pyramid.registry.Registry by adding analogues of ``has_listeners``,
-        ``notify``, ``queryAdapterOrSelf``, and ``registerSelfAdapter``
-        through monkey-patching."""
+        ``has_listeners_for``, ``notify``, ``queryAdapterOrSelf``, and
+        ``registerSelfAdapter`` through monkey-patching."""
 
         _registry = self.registry
 
@@ -467,6 +475,9 @@ class Configurator(
         if not hasattr(_registry, 'has_listeners'):
             _registry.has_listeners = True
 
+        if not hasattr(_registry, 'has_listeners_for'):
+            _registry.has_listeners_for = lambda event_type: True
+
         if not hasattr(_registry, 'queryAdapterOrSelf'):
 
             def queryAdapterOrSelf(object, interface, default=None):
@@ -500,7 +511,10 @@ class Configurator(
         if not hasattr(_registry, '_clear_view_lookup_cache'):
 
             def _clear_view_lookup_cache():
+                settings = getattr(_registry, 'settings', None)
+                misses = make_view_lookup_miss_cache(settings)
                 _registry._view_lookup_cache = {}
+                _registry._view_lookup_miss_cache = misses
 
             _registry._clear_view_lookup_cache = _clear_view_lookup_cache
 
@@ -857,6 +871,15 @@ class Configurator(
         may require additional arguments.  Providing this argument is not
         often necessary; it's an advanced usage.
 
+        If the ``pyramid.scan_manifest`` setting names a file, the modules
+        of ``package`` which contain no decorated objects are recorded in it
+        the first time the package is scanned.  Later scans do not import
+        those modules as long as no file of the package was added, removed
+        or modified, and the same ``categories`` and ``ignore`` arguments are
+        used.  Modules which are only imported by a scan, and which change
+        the configuration at import time without decorators, must not be
+        used with a manifest.  See :ref:`scan_manifest_setting`.
+
         .. versionadded:: 1.1
            The ``**kw`` argument.
 
@@ -867,6 +890,9 @@ class Configurator(
            The ``categories`` argument now defaults to ``['pyramid']`` instead
            of ``None`` to control which decorator callbacks are executed.
 
+        .. versionchanged:: 2.0
+           Added the ``pyramid.scan_manifest`` setting.
+
         """
         package = self.maybe_dotted(package)
         if package is None:  # pragma: no cover
@@ -877,10 +903,28 @@ class Configurator(
 
         scanner = self.venusian.Scanner(**ctorkw)
 
+        manifest = entry = None
+        settings = self.registry.settings
+        path = settings and settings.get('pyramid.scan_manifest')
+        if path and hasattr(package, '__path__'):
+            manifest = ScanManifest(path)
+            entry = manifest.lookup(package, categories, ignore)
+        if entry is not None and entry.skipped is not None:
+            skipped = entry.skipped.__contains__
+            if ignore is None:
+                ignore = skipped
+            elif isinstance(ignore, str):
+                ignore = [ignore, skipped]
+            else:
+                ignore = list(ignore) + [skipped]
+
         scanner.scan(
             package, categories=categories, onerror=onerror, ignore=ignore
         )
 
+        if entry is not None and entry.skipped is None:
+            manifest.record(entry, package, categories)
+
     def make_wsgi_app(self):
         """ Commits any pending configuration statements, sends a
         :class:`pyramid.events.ApplicationCreated` event to all listeners,
@@ -908,3 +952,116 @@ class Configurator(
 
 
 global_registries = WeakOrderedSet()
+
+
+class ScanManifest(object):
+    """ A file recording, for each package scanned by
+    :meth:`pyramid.config.Configurator.scan`, the modules which contain no
+    objects decorated for the scanned categories, along with the
+    modification time of every file of the package."""
+
+    version = 1
+
+    def __init__(self, path):
+        self.path = path
+        self.scans = {}
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get('version') == self.version:
+            scans = data.get('scans')
+            if isinstance(scans, dict):
+                self.scans = scans
+
+    def lookup(self, package, categories, ignore):
+        """ Return a :class:`ScanManifestEntry` for a scan of ``package``,
+        or ``None`` if its modules cannot be recorded because ``ignore``
+        contains callables.  Its ``skipped`` attribute is the set of modules
+        the scan need not import, or ``None`` if it is not known."""
+        if ignore is None:
+            ignore = []
+        elif isinstance(ignore, str) or not hasattr(ignore, '__iter__'):
+            ignore = [ignore]
+        if not all(isinstance(ign, str) for ign in ignore):
+            return None
+        if categories is not None:
+            categories = sorted(categories)
+        key = json.dumps([package.__name__, categories, list(ignore)])
+        files = _package_files(package)
+        skipped = None
+        recorded = self.scans.get(key)
+        if isinstance(recorded, dict) and recorded.get('files') == files:
+            skipped = set(recorded.get('skipped', ()))
+        return ScanManifestEntry(key, files, skipped)
+
+    def record(self, entry, package, categories):
+        """ Record the modules of ``package`` which the scan described by
+        ``entry`` imported but which contain no decorated objects, and write
+        the file."""
+        pkg_name = package.__name__
+        needed = set()
+        imported = set()
+        for name, module in list(sys.modules.items()):
+            if module is None or not name.startswith(pkg_name + '.'):
+                continue
+            imported.add(name)
+            if _has_callbacks(module, name, categories):
+                parts = name.split('.')
+                for i in range(len(parts), 0, -1):
+                    needed.add('.'.join(parts[:i]))
+        self.scans[entry.key] = {
+            'files': entry.files,
+            'skipped': sorted(imported - needed),
+        }
+        data = {'version': self.version, 'scans': self.scans}
+        tmp = '%s.%s.tmp' % (self.path, os.getpid())
+        try:
+            with open(tmp, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            # the manifest is an optimization, scanning must not fail
+            pass
+
+
+class ScanManifestEntry(object):
+    def __init__(self, key, files, skipped):
+        self.key = key
+        self.files = files
+        self.skipped = skipped
+
+
+def _package_files(package):
+    # the modification time of every module file below the package
+    suffixes = tuple(importlib.machinery.all_suffixes())
+    files = {}
+    for n, root in enumerate(package.__path__):
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(d for d in dirnames if d != '__pycache__')
+            for filename in filenames:
+                if filename.endswith(suffixes):
+                    fullpath = os.path.join(dirpath, filename)
+                    relpath = os.path.relpath(fullpath, root)
+                    key = '%s:%s' % (n, relpath.replace(os.sep, '/'))
+                    files[key] = os.stat(fullpath).st_mtime_ns
+    return files
+
+
+def _has_callbacks(module, name, categories):
+    # whether a venusian scan of the module would find callbacks for the
+    # categories in it
+    for ob in list(vars(module).values()):
+        try:
+            attached = getattr(ob, venusian.ATTACH_ATTR)
+            keys = attached.keys() if categories is None else categories
+            for category in keys:
+                for callback in attached.get(category, ()):
+                    if callback[1] == name:
+                        return True
+        except Exception:
+            # see venusian.Scanner.scan about objects which misbehave when
+            # asked for attributes
+            continue
+    return False
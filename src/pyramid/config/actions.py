@@ -1,7 +1,9 @@
+from collections import OrderedDict
 import functools
 import itertools
 import operator
 import sys
+import time
 import traceback
 from zope.interface import implementer
 
@@ -148,9 +150,14 @@ class ActionConfiguratorMixin(object):
         """
         self.begin()
         try:
-            self.action_state.execute_actions(introspector=self.introspector)
+            action_state = self.action_state
+            action_state.execute_actions(introspector=self.introspector)
         finally:
             self.end()
+            # seconds spent in each phase, see ActionState.execute_actions
+            self.registry.action_timings = getattr(
+                action_state, 'timings', None
+            )
         self.action_state = ActionState()  # old actions have been processed
 
 
@@ -160,6 +167,8 @@ class ActionState(object):
         # NB "actions" is an API, dep'd upon by pyramid_zcml's load_zcml func
         self.actions = []
         self._seen_files = set()
+        # seconds spent in each phase of the last execute_actions call
+        self.timings = {}
 
     def processSpec(self, spec):
         """Check whether a callable needs to be processed.  The ``spec``
@@ -211,6 +220,10 @@ class ActionState(object):
 
         This calls the action callables after resolving conflicts
 
+        The number of seconds spent sorting, grouping and checking actions
+        for conflicts (see ``resolveConflicts``) and executing them is kept
+        in the ``timings`` dictionary.
+
         For example:
 
         >>> output = []
@@ -270,11 +283,13 @@ class ActionState(object):
         [('f', (1,), {}), ('g', (8,), {})]
 
         """
+        started = time.perf_counter()
         try:
             all_actions = []
             executed_actions = []
             action_iter = iter([])
             conflict_state = ConflictResolverState()
+            self.timings = conflict_state.timings
 
             while True:
                 # We clear the actions list prior to execution so if there
@@ -326,6 +341,10 @@ class ActionState(object):
             return executed_actions
 
         finally:
+            timings = self.timings
+            timings['execute'] = max(
+                time.perf_counter() - started - sum(timings.values()), 0.0
+            )
             if clear:
                 self.actions = []
 
@@ -336,8 +355,9 @@ class ConflictResolverState(object):
         # that a new action does not conflict with something already executed
         self.resolved_ainfos = {}
 
-        # actions left over from a previous iteration
-        self.remaining_actions = []
+        # actions left over from a previous iteration, by id so that the
+        # actions which are resolved are removed in constant time
+        self.remaining_actions = OrderedDict()
 
         # after executing an action we memoize its order to avoid any new
         # actions sending us backward
@@ -347,6 +367,9 @@ class ConflictResolverState(object):
         # monotonically across invocations to resolveConflicts
         self.start = 0
 
+        # seconds spent in each phase of the resolution
+        self.timings = {'sort': 0.0, 'group': 0.0, 'check': 0.0}
+
 
 # this function is licensed under the ZPL (stolen from Zope)
 def resolveConflicts(actions, state=None):
@@ -368,15 +391,20 @@ def resolveConflicts(actions, state=None):
 
     ``state`` may be an instance of ``ConflictResolverState`` that
     can be used to resume execution and resolve the new actions against the
-    list of executed actions from a previous call.
+    list of executed actions from a previous call.  The seconds spent
+    sorting the actions, grouping them by discriminator and checking the
+    groups for conflicts are added to its ``timings``.
 
     """
     if state is None:
         state = ConflictResolverState()
+    timings = state.timings
+    clock = time.perf_counter
 
     # pick up where we left off last time, but track the new actions as well
-    state.remaining_actions.extend(normalize_actions(actions))
-    actions = state.remaining_actions
+    remaining = state.remaining_actions
+    remaining.update((id(v), v) for v in normalize_actions(actions))
+    actions = list(remaining.values())
 
     def orderandpos(v):
         n, v = v
@@ -386,8 +414,11 @@ def resolveConflicts(actions, state=None):
         n, v = v
         return v['order'] or 0
 
+    started = clock()
     sactions = sorted(enumerate(actions, start=state.start), key=orderandpos)
+    timings['sort'] += clock() - started
     for order, actiongroup in itertools.groupby(sactions, orderonly):
+        started = clock()
         # "order" is an integer grouping. Actions in a lower order will be
         # executed before actions in a higher order.  All of the actions in
         # one grouping will be executed (its callable, if any will be called)
@@ -433,6 +464,9 @@ def resolveConflicts(actions, state=None):
             L = unique.setdefault(discriminator, [])
             L.append(ainfo)
 
+        grouped = clock()
+        timings['group'] += grouped - started
+
         # Check for conflicts
         conflicts = {}
         for discriminator, ainfos in unique.items():
@@ -482,12 +516,15 @@ def resolveConflicts(actions, state=None):
         if conflicts:
             raise ConfigurationConflictError(conflicts)
 
-        # sort resolved actions by "i" and yield them one by one
-        for i, action in sorted(output, key=operator.itemgetter(0)):
+        output.sort(key=operator.itemgetter(0))
+        timings['check'] += clock() - grouped
+
+        # yield resolved actions one by one, sorted by "i"
+        for i, action in output:
             # do not memoize the order until we resolve an action inside it
             state.min_order = action['order']
             state.start = i + 1
-            state.remaining_actions.remove(action)
+            del remaining[id(action)]
             state.resolved_ainfos[action['discriminator']] = (i, action)
             yield action
 
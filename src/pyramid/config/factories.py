@@ -2,10 +2,12 @@ from zope.interface import implementer
 
 from pyramid.config.actions import action_method
 from pyramid.interfaces import (
+    PHASE2_CONFIG,
     IDefaultRootFactory,
     IExecutionPolicy,
     IRequestExtensions,
     IRequestFactory,
+    IRequestTracer,
     IResponseFactory,
     IRootFactory,
     ISessionFactory,
@@ -255,6 +257,41 @@ class FactoriesConfiguratorMixin(object):
         intr['policy'] = policy
         self.action(IExecutionPolicy, register, introspectables=(intr,))
 
+    @action_method
+    def set_request_tracer(self, tracer):
+        """
+        Set the :term:`request tracer` of the current configuration.  The
+        ``tracer`` argument must be an object implementing
+        :class:`pyramid.interfaces.IRequestTracer` or a :term:`dotted Python
+        name` that points at one.
+
+        The :term:`router` reports each step of handling a request to the
+        tracer.  When no tracer is set, the router does not measure the
+        steps at all.
+
+        .. versionadded:: 2.0
+
+        """
+        tracer = self.maybe_dotted(tracer)
+
+        def register():
+            self.registry.registerUtility(tracer, IRequestTracer)
+
+        intr = self.introspectable(
+            'request tracer',
+            None,
+            self.object_description(tracer),
+            'request tracer',
+        )
+        intr['tracer'] = tracer
+        # views look the tracer up when they are derived
+        self.action(
+            IRequestTracer,
+            register,
+            introspectables=(intr,),
+            order=PHASE2_CONFIG,
+        )
+
 
 @implementer(IRequestExtensions)
 class _RequestExtensions(object):
@@ -3,7 +3,7 @@ from webob.acceptparse import Accept
 
 from pyramid.exceptions import ConfigurationError
 from pyramid.interfaces import PHASE1_CONFIG, IPredicateList
-from pyramid.predicates import Notted
+from pyramid.predicates import CachedPredicate, Notted
 from pyramid.registry import predvalseq
 from pyramid.util import TopologicalSorter, bytes_, is_nonstr_iter
 
@@ -92,6 +92,15 @@ class not_(object):
         self.value = value
 
 
+def cache_predicates(preds):
+    # the predicates of a view or route which are cacheable are evaluated
+    # at most once per request
+    return [
+        CachedPredicate(p) if getattr(p, 'cacheable', False) else p
+        for p in preds
+    ]
+
+
 # under = after
 # over = before
 
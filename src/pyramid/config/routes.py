@@ -3,7 +3,11 @@ from urllib.parse import urlparse
 import warnings
 
 from pyramid.config.actions import action_method
-from pyramid.config.predicates import normalize_accept_offer, predvalseq
+from pyramid.config.predicates import (
+    cache_predicates,
+    normalize_accept_offer,
+    predvalseq,
+)
 from pyramid.exceptions import ConfigurationError
 from pyramid.interfaces import (
     PHASE2_CONFIG,
@@ -13,6 +17,7 @@ from pyramid.interfaces import (
 )
 import pyramid.predicates
 from pyramid.request import route_request_iface
+from pyramid.settings import asbool
 from pyramid.urldispatch import RoutesMapper
 from pyramid.util import as_sorted_tuple, is_nonstr_iter
 
@@ -479,7 +484,7 @@ class RoutesConfiguratorMixin(object):
                 name,
                 pattern,
                 factory,
-                predicates=preds,
+                predicates=cache_predicates(preds),
                 pregenerator=pregenerator,
                 static=static,
             )
@@ -544,10 +549,18 @@ class RoutesConfiguratorMixin(object):
 
     def get_routes_mapper(self):
         """ Return the :term:`routes mapper` object associated with
-        this configurator's :term:`registry`."""
+        this configurator's :term:`registry`.
+
+        If the ``pyramid.index_routes`` setting is true, the mapper matches
+        requests using a :class:`pyramid.urldispatch.RouteIndex` built from
+        the literal prefixes of the route patterns instead of trying every
+        route in turn."""
         mapper = self.registry.queryUtility(IRoutesMapper)
         if mapper is None:
-            mapper = RoutesMapper()
+            settings = self.registry.settings or {}
+            mapper = RoutesMapper(
+                indexed=asbool(settings.get('pyramid.index_routes'))
+            )
             self.registry.registerUtility(mapper, IRoutesMapper)
         return mapper
 
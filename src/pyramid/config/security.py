@@ -1,6 +1,7 @@
 import warnings
 from zope.interface import implementer
 
+from pyramid.authorization import ACLAuthorizationPolicy
 from pyramid.config.actions import action_method
 from pyramid.csrf import LegacySessionCSRFStoragePolicy
 from pyramid.exceptions import ConfigurationError
@@ -135,6 +136,11 @@ class SecurityConfiguratorMixin(object):
            :class:`pyramid.config.Configurator` constructor can be used to
            achieve the same purpose.
 
+        The ACL cache of a
+        :class:`pyramid.authorization.ACLAuthorizationPolicy` is sized
+        according to the ``pyramid.acl_cache_size`` setting (see
+        :ref:`acl_cache_size_setting`).
+
         """
         warnings.warn(
             'Authentication and authorization policies have been deprecated '
@@ -146,6 +152,12 @@ class SecurityConfiguratorMixin(object):
         )
 
         def register():
+            settings = self.registry.settings or {}
+            cache_size = settings.get('acl_cache_size')
+            if cache_size is not None and isinstance(
+                policy, ACLAuthorizationPolicy
+            ):
+                policy.set_cache_size(cache_size)
             self.registry.registerUtility(policy, IAuthorizationPolicy)
 
         def ensure():
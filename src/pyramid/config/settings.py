@@ -107,5 +107,17 @@ def Settings(d=None, _environ_=os.environ, **kw):
     S('prevent_http_cache', 'PYRAMID_PREVENT_HTTP_CACHE', asbool)
     S('prevent_cachebust', 'PYRAMID_PREVENT_CACHEBUST', asbool)
     S('csrf_trusted_origins', 'PYRAMID_CSRF_TRUSTED_ORIGINS', aslist, [])
+    S('index_routes', 'PYRAMID_INDEX_ROUTES', asbool)
+    S(
+        'view_lookup_miss_cache_size',
+        'PYRAMID_VIEW_LOOKUP_MISS_CACHE_SIZE',
+        int,
+        1000,
+    )
+    S('asgi_max_threads', 'PYRAMID_ASGI_MAX_THREADS', int, 40)
+    S('acl_cache_size', 'PYRAMID_ACL_CACHE_SIZE', int, 0)
+    S('scan_manifest', 'PYRAMID_SCAN_MANIFEST', str, '')
+    S('compile_view_derivers', 'PYRAMID_COMPILE_VIEW_DERIVERS', asbool)
+    S('request_timings', 'PYRAMID_REQUEST_TIMINGS', asbool)
 
     return d
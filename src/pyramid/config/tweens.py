@@ -1,7 +1,9 @@
 from zope.interface import implementer
 
+from pyramid.asgi import blocking_handler, threaded_handler
 from pyramid.config.actions import action_method
 from pyramid.exceptions import ConfigurationError
+from pyramid.instrumentation import timed
 from pyramid.interfaces import ITweens
 from pyramid.tweens import EXCVIEW, INGRESS, MAIN
 from pyramid.util import (
@@ -189,3 +191,43 @@ class Tweens(object):
         for name, factory in use[::-1]:
             handler = factory(handler, registry)
         return handler
+
+    def instrumented(self, handler, registry, timings):
+        """ Return the tween chain composed as by :meth:`__call__`, with
+        ``handler`` and the handler returned by each tween factory timed
+        into ``timings``, a :class:`pyramid.instrumentation.RequestTimings`.
+        """
+        if self.explicit:
+            use = self.explicit
+        else:
+            use = self.implicit()
+        handler = timed(timings.tween(MAIN), handler)
+        for name, factory in use[::-1]:
+            handler = timed(timings.tween(name), factory(handler, registry))
+        return handler
+
+    def async_handler(self, handler, sync_handler, registry):
+        """ Return the tween chain of the asynchronous request pipeline
+        wrapped around the coroutine function ``handler``.
+
+        Tween factories with a true ``supports_async`` attribute are called
+        with a coroutine function as their handler and must return one.
+        Starting with the first tween factory without it (counting from
+        ingress), the rest of the chain is composed as by :meth:`__call__`
+        around the synchronous ``sync_handler`` instead, and is run in the
+        thread pool."""
+        if self.explicit:
+            use = self.explicit
+        else:
+            use = self.implicit()
+        for index, (name, factory) in enumerate(use):
+            if not getattr(factory, 'supports_async', False):
+                sync_handler = blocking_handler(sync_handler)
+                for name, factory in reversed(use[index:]):
+                    sync_handler = factory(sync_handler, registry)
+                handler = threaded_handler(sync_handler)
+                use = use[:index]
+                break
+        for name, factory in use[::-1]:
+            handler = factory(handler, registry)
+        return handler
@@ -15,6 +15,7 @@ from pyramid.config.actions import action_method
 from pyramid.config.predicates import (
     DEFAULT_PHASH,
     MAX_ORDER,
+    cache_predicates,
     normalize_accept_offer,
     predvalseq,
     sort_accept_offers,
@@ -62,6 +63,8 @@ from pyramid.viewderivers import (
     INGRESS,
     VIEW,
     DefaultViewMapper,
+    ViewStep,
+    compile_view_derivers,
     preserve_view_attrs,
     requestonly,
     view_description,
@@ -81,6 +84,7 @@ class MultiView(object):
         self.media_views = {}
         self.views = []
         self.accepts = []
+        self._tables = {}
 
     def __discriminator__(self, context, request):
         # used by introspection systems like so:
@@ -92,6 +96,10 @@ class MultiView(object):
         return view.__discriminator__(context, request)
 
     def add(self, view, order, phash=None, accept=None, accept_order=None):
+        self._add(view, order, phash, accept, accept_order)
+        self._tables = {}
+
+    def _add(self, view, order, phash, accept, accept_order):
         if phash is not None:
             for i, (s, v, h) in enumerate(list(self.views)):
                 if phash == h:
@@ -126,12 +134,35 @@ class MultiView(object):
             return views
         return self.views
 
+    def _get_tables(self, request):
+        # the compiled equivalent of get_views
+        if self.accepts and hasattr(request, 'accept'):
+            offers = [
+                offer
+                for offer, _ in request.accept.acceptable_offers(self.accepts)
+            ]
+            offers.append(None)
+        else:
+            offers = [None]
+        tables = []
+        for offer in offers:
+            views = self.views if offer is None else self.media_views[offer]
+            table = self._tables.get(offer)
+            if table is None or not table.compiled_from(views):
+                table = self._tables[offer] = ViewTable(views)
+            tables.append(table)
+        return tables
+
     def match(self, context, request):
-        for order, view, phash in self.get_views(request):
-            if not hasattr(view, '__predicated__'):
-                return view
-            if view.__predicated__(context, request):
-                return view
+        for table in self._get_tables(request):
+            for view, call, preds in table.candidates(request):
+                if call is None:
+                    if not hasattr(view, '__predicated__'):
+                        return view
+                    if view.__predicated__(context, request):
+                        return view
+                elif _all_match(preds, context, request):
+                    return view
         raise PredicateMismatch(self.name)
 
     def __permitted__(self, context, request):
@@ -146,15 +177,111 @@ class MultiView(object):
         return view(context, request)
 
     def __call__(self, context, request):
-        for order, view, phash in self.get_views(request):
-            try:
-                return view(context, request)
-            except PredicateMismatch:
-                continue
+        for table in self._get_tables(request):
+            for view, call, preds in table.candidates(request):
+                if call is None:
+                    call = view
+                elif not _all_match(preds, context, request):
+                    continue
+                try:
+                    return call(context, request)
+                except PredicateMismatch:
+                    # raised by the view itself, e.g. a nested MultiView
+                    continue
         raise PredicateMismatch(self.name)
 
 
+def _all_match(preds, context, request):
+    for predicate in preds:
+        if not predicate(context, request):
+            return False
+    return True
+
+
+class ViewTable(object):
+    """ The views of a :class:`MultiView` sorted by order, compiled so
+    that the request method and xhr predicates of each view are checked
+    with a single dictionary lookup per request.
+
+    Each candidate is a ``(view, call, predicates)`` tuple.  ``call`` is
+    the view with its predicate checks stripped and ``predicates`` are
+    the predicates left to check once the request method and xhr
+    matched.  ``call`` is ``None`` for views whose predicates cannot be
+    compiled (e.g. a view which only defines ``__predicated__``)."""
+
+    def __init__(self, views):
+        self.views = views
+        self.size = len(views)
+        self.methods = set()
+        self.xhr = False
+        self.entries = []
+        self.dispatch = {}
+        for item in views:
+            view = item[1]
+            call = getattr(view, '__unpredicated__', None)
+            preds = getattr(view, '__predicates__', None)
+            methods = xhr = None
+            if call is None or preds is None:
+                call, preds = None, ()
+            else:
+                remaining = []
+                for predicate in preds:
+                    if isinstance(
+                        predicate, pyramid.predicates.RequestMethodPredicate
+                    ):
+                        if methods is None:
+                            methods = set(predicate.val)
+                        else:
+                            methods &= set(predicate.val)
+                        self.methods.update(predicate.val)
+                    elif (
+                        isinstance(predicate, pyramid.predicates.XHRPredicate)
+                        and xhr is None
+                    ):
+                        xhr = predicate.val
+                        self.xhr = True
+                    else:
+                        remaining.append(predicate)
+                preds = tuple(remaining)
+            self.entries.append((methods, xhr, (view, call, preds)))
+
+    def compiled_from(self, views):
+        return views is self.views and len(views) == self.size
+
+    def candidates(self, request):
+        method = request.method if self.methods else None
+        if method not in self.methods:
+            method = None
+        xhr = bool(request.is_xhr) if self.xhr else None
+        key = (method, xhr)
+        candidates = self.dispatch.get(key)
+        if candidates is None:
+            candidates = self.dispatch[key] = [
+                candidate
+                for methods, view_xhr, candidate in self.entries
+                if (methods is None or method in methods)
+                and (view_xhr is None or view_xhr is xhr)
+            ]
+        return candidates
+
+
 def attr_wrapped_view(view, info):
+    attrs = _view_attrs(info)
+    if attrs is None:
+        return view  # defaults
+
+    def attr_view(context, request):
+        return view(context, request)
+
+    for name, value in attrs.items():
+        setattr(attr_view, name, value)
+    unpredicated = getattr(view, '__unpredicated__', None)
+    if unpredicated is not None:
+        attr_view.__unpredicated__ = unpredicated
+    return attr_view
+
+
+def _view_attrs(info):
     accept, order, phash = (
         info.options.get('accept', None),
         getattr(info, 'order', MAX_ORDER),
@@ -164,20 +291,30 @@ def attr_wrapped_view(view, info):
     # function with attributes that indicate accept, order, and phash,
     # so we use a wrapper
     if (accept is None) and (order == MAX_ORDER) and (phash == DEFAULT_PHASH):
-        return view  # defaults
+        return None
+    return {
+        '__accept__': accept,
+        '__order__': order,
+        '__phash__': phash,
+        '__view_attr__': info.options.get('attr'),
+        '__permission__': info.options.get('permission'),
+    }
 
-    def attr_view(context, request):
-        return view(context, request)
 
-    attr_view.__accept__ = accept
-    attr_view.__order__ = order
-    attr_view.__phash__ = phash
-    attr_view.__view_attr__ = info.options.get('attr')
-    attr_view.__permission__ = info.options.get('permission')
-    return attr_view
+def _attr_wrapped_step(view, info):
+    attrs = _view_attrs(info)
+    if attrs is None:
+        return None
+
+    def decorate(wrapper):
+        for name, value in attrs.items():
+            setattr(wrapper, name, value)
+
+    return ViewStep(decorate=decorate)
 
 
 attr_wrapped_view.options = ('accept', 'attr', 'permission')
+attr_wrapped_view.step = _attr_wrapped_step
 
 
 def predicated_view(view, info):
@@ -188,11 +325,7 @@ def predicated_view(view, info):
     def predicate_wrapper(context, request):
         for predicate in preds:
             if not predicate(context, request):
-                view_name = getattr(view, '__name__', view)
-                raise PredicateMismatch(
-                    'predicate mismatch for view %s (%s)'
-                    % (view_name, predicate.text())
-                )
+                _raise_predicate_mismatch(view, predicate)
         return view(context, request)
 
     def checker(context, request):
@@ -200,9 +333,42 @@ def predicated_view(view, info):
 
     predicate_wrapper.__predicated__ = checker
     predicate_wrapper.__predicates__ = preds
+    # lets MultiView call the view once it checked the predicates itself
+    predicate_wrapper.__unpredicated__ = view
     return predicate_wrapper
 
 
+def _raise_predicate_mismatch(view, predicate):
+    view_name = getattr(view, '__name__', view)
+    raise PredicateMismatch(
+        'predicate mismatch for view %s (%s)' % (view_name, predicate.text())
+    )
+
+
+def _predicated_step(view, info):
+    preds = info.predicates
+    if not preds:
+        return None
+
+    def check_predicates(context, request):
+        for predicate in preds:
+            if not predicate(context, request):
+                _raise_predicate_mismatch(view, predicate)
+
+    def checker(context, request):
+        return all((predicate(context, request) for predicate in preds))
+
+    def decorate(wrapper):
+        wrapper.__predicated__ = checker
+        wrapper.__predicates__ = preds
+        wrapper.__unpredicated__ = view
+
+    return ViewStep(before=check_predicates, decorate=decorate)
+
+
+predicated_view.step = _predicated_step
+
+
 def viewdefaults(wrapped):
     """ Decorator for add_view-like methods which takes into account
     __view_defaults__ attached to view it is passed.  Not a documented API but
@@ -994,7 +1160,7 @@ class ViewsConfiguratorMixin(object):
 
         def derive_view(isexc_only, renderer):
             # added by discrim_func above during conflict resolving
-            preds = view_intr['predicates']
+            preds = cache_predicates(view_intr['predicates'])
             order = view_intr['order']
             phash = view_intr['phash']
 
@@ -1157,8 +1323,20 @@ class ViewsConfiguratorMixin(object):
 
         view = info.original_view
         derivers = self.registry.getUtility(IViewDerivers)
-        for name, deriver in reversed(outer_derivers + derivers.sorted()):
-            view = wraps_view(deriver)(view, info)
+        derivers = reversed(outer_derivers + derivers.sorted())
+        settings = info.settings
+        if settings and settings.get('compile_view_derivers', False):
+            view, plan = compile_view_derivers(view, info, derivers)
+        else:
+            plan = []
+            for name, deriver in derivers:
+                derived = wraps_view(deriver)(view, info)
+                if derived is not view:
+                    plan.insert(0, (name,))
+                view = derived
+        if view is not info.original_view:
+            # the derivers a request goes through, shown by pviews
+            view.__deriver_plan__ = tuple(plan)
         return view
 
     @action_method
@@ -1950,6 +2128,19 @@ class ViewsConfiguratorMixin(object):
         header. By default, the list is empty and no alternatives will be
         supported.
 
+        The ``memory_cache_size`` keyword argument is the number of static
+        assets whose contents are kept in memory so that serving them again
+        does not touch the disk.  Only assets no larger than the
+        ``memory_cache_max_file_size`` keyword argument (64KiB by default)
+        are kept in memory.  By default, this is ``0`` and no assets are kept
+        in memory.  See :class:`pyramid.static.static_view`.
+
+        The ``prescan`` keyword argument controls whether every static asset
+        is found when the view is first called rather than the disk being
+        searched for each asset the first time it is requested.  Assets added
+        afterwards are not served.  It is ignored when
+        ``pyramid.reload_assets`` is enabled.  By default, this is ``False``.
+
         The ``permission`` keyword argument is used to specify the
         :term:`permission` required by a user to execute the static view.  By
         default, it is the string
@@ -2029,7 +2220,8 @@ class ViewsConfiguratorMixin(object):
 
         .. versionchanged:: 2.0
 
-           Added the ``content_encodings`` argument.
+           Added the ``content_encodings``, ``memory_cache_size``,
+           ``memory_cache_max_file_size`` and ``prescan`` arguments.
 
         """
         spec = self._make_spec(path)
@@ -2206,6 +2398,11 @@ class StaticURLInfo(object):
             url = None
             cache_max_age = extra.pop('cache_max_age', None)
             content_encodings = extra.pop('content_encodings', [])
+            memory_cache_size = extra.pop('memory_cache_size', 0)
+            memory_cache_max_file_size = extra.pop(
+                'memory_cache_max_file_size', 65536
+            )
+            prescan = extra.pop('prescan', False)
 
             # create a view
             view = static_view(
@@ -2214,6 +2411,9 @@ class StaticURLInfo(object):
                 use_subpath=True,
                 reload=config.registry.settings['pyramid.reload_assets'],
                 content_encodings=content_encodings,
+                memory_cache_size=memory_cache_size,
+                memory_cache_max_file_size=memory_cache_max_file_size,
+                prescan=prescan,
             )
 
             # Mutate extra to allow factory, etc to be passed through here.
@@ -0,0 +1,229 @@
+from bisect import bisect_left
+import math
+import threading
+import time
+
+from pyramid.interfaces import IRequestTracer
+
+# the upper bounds of the histogram buckets, in seconds
+DEFAULT_BOUNDS = (
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# the phases of a request timed by the router
+PHASES = (
+    'route_match',
+    'root_factory',
+    'traversal',
+    'view_lookup',
+    'view_call',
+    'render',
+    'response_callbacks',
+)
+
+# the steps of a request reported to a request tracer, in order; the
+# ``render`` step happens during the ``view_call`` step
+TRACE_STEPS = (
+    'new_request',
+    'route_match',
+    'before_traversal',
+    'root_factory',
+    'traversal',
+    'context_found',
+    'view_lookup',
+    'view_call',
+    'render',
+    'response_callbacks',
+    'new_response',
+    'finished_callbacks',
+)
+
+
+class LatencyHistogram(object):
+    """ Counts durations, in seconds, in buckets bounded by ``bounds``.
+    Durations longer than the last bound are counted in an extra bucket.
+
+    Updates are not locked, so concurrent counts are approximate."""
+
+    def __init__(self, bounds=DEFAULT_BOUNDS):
+        self.bounds = tuple(bounds)
+        self.reset()
+
+    def reset(self):
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self):
+        if not self.count:
+            return 0.0
+        return self.total / self.count
+
+    def percentile(self, percent):
+        """ Return the upper bound of the bucket holding the ``percent``
+        percentile of the durations, or the longest duration if it is
+        shorter."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * percent / 100.0))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                break
+        if index < len(self.bounds):
+            return min(self.bounds[index], self.max)
+        return self.max
+
+
+class RequestTimings(object):
+    """ The latency histograms of the :term:`tween` chain and of the
+    phases of the requests handled by a :term:`router`.
+
+    When the ``pyramid.request_timings`` setting is enabled, an instance
+    is available as the ``request_timings`` attribute of the
+    :term:`application registry`.  ``tweens`` maps the name of each tween,
+    and :attr:`pyramid.tweens.MAIN`, to the histogram of the time spent in
+    it, including the tweens under it.  ``phases`` maps the name of each
+    step in :data:`TRACE_STEPS`, which include the :data:`PHASES`, to the
+    histogram of the time spent in it.
+
+    Instances are :term:`request tracer` objects: the duration of each
+    traced step is added to the histogram of the phase of the same name."""
+
+    def __init__(self, bounds=DEFAULT_BOUNDS):
+        self.bounds = bounds
+        self.tweens = {}
+        self.phases = {}
+        self._lock = threading.Lock()
+
+    def tween(self, name):
+        return self._histogram(self.tweens, name)
+
+    def phase(self, name):
+        return self._histogram(self.phases, name)
+
+    def _histogram(self, histograms, name):
+        histogram = histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = histograms.get(name)
+                if histogram is None:
+                    histogram = LatencyHistogram(self.bounds)
+                    histograms[name] = histogram
+        return histogram
+
+    def __call__(self, request, step, timing):
+        start, stop = timing
+        self.phase(step).add(stop - start)
+
+    def reset(self):
+        for histograms in (self.tweens, self.phases):
+            for histogram in histograms.values():
+                histogram.reset()
+
+
+def get_request_timings(registry):
+    """ Return the :class:`RequestTimings` of the ``registry``, creating
+    them on first use."""
+    timings = getattr(registry, 'request_timings', None)
+    if timings is None:
+        timings = registry.request_timings = RequestTimings()
+    return timings
+
+
+def get_request_tracer(registry):
+    """ Return the :term:`request tracer` to which the steps of the
+    requests handled with the ``registry`` are reported: the tracer set with
+    :meth:`pyramid.config.Configurator.set_request_tracer`, the
+    :class:`RequestTimings` of the ``registry`` when the
+    ``pyramid.request_timings`` setting is enabled, both, or ``None``."""
+    tracer = registry.queryUtility(IRequestTracer)
+    settings = registry.settings
+    if settings and settings.get('request_timings', False):
+        timings = get_request_timings(registry)
+        if tracer is None:
+            return timings
+        return _tracers(tracer, timings)
+    return tracer
+
+
+def _tracers(*tracers):
+    def trace(request, step, timing):
+        for tracer in tracers:
+            tracer(request, step, timing)
+
+    return trace
+
+
+def traced(tracer, step, func):
+    """ Return a callable which calls ``func`` with a request as its second
+    argument and reports its duration as ``step`` to the ``tracer``, even
+    when it raises an exception."""
+    clock = time.perf_counter
+
+    def traced_func(context, request, *arg, **kw):
+        start = clock()
+        try:
+            return func(context, request, *arg, **kw)
+        finally:
+            tracer(request, step, (start, clock()))
+
+    return traced_func
+
+
+def step_tracer(tracer, request):
+    """ Return a callable which, called with the name of a step of the
+    ``request``, reports to the ``tracer`` the time since it was last called,
+    or since it was made, as the duration of that step."""
+    clock = time.perf_counter
+    start = clock()
+
+    def mark(step):
+        nonlocal start
+        stop = clock()
+        tracer(request, step, (start, stop))
+        start = stop
+
+    return mark
+
+
+def timed(histogram, func):
+    """ Return a callable which calls ``func`` and adds the time it took to
+    the ``histogram``, even when it raises an exception."""
+    add = histogram.add
+    clock = time.perf_counter
+
+    def timed_func(*arg, **kw):
+        start = clock()
+        try:
+            return func(*arg, **kw)
+        finally:
+            add(clock() - start)
+
+    return timed_func
@@ -848,6 +848,17 @@ class IRouter(Interface):
 
         """
 
+    def asgi(scope, receive, send):
+        """
+        An :term:`ASGI` application serving the same application as the
+        router itself.  ``async def`` :term:`view callable` objects are
+        awaited on the event loop while synchronous view callables are called
+        in a thread pool.
+
+        .. versionadded:: 2.0
+
+        """
+
 
 class IExecutionPolicy(Interface):
     def __call__(environ, router):
@@ -878,6 +889,25 @@ class IExecutionPolicy(Interface):
         """
 
 
+class IRequestTracer(Interface):
+    def __call__(request, step, timing):
+        """
+        Called by the :term:`router` once each step of handling the
+        ``request`` is done, including when an exception is raised by the
+        ``view_call`` or ``finished_callbacks`` step.
+
+        ``step`` is one of the names in
+        :data:`pyramid.instrumentation.TRACE_STEPS`.
+
+        ``timing`` is a ``(start, stop)`` tuple of the values of
+        :func:`time.perf_counter` when the step started and stopped.
+
+        The return value is ignored.
+
+        .. versionadded:: 2.0
+        """
+
+
 class ISettings(IDict):
     """ Runtime settings utility for pyramid; represents the
     deployment settings for the application.  Implements a mapping
@@ -1196,6 +1226,34 @@ class ISession(IDict):
         """
 
 
+class ISessionStore(Interface):
+    """ Storage for the data of the sessions created by
+    :func:`pyramid.session.ServerSideSessionFactory`.  The data of a session
+    is a dictionary of JSON-serializable values keyed by strings.
+
+    .. versionadded:: 2.0
+    """
+
+    def load(session_id):
+        """ Return a ``(state, created, renewed)`` tuple for the session
+        identified by the string ``session_id``, where ``state`` is the
+        dictionary of session data and ``created`` and ``renewed`` are the
+        times the session was created and last saved, or return ``None`` if
+        there is no such session or it has timed out."""
+
+    def save(session_id, changed, deleted, created, renewed, timeout):
+        """ Store the values of the ``changed`` dictionary in the session
+        identified by ``session_id``, remove the keys in the ``deleted``
+        collection from it, and record its ``created`` and ``renewed``
+        times, creating the session if it does not exist.  Other keys of the
+        session must be left as they are.  The session may be discarded once
+        ``timeout`` seconds have passed since ``renewed`` without it being
+        saved again; if ``timeout`` is ``None`` it never times out."""
+
+    def delete(session_id):
+        """ Remove the session identified by ``session_id`` if it exists."""
+
+
 class ICSRFStoragePolicy(Interface):
     """ An object that offers the ability to verify CSRF tokens and generate
     new ones."""
@@ -1532,6 +1590,12 @@ class IViewDeriver(Interface):
         ':meth:`pyramid.config.Configurator.add_view`. '
         'This attribute is optional.'
     )
+    step = Attribute(
+        'A callable accepting ``(view, info)`` which returns a '
+        ':class:`pyramid.viewderivers.ViewStep` or ``None``, used to compile '
+        'the deriver together with other derivers. This attribute is '
+        'optional.'
+    )
 
     def __call__(view, info):
         """
@@ -1,6 +1,7 @@
 import re
 
 from pyramid.exceptions import ConfigurationError
+from pyramid.request import RequestLocalCache
 from pyramid.traversal import (
     find_interface,
     resource_path_tuple,
@@ -97,6 +98,8 @@ class RequestParamPredicate(object):
 
 
 class HeaderPredicate(object):
+    cacheable = True
+
     def __init__(self, val, config):
         name = val
         v = None
@@ -267,6 +270,9 @@ class PhysicalPathPredicate(object):
 
 
 class EffectivePrincipalsPredicate(object):
+    # the security policy is asked for the principals only once per request
+    cacheable = True
+
     def __init__(self, val, config):
         if is_nonstr_iter(val):
             self.val = set(val)
@@ -305,9 +311,48 @@ class Notted(object):
     def phash(self):
         return self._notted_text(self.predicate.phash())
 
+    @property
+    def cacheable(self):
+        return getattr(self.predicate, 'cacheable', False)
+
     def __call__(self, context, request):
         result = self.predicate(context, request)
         phash = self.phash()
         if phash:
             result = not result
         return result
+
+
+_predicate_results = RequestLocalCache(lambda request: {})
+
+
+class CachedPredicate(object):
+    """ Wraps a view or route predicate which declares itself
+    ``cacheable`` so that it is evaluated at most once per request.
+
+    A cacheable predicate must only depend on the request.  The result is
+    shared by all predicates with the same class and ``phash``, whether
+    they belong to a route or to a view."""
+
+    def __init__(self, predicate):
+        self.predicate = predicate
+        hashes = predicate.phash()
+        if not is_nonstr_iter(hashes):
+            hashes = (hashes,)
+        self.key = (predicate.__class__, tuple(hashes))
+
+    def text(self):
+        return self.predicate.text()
+
+    def phash(self):
+        return self.predicate.phash()
+
+    def __call__(self, context, request):
+        if not hasattr(request, 'add_finished_callback'):
+            return self.predicate(context, request)
+        results = _predicate_results.get_or_create(request)
+        try:
+            return results[self.key]
+        except KeyError:
+            result = results[self.key] = self.predicate(context, request)
+            return result
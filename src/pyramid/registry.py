@@ -1,11 +1,12 @@
 import operator
 import threading
-from zope.interface import implementer
+from zope.interface import implementedBy, implementer
 from zope.interface.registry import Components
 
 from pyramid.decorator import reify
 from pyramid.interfaces import IIntrospectable, IIntrospector, ISettings
 from pyramid.path import CALLER_PACKAGE, caller_package
+from pyramid.util import LRUCache
 
 
 class Registry(Components, dict):
@@ -49,6 +50,8 @@ class Registry(Components, dict):
         self._lock = threading.Lock()
         # add a view lookup cache
         self._clear_view_lookup_cache()
+        # remembers which event types have subscribers
+        self._listeners_for = {}
         if package_name is CALLER_PACKAGE:
             package_name = caller_package().__name__
         Components.__init__(self, package_name, *args, **kw)
@@ -56,6 +59,9 @@ class Registry(Components, dict):
 
     def _clear_view_lookup_cache(self):
         self._view_lookup_cache = {}
+        self._view_lookup_miss_cache = make_view_lookup_miss_cache(
+            self.settings
+        )
 
     def __nonzero__(self):
         # defeat bool determination via dict.__len__
@@ -95,8 +101,29 @@ class Registry(Components, dict):
     def registerHandler(self, *arg, **kw):
         result = Components.registerHandler(self, *arg, **kw)
         self.has_listeners = True
+        self._listeners_for = {}
+        return result
+
+    def unregisterHandler(self, *arg, **kw):
+        result = Components.unregisterHandler(self, *arg, **kw)
+        self._listeners_for = {}
         return result
 
+    def has_listeners_for(self, event_type):
+        # like has_listeners, but only true if some subscriber would be
+        # called when notifying an instance of the class ``event_type``
+        if not self.has_listeners:
+            return False
+        listeners_for = self._listeners_for
+        try:
+            return listeners_for[event_type]
+        except KeyError:
+            result = bool(
+                self.adapters.subscriptions((implementedBy(event_type),), None)
+            )
+            listeners_for[event_type] = result
+            return result
+
     def notify(self, *events):
         if self.has_listeners:
             # iterating over subscribers assures they get executed
@@ -114,6 +141,18 @@ class Registry(Components, dict):
     settings = property(_get_settings, _set_settings)
 
 
+def make_view_lookup_miss_cache(settings):
+    """ Return the bounded cache of view lookup misses used by
+    ``pyramid.view._find_views``, sized by the
+    ``pyramid.view_lookup_miss_cache_size`` setting.  Return ``None`` if the
+    size is ``0``, which disables caching of misses."""
+    size = 1000
+    if settings is not None:
+        size = int(settings.get('pyramid.view_lookup_miss_cache_size', size))
+    if size:
+        return LRUCache(size)
+
+
 @implementer(IIntrospector)
 class Introspector(object):
     def __init__(self):
@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from functools import partial
 import json
 import os
@@ -171,6 +172,7 @@ def string_renderer_factory(info):
                 response.content_type = 'text/plain'
         return value
 
+    _render.needs_system_values = False
     return _render
 
 
@@ -218,19 +220,57 @@ class JSON(object):
         stock JSON serializer with, say, simplejson.  If all you want to
         do, however, is serialize custom objects, you should use the method
         explained in :ref:`json_serializing_custom_objects` instead
-        of replacing the serializer.
+        of replacing the serializer.  The serializer may return either a
+        string or bytes, so faster encoders which produce UTF-8 encoded
+        bytes directly (such as ``orjson.dumps``) can be used as-is.
+
+    If ``stream`` is ``True``, the renderer does not build the whole JSON
+    document in memory.  Instead it returns an iterator which encodes the
+    value incrementally as chunks of UTF-8 bytes of roughly ``chunk_size``
+    characters, and which becomes the ``app_iter`` of the response.  In this
+    mode generators and other iterators are serialized as JSON arrays, so a
+    view can return e.g. ``{'rows': (row.as_dict() for row in query)}``
+    without ever holding all the rows at once.  Objects that are not natively
+    serializable are still converted by their ``__json__`` method or by the
+    registered adapters, which may themselves return iterators.  The
+    ``serializer`` argument is not used in this mode: values are encoded by
+    :class:`json.JSONEncoder` with the extra ``kw`` keyword arguments,
+    except that ``indent`` is not supported.  Note that, as the value is
+    only serialized as the response body is sent, a value which cannot be
+    serialized causes an exception after the response status and headers
+    have been sent.
 
     .. versionadded:: 1.4
        Prior to this version, there was no public API for supplying options
        to the underlying serializer without defining a custom renderer.
+
+    .. versionchanged:: 2.0
+       Added the ``stream`` and ``chunk_size`` arguments.
+
+    .. versionchanged:: 2.0
+       The serializer may return bytes.
     """
 
-    def __init__(self, serializer=json.dumps, adapters=(), **kw):
+    def __init__(
+        self,
+        serializer=json.dumps,
+        adapters=(),
+        stream=False,
+        chunk_size=65536,
+        **kw
+    ):
         """ Any keyword arguments will be passed to the ``serializer``
         function."""
+        if stream and kw.get('indent') is not None:
+            raise ValueError('indent is not supported when streaming')
         self.serializer = serializer
+        self.stream = stream
+        self.chunk_size = chunk_size
         self.kw = kw
         self.components = Components()
+        # maps classes to the function converting their instances for the
+        # serializer; reset whenever an adapter is added
+        self._default_cache = {}
         for type, adapter in adapters:
             self.add_adapter(type, adapter)
 
@@ -259,6 +299,7 @@ class JSON(object):
         self.components.registerAdapter(
             adapter, (type_or_iface,), IJSONAdapter
         )
+        self._default_cache = {}
 
     def __call__(self, info):
         """ Returns a plain JSON-encoded string with content-type
@@ -273,25 +314,112 @@ class JSON(object):
                 if ct == response.default_content_type:
                     response.content_type = 'application/json'
             default = self._make_default(request)
+            if self.stream:
+                return self._iterencode(value, default)
             return self.serializer(value, default=default, **self.kw)
 
+        _render.needs_system_values = False
         return _render
 
+    def _iterencode(self, value, default, prefix='', suffix=''):
+        # encode ``value`` lazily, joining the many small strings produced
+        # by _iterencode_value into chunks of about ``chunk_size`` characters
+        encoder = json.JSONEncoder(**self.kw)
+        chunk_size = self.chunk_size
+        chunk = [prefix]
+        size = len(prefix)
+        for part in _iterencode_value(value, encoder, default):
+            chunk.append(part)
+            size += len(part)
+            if size >= chunk_size:
+                yield ''.join(chunk).encode('utf-8')
+                chunk = []
+                size = 0
+        chunk.append(suffix)
+        yield ''.join(chunk).encode('utf-8')
+
     def _make_default(self, request):
+        cache = self._default_cache
+
         def default(obj):
-            if hasattr(obj, '__json__'):
-                return obj.__json__(request)
-            obj_iface = providedBy(obj)
-            adapters = self.components.adapters
-            result = adapters.lookup(
-                (obj_iface,), IJSONAdapter, default=_marker
-            )
-            if result is _marker:
-                raise TypeError('%r is not JSON serializable' % (obj,))
-            return result(obj, request)
+            # the way to convert an object only depends on its class, unless
+            # it has its own __json__ method or interface declarations
+            attrs = getattr(obj, '__dict__', None)
+            if attrs and ('__json__' in attrs or '__provides__' in attrs):
+                convert, cacheable = self._find_default(obj)
+            else:
+                cls = obj.__class__
+                convert = cache.get(cls)
+                if convert is None:
+                    convert, cacheable = self._find_default(obj)
+                    if cacheable:
+                        cache[cls] = convert
+            return convert(obj, request)
 
         return default
 
+    def _find_default(self, obj):
+        # return the function converting ``obj`` and whether it may be
+        # used for every instance of the class of ``obj``
+        if hasattr(obj, '__json__'):
+            return _call_json, hasattr(obj.__class__, '__json__')
+        obj_iface = providedBy(obj)
+        adapters = self.components.adapters
+        result = adapters.lookup((obj_iface,), IJSONAdapter, default=_marker)
+        if result is _marker:
+            result = _not_serializable
+        return result, True
+
+
+def _call_json(obj, request):
+    return obj.__json__(request)
+
+
+def _not_serializable(obj, request):
+    raise TypeError('%r is not JSON serializable' % (obj,))
+
+
+def _iterencode_value(value, encoder, default):
+    if isinstance(value, (str, int, float)) or value is None:
+        # this includes bools
+        yield encoder.encode(value)
+    elif isinstance(value, dict):
+        yield '{'
+        items = value.items()
+        if encoder.sort_keys:
+            items = sorted(items)
+        first = True
+        for key, item in items:
+            if isinstance(key, str):
+                key = encoder.encode(key)
+            elif isinstance(key, (int, float)) or key is None:
+                key = encoder.encode(encoder.encode(key))
+            elif encoder.skipkeys:
+                continue
+            else:
+                raise TypeError(
+                    'keys must be str, int, float, bool or None, not %s'
+                    % key.__class__.__name__
+                )
+            if not first:
+                yield encoder.item_separator
+            first = False
+            yield key
+            yield encoder.key_separator
+            yield from _iterencode_value(item, encoder, default)
+        yield '}'
+    elif isinstance(value, (list, tuple, Iterator)):
+        yield '['
+        first = True
+        for item in value:
+            if not first:
+                yield encoder.item_separator
+            first = False
+            yield from _iterencode_value(item, encoder, default)
+        yield ']'
+    else:
+        yield from _iterencode_value(default(value), encoder, default)
+
 
 json_renderer_factory = JSON()  # bw compat
 
@@ -374,9 +502,8 @@ class JSONP(JSON):
         def _render(value, system):
             request = system.get('request')
             default = self._make_default(request)
-            val = self.serializer(value, default=default, **self.kw)
             ct = 'application/json'
-            body = val
+            callback = None
             if request is not None:
                 callback = request.GET.get(self.param_name)
 
@@ -387,12 +514,23 @@ class JSONP(JSON):
                         )
 
                     ct = 'application/javascript'
-                    body = '/**/{0}({1});'.format(callback, val)
                 response = request.response
                 if response.content_type == response.default_content_type:
                     response.content_type = ct
+            if self.stream:
+                if callback is None:
+                    return self._iterencode(value, default)
+                return self._iterencode(
+                    value, default, '/**/{0}('.format(callback), ');'
+                )
+            body = self.serializer(value, default=default, **self.kw)
+            if callback is not None:
+                if isinstance(body, bytes):
+                    body = body.decode('utf-8')
+                body = '/**/{0}({1});'.format(callback, body)
             return body
 
+        _render.needs_system_values = False
         return _render
 
 
@@ -430,7 +568,21 @@ class RendererHelper(object):
     def get_renderer(self):
         return self.renderer
 
+    def needs_system_values(self):
+        """ Return ``True`` unless the renderer declares that it uses only the
+        ``request`` and ``context`` system values, by having a false
+        ``needs_system_values`` attribute, and no :class:`BeforeRender`
+        subscriber is registered.  Otherwise rendering skips building the
+        other system values and the :class:`BeforeRender` event."""
+        if getattr(self.renderer, 'needs_system_values', True):
+            return True
+        return self.registry.has_listeners_for(BeforeRender)
+
     def render_view(self, request, response, view, context):
+        if not self.needs_system_values():
+            system = {'request': request, 'context': context}
+            result = self.renderer(response, system)
+            return self._make_response(result, request)
         system = {
             'view': view,
             'renderer_name': self.name,  # b/c
@@ -444,6 +596,13 @@ class RendererHelper(object):
 
     def render(self, value, system_values, request=None):
         renderer = self.renderer
+        if not self.needs_system_values():
+            if system_values is None:
+                system_values = {
+                    'request': request,
+                    'context': getattr(request, 'context', None),
+                }
+            return renderer(value, system_values)
         if system_values is None:
             system_values = {
                 'view': None,
@@ -518,6 +677,9 @@ class NullRendererHelper(RendererHelper):
     def settings(self):
         return {}
 
+    def needs_system_values(self):
+        return False
+
     def render_view(self, request, value, view, context):
         return value
 
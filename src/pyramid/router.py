@@ -1,5 +1,20 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from zope.interface import implementer, providedBy
 
+from pyramid.asgi import (
+    EXECUTOR_KEY,
+    LOOP_KEY,
+    blocking_handler,
+    environ_from_scope,
+    in_request_context,
+    is_async_callable,
+    receive_body,
+    run_in_threadpool,
+    send_response,
+    threaded_handler,
+)
+from pyramid.decorator import reify
 from pyramid.events import (
     BeforeTraversal,
     ContextFound,
@@ -7,6 +22,11 @@ from pyramid.events import (
     NewResponse,
 )
 from pyramid.httpexceptions import HTTPNotFound
+from pyramid.instrumentation import (
+    get_request_timings,
+    get_request_tracer,
+    step_tracer,
+)
 from pyramid.interfaces import (
     IDebugLogger,
     IExecutionPolicy,
@@ -23,7 +43,11 @@ from pyramid.interfaces import (
 from pyramid.request import Request, apply_request_extensions
 from pyramid.threadlocal import RequestContext
 from pyramid.traversal import DefaultRootFactory, ResourceTreeTraverser
-from pyramid.view import _call_view
+from pyramid.view import (
+    _call_view_async,
+    _call_views,
+    _find_views,
+)
 
 
 @implementer(IRouter)
@@ -31,6 +55,9 @@ class Router(object):
 
     debug_notfound = False
     debug_routematch = False
+    asgi_max_threads = 40
+    request_timings = None
+    tracer = None
 
     def __init__(self, registry):
         q = registry.queryUtility
@@ -42,18 +69,118 @@ class Router(object):
         self.execution_policy = q(
             IExecutionPolicy, default=default_execution_policy
         )
+        settings = registry.settings
+        if settings is not None and settings.get('request_timings', False):
+            self.request_timings = get_request_timings(registry)
+        self.tracer = get_request_tracer(registry)
         self.orig_handle_request = self.handle_request
         tweens = q(ITweens)
         if tweens is not None:
-            self.handle_request = tweens(self.handle_request, registry)
+            instrumented = getattr(tweens, 'instrumented', None)
+            if self.request_timings is not None and instrumented is not None:
+                self.handle_request = instrumented(
+                    self.handle_request, registry, self.request_timings
+                )
+            else:
+                self.handle_request = tweens(self.handle_request, registry)
         self.root_policy = self.root_factory  # b/w compat
         self.registry = registry
-        settings = registry.settings
         if settings is not None:
             self.debug_notfound = settings['debug_notfound']
             self.debug_routematch = settings['debug_routematch']
+            self.asgi_max_threads = int(
+                settings.get('asgi_max_threads', self.asgi_max_threads)
+            )
+
+    @reify
+    def async_request_handler(self):
+        """ The :meth:`handle_request_async` coroutine function wrapped in
+        the asynchronous :term:`tween` chain, built on first use."""
+        handler = self.handle_request_async
+        tweens = self.registry.queryUtility(ITweens)
+        if tweens is None:
+            return handler
+        async_handler = getattr(tweens, 'async_handler', None)
+        if async_handler is None:
+            # a custom tweens implementation: run all of it in the pool
+            sync_handler = blocking_handler(self.orig_handle_request)
+            return threaded_handler(tweens(sync_handler, self.registry))
+        return async_handler(handler, self.orig_handle_request, self.registry)
+
+    @reify
+    def executor(self):
+        """ The thread pool used by the :meth:`asgi` entry point to call
+        synchronous code, holding at most ``asgi_max_threads`` threads."""
+        return ThreadPoolExecutor(max_workers=self.asgi_max_threads)
 
     def handle_request(self, request):
+        if self.tracer is not None:
+            return self._handle_request_traced(request)
+
+        context, view_name = self._route_and_traverse(request)
+
+        # find a view callable
+        view_callables = _find_views(
+            request.registry,
+            request.request_iface,
+            providedBy(context),
+            view_name,
+        )
+        response = _call_views(view_callables, context, request)
+
+        if response is None:
+            self._raise_notfound(request)
+
+        return response
+
+    def _handle_request_traced(self, request):
+        # handle_request, reporting each step of the request to the tracer
+        mark = step_tracer(self.tracer, request)
+        context, view_name = self._route_and_traverse(request, mark)
+
+        view_callables = _find_views(
+            request.registry,
+            request.request_iface,
+            providedBy(context),
+            view_name,
+        )
+        mark('view_lookup')
+
+        try:
+            response = _call_views(view_callables, context, request)
+        finally:
+            mark('view_call')
+
+        if response is None:
+            self._raise_notfound(request)
+
+        return response
+
+    async def handle_request_async(self, request):
+        """ The asynchronous analogue of :meth:`handle_request`, used by the
+        :meth:`asgi` entry point.  Routing and traversal, which may call
+        blocking subscribers, root factories and traversers, run in the
+        thread pool.  View callables wrapping an ``async def`` function are
+        then awaited on the event loop; all others are called in the thread
+        pool."""
+        context, view_name = await run_in_threadpool(
+            request, self._route_and_traverse, request
+        )
+
+        context_iface = providedBy(context)
+        response = await _call_view_async(
+            request.registry, request, context, context_iface, view_name
+        )
+
+        if response is None:
+            with RequestContext(request):
+                self._raise_notfound(request)
+
+        return response
+
+    def _route_and_traverse(self, request, mark=None):
+        # ``mark``, when given, is called with the name of each step as it
+        # ends (see pyramid.instrumentation.step_tracer)
         attrs = request.__dict__
         registry = attrs['registry']
 
@@ -64,9 +191,10 @@ class Router(object):
         adapters = registry.adapters
         has_listeners = registry.has_listeners
         notify = registry.notify
-        logger = self.logger
 
         has_listeners and notify(NewRequest(request))
+        mark and mark('new_request')
+
         # find the root object
         root_factory = self.root_factory
         if routes_mapper is not None:
@@ -74,30 +202,13 @@ class Router(object):
             match, route = info['match'], info['route']
             if route is None:
                 if debug_routematch:
-                    msg = 'no route matched for url %s' % request.url
-                    logger and logger.debug(msg)
+                    self._log_routematch(request, match, route)
             else:
                 attrs['matchdict'] = match
                 attrs['matched_route'] = route
 
                 if debug_routematch:
-                    msg = (
-                        'route matched for url %s; '
-                        'route_name: %r, '
-                        'path_info: %r, '
-                        'pattern: %r, '
-                        'matchdict: %r, '
-                        'predicates: %r'
-                        % (
-                            request.url,
-                            route.name,
-                            request.path_info,
-                            route.pattern,
-                            match,
-                            ', '.join([p.text() for p in route.predicates]),
-                        )
-                    )
-                    logger and logger.debug(msg)
+                    self._log_routematch(request, match, route)
 
                 request.request_iface = registry.queryUtility(
                     IRouteRequest, name=route.name, default=IRequest
@@ -105,6 +216,8 @@ class Router(object):
 
                 root_factory = route.factory or self.root_factory
 
+            mark and mark('route_match')
+
         # Notify anyone listening that we are about to start traversal
         #
         # Notify before creating root_factory in case we want to do something
@@ -112,10 +225,12 @@ class Router(object):
         # https://github.com/Pylons/pyramid/pull/1876 for ideas of what is
         # possible.
         has_listeners and notify(BeforeTraversal(request))
+        mark and mark('before_traversal')
 
         # Create the root factory
         root = root_factory(request)
         attrs['root'] = root
+        mark and mark('root_factory')
 
         # We are about to traverse and find a context
         traverser = adapters.queryAdapter(root, ITraverser)
@@ -123,52 +238,64 @@ class Router(object):
             traverser = ResourceTreeTraverser(root)
         tdict = traverser(request)
 
-        context, view_name, subpath, traversed, vroot, vroot_path = (
-            tdict['context'],
-            tdict['view_name'],
-            tdict['subpath'],
-            tdict['traversed'],
-            tdict['virtual_root'],
-            tdict['virtual_root_path'],
-        )
+        context, view_name = tdict['context'], tdict['view_name']
 
         attrs.update(tdict)
+        mark and mark('traversal')
 
         # Notify anyone listening that we have a context and traversal is
         # complete
         has_listeners and notify(ContextFound(request))
+        mark and mark('context_found')
 
-        # find a view callable
-        context_iface = providedBy(context)
-        response = _call_view(
-            registry, request, context, context_iface, view_name
-        )
+        return context, view_name
 
-        if response is None:
-            if self.debug_notfound:
-                msg = (
-                    'debug_notfound of url %s; path_info: %r, '
-                    'context: %r, view_name: %r, subpath: %r, '
-                    'traversed: %r, root: %r, vroot: %r, '
-                    'vroot_path: %r'
-                    % (
-                        request.url,
-                        request.path_info,
-                        context,
-                        view_name,
-                        subpath,
-                        traversed,
-                        root,
-                        vroot,
-                        vroot_path,
-                    )
+    def _log_routematch(self, request, match, route):
+        if route is None:
+            msg = 'no route matched for url %s' % request.url
+        else:
+            msg = (
+                'route matched for url %s; '
+                'route_name: %r, '
+                'path_info: %r, '
+                'pattern: %r, '
+                'matchdict: %r, '
+                'predicates: %r'
+                % (
+                    request.url,
+                    route.name,
+                    request.path_info,
+                    route.pattern,
+                    match,
+                    ', '.join([p.text() for p in route.predicates]),
                 )
-                logger and logger.debug(msg)
-            else:
-                msg = request.path_info
-            raise HTTPNotFound(msg)
-
-        return response
+            )
+        self.logger and self.logger.debug(msg)
+
+    def _raise_notfound(self, request):
+        if self.debug_notfound:
+            attrs = request.__dict__
+            msg = (
+                'debug_notfound of url %s; path_info: %r, '
+                'context: %r, view_name: %r, subpath: %r, '
+                'traversed: %r, root: %r, vroot: %r, '
+                'vroot_path: %r'
+                % (
+                    request.url,
+                    request.path_info,
+                    attrs['context'],
+                    attrs['view_name'],
+                    attrs['subpath'],
+                    attrs['traversed'],
+                    attrs['root'],
+                    attrs['virtual_root'],
+                    attrs['virtual_root_path'],
+                )
+            )
+            self.logger and self.logger.debug(msg)
+        else:
+            msg = request.path_info
+        raise HTTPNotFound(msg)
 
     def invoke_subrequest(self, request, use_tweens=False):
         """Obtain a response object from the Pyramid application based on
@@ -241,6 +368,9 @@ class Router(object):
         else:
             handle_request = self.orig_handle_request
 
+        if self.tracer is not None:
+            return self._invoke_request_traced(request, handle_request)
+
         try:
             response = handle_request(request)
 
@@ -255,6 +385,117 @@ class Router(object):
             if request.finished_callbacks:
                 request._process_finished_callbacks()
 
+    def _invoke_request_traced(self, request, handle_request):
+        # invoke_request, reporting the steps following handle_request to
+        # the tracer
+        registry = self.registry
+        mark = None
+
+        try:
+            response = handle_request(request)
+
+            mark = step_tracer(self.tracer, request)
+            if request.response_callbacks:
+                request._process_response_callbacks(response)
+            mark('response_callbacks')
+
+            registry.has_listeners and registry.notify(
+                NewResponse(request, response)
+            )
+            mark('new_response')
+
+            return response
+
+        finally:
+            if mark is None:
+                mark = step_tracer(self.tracer, request)
+            try:
+                if request.finished_callbacks:
+                    request._process_finished_callbacks()
+            finally:
+                mark('finished_callbacks')
+
+    async def invoke_request_async(self, request, _use_tweens=True):
+        """
+        The asynchronous analogue of :meth:`invoke_request`: execute a
+        request through the asynchronous request processing pipeline and
+        return the generated response.
+
+        """
+        registry = self.registry
+        has_listeners = registry.has_listeners
+        notify = registry.notify
+
+        if _use_tweens:
+            handle_request = self.async_request_handler
+        else:
+            handle_request = self.handle_request_async
+
+        try:
+            response = await handle_request(request)
+
+            callbacks = request.response_callbacks
+            while callbacks:
+                await _call_callback(request, callbacks.popleft(), response)
+
+            if has_listeners:
+                await run_in_threadpool(
+                    request, notify, NewResponse(request, response)
+                )
+
+            return response
+
+        finally:
+            callbacks = request.finished_callbacks
+            while callbacks:
+                await _call_callback(request, callbacks.popleft())
+
+    async def asgi(self, scope, receive, send):
+        """
+        An :term:`ASGI` application serving this router.
+
+        Requests are processed by an asynchronous request processing
+        pipeline: ``async def`` :term:`view callable` objects, tweens whose
+        factory supports it and response or finished callbacks are awaited
+        on the event loop, while synchronous views and callbacks are called in
+        a thread pool of at most ``asgi_max_threads`` threads (see the
+        ``pyramid.asgi_max_threads`` setting).
+
+        The request body is read completely before the request is processed.
+        The :term:`execution policy` is not used.
+        """
+        if scope['type'] == 'lifespan':
+            return await self._asgi_lifespan(receive, send)
+        if scope['type'] != 'http':
+            raise ValueError('Unsupported ASGI scope type %r' % scope['type'])
+        body = await receive_body(receive)
+        if body is None:
+            # the client disconnected
+            return
+        environ = environ_from_scope(scope, body)
+        environ[LOOP_KEY] = asyncio.get_event_loop()
+        environ[EXECUTOR_KEY] = self.executor
+        request = self.request_factory(environ)
+        request.registry = self.registry
+        request.invoke_subrequest = self.invoke_subrequest
+        extensions = self.request_extensions
+        if extensions is not None:
+            apply_request_extensions(request, extensions=extensions)
+        response = await self.invoke_request_async(request)
+        await send_response(response, request.environ, send)
+
+    async def _asgi_lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                executor = self.__dict__.pop('executor', None)
+                if executor is not None:
+                    executor.shutdown(wait=False)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
     def __call__(self, environ, start_response):
         """
         Accept ``environ`` and ``start_response``; create a
@@ -267,6 +508,16 @@ class Router(object):
         return response(environ, start_response)
 
 
+async def _call_callback(request, callback, *args):
+    # async callbacks are awaited, others are called in the thread pool
+    if is_async_callable(callback):
+        with RequestContext(request):
+            result = callback(request, *args)
+        await in_request_context(request, result)
+    else:
+        await run_in_threadpool(request, callback, request, *args)
+
+
 def default_execution_policy(environ, router):
     with router.request_context(environ) as request:
         return router.invoke_request(request)
@@ -2,6 +2,7 @@ import argparse
 import sys
 import textwrap
 
+from pyramid.instrumentation import PHASES
 from pyramid.interfaces import ITweens
 from pyramid.paster import bootstrap, setup_logging
 from pyramid.scripts.common import parse_vars
@@ -21,6 +22,10 @@ class PTweensCommand(object):
     deployment setting is used) or an implicit tweens ordering (will be true
     when the "pyramid.tweens" deployment setting is *not* used).
 
+    When the "pyramid.request_timings" setting is enabled, the latency
+    histograms of the requests handled in this process are summarized next
+    to the tweens which are used.
+
     This command accepts one positional argument named "config_uri" which
     specifies the PasteDeploy config file to use for the interactive
     shell. The format is "inifile#name". If the name is left off, "main"
@@ -66,7 +71,9 @@ class PTweensCommand(object):
         if not self.quiet:
             print(msg)
 
-    def show_chain(self, chain):
+    def show_chain(self, chain, timings=None):
+        if timings is not None:
+            return self.show_timed_chain(chain, timings)
         fmt = '%-10s  %-65s'
         self.out(fmt % ('Position', 'Name'))
         self.out(fmt % ('-' * len('Position'), '-' * len('Name')))
@@ -75,6 +82,59 @@ class PTweensCommand(object):
             self.out(fmt % (pos, name))
         self.out(fmt % ('-', MAIN))
 
+    def show_timed_chain(self, chain, timings):
+        # the time a tween adds is the mean time spent in it, less the
+        # mean time spent in the tweens under it
+        fmt = '%-10s  %-65s  %8s  %9s  %9s  %9s'
+        headers = (
+            'Position',
+            'Name',
+            'Count',
+            'Mean ms',
+            'Self ms',
+            'P99 ms',
+        )
+        self.out(fmt % headers)
+        self.out(fmt % tuple('-' * len(header) for header in headers))
+        self.out((fmt % ('-', INGRESS, '', '', '', '')).rstrip())
+        rows = [(pos, name) for pos, (name, _) in enumerate(chain)]
+        rows.append(('-', MAIN))
+        for index, (pos, name) in enumerate(rows):
+            histogram = timings.tween(name)
+            mean = histogram.mean
+            if index + 1 < len(rows):
+                mean_under = timings.tween(rows[index + 1][1]).mean
+            else:
+                mean_under = 0.0
+            self.out(
+                fmt
+                % (
+                    pos,
+                    name,
+                    histogram.count,
+                    '%.3f' % (mean * 1000),
+                    '%.3f' % ((mean - mean_under) * 1000),
+                    '%.3f' % (histogram.percentile(99) * 1000),
+                )
+            )
+
+    def show_phases(self, timings):
+        fmt = '%-20s  %8s  %9s  %9s'
+        headers = ('Phase', 'Count', 'Mean ms', 'P99 ms')
+        self.out(fmt % headers)
+        self.out(fmt % tuple('-' * len(header) for header in headers))
+        for name in PHASES:
+            histogram = timings.phase(name)
+            self.out(
+                fmt
+                % (
+                    name,
+                    histogram.count,
+                    '%.3f' % (histogram.mean * 1000),
+                    '%.3f' % (histogram.percentile(99) * 1000),
+                )
+            )
+
     def run(self):
         if not self.args.config_uri:
             self.out('Requires a config file argument')
@@ -84,6 +144,7 @@ class PTweensCommand(object):
         self.setup_logging(config_uri, global_conf=config_vars)
         env = self.bootstrap(config_uri, options=config_vars)
         registry = env['registry']
+        timings = getattr(registry, 'request_timings', None)
         tweens = self._get_tweens(registry)
         if tweens is not None:
             explicit = tweens.explicit
@@ -95,7 +156,7 @@ class PTweensCommand(object):
                 self.out('')
                 self.out('Explicit Tween Chain (used)')
                 self.out('')
-                self.show_chain(tweens.explicit)
+                self.show_chain(tweens.explicit, timings)
                 self.out('')
                 self.out('Implicit Tween Chain (not used)')
                 self.out('')
@@ -108,7 +169,12 @@ class PTweensCommand(object):
                 self.out('')
                 self.out('Implicit Tween Chain')
                 self.out('')
-                self.show_chain(tweens.implicit())
+                self.show_chain(tweens.implicit(), timings)
+        if timings is not None:
+            self.out('')
+            self.out('Request Phases')
+            self.out('')
+            self.show_phases(timings)
         return 0
 
 
@@ -240,6 +240,10 @@ class PViewsCommand(object):
             if predicates is not None:
                 predicate_text = ', '.join([p.text() for p in predicates])
                 self.out("%sview predicates (%s)" % (indent, predicate_text))
+            plan = getattr(view_wrapper, '__deriver_plan__', None)
+            if plan:
+                plan_text = ' > '.join([' + '.join(stage) for stage in plan])
+                self.out("%sview derivers (%s)" % (indent, plan_text))
 
     def run(self):
         if not self.args.config_uri or not self.args.url:
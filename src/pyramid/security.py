@@ -271,6 +271,48 @@ class SecurityAPIMixin:
             return Allowed('No security policy in use.')
         return policy.permits(self, context, permission)
 
+    def has_permissions(self, permission, contexts):
+        """ Given a permission and a sequence of contexts, return a list
+        holding, for each context, the result :meth:`.has_permission` would
+        return for ``permission`` and that context.  A context supplied as
+        ``None`` is replaced by the ``request.context`` attribute.
+
+        If the current :term:`security policy` has a ``permits_many`` method,
+        it is called with the request, the list of contexts and the
+        permission, and must return the list of results, which lets the
+        policy share work between the checks.  Otherwise the ``permits``
+        method of the security policy is called for each context.  The
+        :class:`pyramid.security.LegacySecurityPolicy` used with an
+        :term:`authorization policy` computes the
+        :term:`effective principals <principal>` once for all the checks.
+
+        .. code-block:: python
+
+           visible = [
+               item
+               for item, allowed in zip(
+                   items, request.has_permissions('view', items)
+               )
+               if allowed
+           ]
+
+        .. versionadded:: 2.0
+
+        """
+        contexts = [
+            self.context if context is None else context
+            for context in contexts
+        ]
+        policy = _get_security_policy(self)
+        if policy is None:
+            return [Allowed('No security policy in use.') for c in contexts]
+        permits_many = getattr(policy, 'permits_many', None)
+        if permits_many is not None:
+            return permits_many(self, contexts, permission)
+        return [
+            policy.permits(self, context, permission) for context in contexts
+        ]
+
 
 class AuthenticationAPIMixin(object):
     """ Mixin for Request class providing compatibility properties. """
@@ -383,6 +425,18 @@ class LegacySecurityPolicy:
         principals = authn.effective_principals(request)
         return authz.permits(context, principals, permission)
 
+    def permits_many(self, request, contexts, permission):
+        authn = self._get_authn_policy(request)
+        authz = self._get_authz_policy(request)
+        principals = authn.effective_principals(request)
+        permits_many = getattr(authz, 'permits_many', None)
+        if permits_many is not None:
+            return permits_many(contexts, principals, permission)
+        return [
+            authz.permits(context, principals, permission)
+            for context in contexts
+        ]
+
 
 Everyone = 'system.Everyone'
 Authenticated = 'system.Authenticated'
@@ -402,6 +456,9 @@ class AllPermissionsList(object):
     def __eq__(self, other):
         return isinstance(other, self.__class__)
 
+    def __hash__(self):
+        return hash(self.__class__)
+
 
 ALL_PERMISSIONS = AllPermissionsList()
 DENY_ALL = (Deny, Everyone, ALL_PERMISSIONS)
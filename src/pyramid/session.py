@@ -1,14 +1,20 @@
 import binascii
+import dbm
+import json
+import math
 import os
 import pickle
+import re
+import threading
 import time
+import zlib
 from webob.cookies import JSONSerializer, SignedSerializer
 from zope.deprecation import deprecated
 from zope.interface import implementer
 
 from pyramid.csrf import check_csrf_origin, check_csrf_token
-from pyramid.interfaces import ISession
-from pyramid.util import bytes_, text_
+from pyramid.interfaces import ISession, ISessionStore
+from pyramid.util import LRUCache, bytes_, text_
 
 
 def manage_accessed(wrapped):
@@ -88,6 +94,81 @@ deprecated(
 
 JSONSerializer = JSONSerializer  # api
 
+_marker = object()
+
+
+class CompactJSONSerializer(object):
+    """ A serializer producing compact JSON, compressed with :mod:`zlib` if
+    it is longer than ``compress_threshold`` bytes, preceded by a byte
+    identifying the format.  It may be passed as the ``serializer`` of
+    :func:`pyramid.session.SignedCookieSessionFactory` to make session
+    cookies smaller than with the default
+    :class:`pyramid.session.JSONSerializer`.
+
+    Data which does not start with a known format byte is passed to the
+    ``loads`` method of ``fallback``, so that cookies written by another
+    serializer are still read; they are rewritten in the compact format the
+    next time the session changes or is reissued.  The default fallback is a
+    :class:`pyramid.session.JSONSerializer`.  Use a
+    :class:`pyramid.session.PickleSerializer` to migrate sessions stored by
+    previous versions of :app:`Pyramid`.  Set it to ``None`` to reject other
+    formats.
+
+    ``level`` is the zlib compression level.  Compressed data which would
+    expand to more than ``max_size`` bytes is rejected.
+
+    .. versionadded:: 2.0
+    """
+
+    VERSION = 1
+    COMPRESSED = 0x80
+
+    def __init__(
+        self,
+        compress_threshold=256,
+        level=6,
+        max_size=65536,
+        fallback=_marker,
+    ):
+        if fallback is _marker:
+            fallback = JSONSerializer()
+        self.compress_threshold = compress_threshold
+        self.level = level
+        self.max_size = max_size
+        self.fallback = fallback
+
+    def dumps(self, appstruct):
+        """Accept a Python object and return bytes."""
+        data = json.dumps(
+            appstruct, separators=(',', ':'), ensure_ascii=False
+        ).encode('utf-8')
+        header = self.VERSION
+        if len(data) > self.compress_threshold:
+            compressed = zlib.compress(data, self.level)
+            if len(compressed) < len(data):
+                header |= self.COMPRESSED
+                data = compressed
+        return bytes((header,)) + data
+
+    def loads(self, bstruct):
+        """Accept bytes and return a Python object."""
+        header = bstruct[:1]
+        if header == bytes((self.VERSION,)):
+            data = bstruct[1:]
+        elif header == bytes((self.VERSION | self.COMPRESSED,)):
+            decompressor = zlib.decompressobj()
+            try:
+                data = decompressor.decompress(bstruct[1:], self.max_size)
+            except zlib.error:
+                raise ValueError('invalid compressed data')
+            if decompressor.unconsumed_tail:
+                raise ValueError('data too large')
+        elif self.fallback is not None:
+            return self.fallback.loads(bstruct)
+        else:
+            raise ValueError('unknown format')
+        return json.loads(data.decode('utf-8'))
+
 
 def BaseCookieSessionFactory(
     serializer,
@@ -174,6 +255,10 @@ def BaseCookieSessionFactory(
       than the ``reissue_time`` value, as the ticket will never be reissued.
       However, such a configuration is not explicitly prevented.
 
+      A cookie is not sent when its value would be the one sent by the
+      client, i.e. when the session is not due to be reissued and its state
+      is unchanged.
+
       Default: ``0``.
 
     ``set_on_exception``
@@ -185,6 +270,12 @@ def BaseCookieSessionFactory(
     .. versionchanged: 1.10
 
        Added the ``samesite`` option and made the default ``'Lax'``.
+
+    .. versionchanged: 2.0
+
+       A cookie is no longer sent when the session is unchanged and not due
+       to be reissued.  The counts of cookies serialized, issued and skipped
+       are returned by the ``stats`` method of the session factory.
     """
 
     @implementer(ISession)
@@ -208,6 +299,13 @@ def BaseCookieSessionFactory(
         # dirty flag
         _dirty = False
 
+        # the cookie value the session was loaded from
+        _cookieval = None
+
+        # cookie write counters, see ``stats``
+        _stats = {'serialized': 0, 'issued': 0, 'skipped': 0}
+        _stats_lock = threading.Lock()
+
         def __init__(self, request):
             self.request = request
             now = time.time()
@@ -232,6 +330,8 @@ def BaseCookieSessionFactory(
                     created = float(cval)
                     state = sval
                     new = False
+                    self._cookieval = text_(cookieval)
+                    self._cookie_times = (rval, cval)
                 except (TypeError, ValueError):
                     # value failed to unpack properly or renewed was not
                     # a numeric type so we'll fail deserialization here
@@ -242,6 +342,7 @@ def BaseCookieSessionFactory(
                     # expire the session because it was not renewed
                     # before the timeout threshold
                     state = {}
+                    self._cookieval = None
 
             self.created = created
             self.accessed = renewed
@@ -313,7 +414,20 @@ def BaseCookieSessionFactory(
                 token = self.new_csrf_token()
             return token
 
+        @classmethod
+        def stats(cls):
+            """ Return a dictionary counting the session cookie values
+            ``serialized`` (and signed, if the serializer signs them), the
+            cookies ``issued`` and the cookies ``skipped`` because their value
+            was the one sent by the client."""
+            with cls._stats_lock:
+                return dict(cls._stats)
+
         # non-API methods
+        def _count(self, name):
+            with self._stats_lock:
+                self._stats[name] += 1
+
         def _set_cookie(self, response):
             if not self._cookie_on_exception:
                 exception = getattr(self.request, 'exception', None)
@@ -321,9 +435,23 @@ def BaseCookieSessionFactory(
                     exception is not None
                 ):  # dont set a cookie during exceptions
                     return False
+            state = dict(self)
+            if self._cookieval is not None and (
+                self._reissue_time is None
+                or self.accessed - self.renewed <= self._reissue_time
+            ):
+                # with the timestamps exactly as they were loaded, an
+                # unchanged state serializes to the cookie the client sent
+                renewed, created = self._cookie_times
+                cookieval = text_(serializer.dumps((renewed, created, state)))
+                self._count('serialized')
+                if cookieval == self._cookieval:
+                    self._count('skipped')
+                    return False
             cookieval = text_(
-                serializer.dumps((self.accessed, self.created, dict(self)))
+                serializer.dumps((self.accessed, self.created, state))
             )
+            self._count('serialized')
             if len(cookieval) > 4064:
                 raise ValueError(
                     'Cookie value is too long to store (%s bytes)'
@@ -339,6 +467,7 @@ def BaseCookieSessionFactory(
                 httponly=self._cookie_httponly,
                 samesite=self._cookie_samesite,
             )
+            self._count('issued')
             return True
 
     return CookieSession
@@ -439,6 +568,10 @@ def SignedCookieSessionFactory(
       than the ``reissue_time`` value, as the ticket will never be reissued.
       However, such a configuration is not explicitly prevented.
 
+      A cookie is not sent when its value would be the one sent by the
+      client, i.e. when the session is not due to be reissued and its state
+      is unchanged.
+
       Default: ``0``.
 
     ``set_on_exception``
@@ -493,6 +626,549 @@ def SignedCookieSessionFactory(
     )
 
 
+_SESSION_ID = re.compile(r'^[0-9a-f]{64}$')
+
+
+def _new_session_id():
+    return text_(binascii.hexlify(os.urandom(32)))
+
+
+def _loaded(wrapped):
+    # load a server-side session before calling ``wrapped`` and renew it
+    # if it has not been saved for ``reissue_time`` seconds
+    def accessed(session, *arg, **kw):
+        session._load()
+        session.accessed = now = int(time.time())
+        if session._reissue_time is not None and not session._new:
+            if now - session.renewed > session._reissue_time:
+                session._renew = True
+                session._register()
+        return wrapped(session, *arg, **kw)
+
+    accessed.__doc__ = wrapped.__doc__
+    return accessed
+
+
+def ServerSideSessionFactory(
+    store,
+    cookie_name='session',
+    max_age=None,
+    path='/',
+    domain=None,
+    secure=False,
+    httponly=False,
+    samesite='Lax',
+    timeout=1200,
+    reissue_time=0,
+    set_on_exception=True,
+):
+    """
+    Configure a :term:`session factory` which will provide server-side
+    sessions.  The return value of this function is a :term:`session factory`,
+    which may be provided as the ``session_factory`` argument of a
+    :class:`pyramid.config.Configurator` constructor, or used as the
+    ``session_factory`` argument of the
+    :meth:`pyramid.config.Configurator.set_session_factory` method.
+
+    The cookie of the sessions created by this factory only holds a random
+    session identifier; their data is kept in ``store``.  The data is only
+    loaded from the store when the session is first accessed, and only the
+    keys which were set or deleted are written back to it at the end of the
+    request.  Only the session identifier is sent in a cookie, and only when
+    the session is created or renewed, so the size of the session does not
+    affect the size of requests and responses.
+
+    As the store cannot notice changes made to mutable values of the session,
+    :meth:`pyramid.interfaces.ISession.changed` must be called after
+    mutating such a value, in which case every key of the session is saved.
+
+    Parameters:
+
+    ``store``
+      An object implementing :class:`pyramid.interfaces.ISessionStore`, such
+      as a :class:`pyramid.session.MemorySessionStore`,
+      :class:`pyramid.session.DBMSessionStore` or
+      :class:`pyramid.session.RedisSessionStore`.
+
+    ``cookie_name``
+      The name of the cookie used for sessioning. Default: ``'session'``.
+
+    ``max_age``
+      The maximum age of the cookie used for sessioning (in seconds).
+      Default: ``None`` (browser scope).
+
+    ``path``
+      The path used for the session cookie. Default: ``'/'``.
+
+    ``domain``
+      The domain used for the session cookie.  Default: ``None`` (no domain).
+
+    ``secure``
+      The 'secure' flag of the session cookie. Default: ``False``.
+
+    ``httponly``
+      Hide the cookie from Javascript by setting the 'HttpOnly' flag of the
+      session cookie. Default: ``False``.
+
+    ``samesite``
+      The 'samesite' option of the session cookie. Set the value to ``None``
+      to turn off the samesite option.  Default: ``'Lax'``.
+
+    ``timeout``
+      A number of seconds of inactivity before a session times out. If
+      ``None`` then the session never times out.  Default: ``1200``.
+
+    ``reissue_time``
+      The number of seconds that must pass before a session is automatically
+      renewed in the store as the result of a request which accesses it.  If
+      this value is ``0``, the session is renewed by every request accessing
+      it.  If ``None`` then its lifetime is only extended when it changes.
+      The cookie is only sent again when renewing the session if ``max_age``
+      is set.  Default: ``0``.
+
+    ``set_on_exception``
+      If ``True``, save the session and set a session cookie even if an
+      exception occurs while rendering a view. Default: ``True``.
+
+    .. versionadded:: 2.0
+    """
+
+    @implementer(ISession)
+    class ServerSideSession(dict):
+        """ Dictionary-like session object """
+
+        # configuration parameters
+        _store = store
+        _cookie_name = cookie_name
+        _cookie_max_age = max_age if max_age is None else int(max_age)
+        _cookie_path = path
+        _cookie_domain = domain
+        _cookie_secure = secure
+        _cookie_httponly = httponly
+        _cookie_samesite = samesite
+        _cookie_on_exception = set_on_exception
+        _timeout = timeout if timeout is None else int(timeout)
+        _reissue_time = (
+            reissue_time if reissue_time is None else int(reissue_time)
+        )
+
+        # state flags
+        _dirty = False
+        _renew = False
+        _all_changed = False
+        _invalidated = False
+
+        def __init__(self, request):
+            self.request = request
+            self.accessed = self.renewed = self._created = time.time()
+            self._changed = set()
+            self._deleted = set()
+            session_id = request.cookies.get(self._cookie_name)
+            if session_id is not None and _SESSION_ID.match(session_id):
+                self.session_id = session_id
+                self._new = False
+                self._loaded = False
+            else:
+                self.session_id = _new_session_id()
+                self._new = True
+                self._loaded = True
+
+        def _load(self):
+            if self._loaded:
+                return
+            self._loaded = True
+            record = self._store.load(self.session_id)
+            if record is not None:
+                state, created, renewed = record
+                if self._timeout is None or (
+                    time.time() - renewed <= self._timeout
+                ):
+                    dict.update(self, state)
+                    self._created = created
+                    self.accessed = self.renewed = renewed
+                    return
+            # the session timed out or is unknown: do not reuse its id
+            self.session_id = _new_session_id()
+            self._new = True
+
+        @property
+        def created(self):
+            self._load()
+            return self._created
+
+        @property
+        def new(self):
+            self._load()
+            return self._new
+
+        def _register(self):
+            if not self._dirty:
+                self._dirty = True
+
+                def save_callback(request, response):
+                    self._save(response)
+                    self.request = None  # explicitly break cycle for gc
+
+                self.request.add_response_callback(save_callback)
+
+        def _set(self, keys):
+            self.accessed = int(time.time())
+            self._changed.update(keys)
+            self._deleted.difference_update(keys)
+            self._register()
+
+        def _unset(self, keys):
+            self.accessed = int(time.time())
+            self._deleted.update(keys)
+            self._changed.difference_update(keys)
+            self._register()
+
+        # ISession methods
+        def changed(self):
+            self._load()
+            self._all_changed = True
+            self._register()
+
+        def invalidate(self):
+            if not self._new:
+                self._store.delete(self.session_id)
+            dict.clear(self)
+            self.session_id = _new_session_id()
+            self._new = True
+            self._created = time.time()
+            self._changed.clear()
+            self._deleted.clear()
+            self._all_changed = False
+            self._invalidated = True
+            self._register()
+
+        # non-modifying dictionary methods
+        get = _loaded(dict.get)
+        __getitem__ = _loaded(dict.__getitem__)
+        items = _loaded(dict.items)
+        values = _loaded(dict.values)
+        keys = _loaded(dict.keys)
+        copy = _loaded(dict.copy)
+        __contains__ = _loaded(dict.__contains__)
+        __len__ = _loaded(dict.__len__)
+        __iter__ = _loaded(dict.__iter__)
+
+        # modifying dictionary methods
+        @_loaded
+        def __setitem__(self, key, value):
+            dict.__setitem__(self, key, value)
+            self._set((key,))
+
+        @_loaded
+        def __delitem__(self, key):
+            dict.__delitem__(self, key)
+            self._unset((key,))
+
+        @_loaded
+        def setdefault(self, key, default=None):
+            # the value may be mutated by the caller, e.g. by flash()
+            result = dict.setdefault(self, key, default)
+            self._set((key,))
+            return result
+
+        @_loaded
+        def update(self, *arg, **kw):
+            values = dict(*arg, **kw)
+            dict.update(self, values)
+            self._set(values)
+
+        @_loaded
+        def pop(self, key, *default):
+            if not dict.__contains__(self, key):
+                # nothing to delete: do not save the session
+                return dict.pop(self, key, *default)
+            result = dict.pop(self, key)
+            self._unset((key,))
+            return result
+
+        @_loaded
+        def popitem(self):
+            key, value = dict.popitem(self)
+            self._unset((key,))
+            return key, value
+
+        @_loaded
+        def clear(self):
+            self._unset(list(dict.keys(self)))
+            dict.clear(self)
+
+        # flash API methods
+        def flash(self, msg, queue='', allow_duplicate=True):
+            storage = self.setdefault('_f_' + queue, [])
+            if allow_duplicate or (msg not in storage):
+                storage.append(msg)
+
+        def pop_flash(self, queue=''):
+            storage = self.pop('_f_' + queue, [])
+            return storage
+
+        def peek_flash(self, queue=''):
+            storage = self.get('_f_' + queue, [])
+            return storage
+
+        # CSRF API methods
+        def new_csrf_token(self):
+            token = text_(binascii.hexlify(os.urandom(20)))
+            self['_csrft_'] = token
+            return token
+
+        def get_csrf_token(self):
+            token = self.get('_csrft_', None)
+            if token is None:
+                token = self.new_csrf_token()
+            return token
+
+        # non-API methods
+        def _save(self, response):
+            if not self._cookie_on_exception:
+                exception = getattr(self.request, 'exception', None)
+                if exception is not None:
+                    return False
+            if self._new and not dict.__len__(self):
+                # nothing worth storing
+                if self._invalidated:
+                    response.delete_cookie(
+                        self._cookie_name,
+                        path=self._cookie_path,
+                        domain=self._cookie_domain,
+                    )
+                return False
+            if self._all_changed:
+                changed = dict(dict.items(self))
+            else:
+                changed = {
+                    key: dict.__getitem__(self, key)
+                    for key in self._changed
+                    if dict.__contains__(self, key)
+                }
+            self.renewed = time.time()
+            self._store.save(
+                self.session_id,
+                changed,
+                self._deleted,
+                self._created,
+                self.renewed,
+                self._timeout,
+            )
+            if self._new or (self._renew and self._cookie_max_age):
+                response.set_cookie(
+                    self._cookie_name,
+                    value=self.session_id,
+                    max_age=self._cookie_max_age,
+                    path=self._cookie_path,
+                    domain=self._cookie_domain,
+                    secure=self._cookie_secure,
+                    httponly=self._cookie_httponly,
+                    samesite=self._cookie_samesite,
+                )
+            return True
+
+    return ServerSideSession
+
+
+@implementer(ISessionStore)
+class MemorySessionStore(object):
+    """ A :class:`pyramid.interfaces.ISessionStore` which keeps sessions in
+    the memory of the current process, for development, testing or single
+    process deployments.  It holds at most ``maxsize`` sessions; when it is
+    full the least recently used session is discarded.
+
+    Values are stored as serialized by ``serializer`` (by default a
+    :class:`pyramid.session.JSONSerializer`) so that requests never share
+    mutable values.
+
+    .. versionadded:: 2.0
+    """
+
+    def __init__(self, maxsize=10000, serializer=None):
+        if serializer is None:
+            serializer = JSONSerializer()
+        self.serializer = serializer
+        self.sessions = LRUCache(maxsize)
+        self._lock = threading.Lock()
+
+    def load(self, session_id):
+        record = self.sessions.get(session_id)
+        if record is None:
+            return None
+        created, renewed, expires, data = record
+        if expires is not None and expires < time.time():
+            self.sessions.pop(session_id)
+            return None
+        loads = self.serializer.loads
+        state = {key: loads(value) for key, value in data.items()}
+        return state, created, renewed
+
+    def save(self, session_id, changed, deleted, created, renewed, timeout):
+        dumps = self.serializer.dumps
+        changed = {key: dumps(value) for key, value in changed.items()}
+        expires = None if timeout is None else renewed + timeout
+        with self._lock:
+            record = self.sessions.get(session_id)
+            data = {} if record is None else dict(record[3])
+            for key in deleted:
+                data.pop(key, None)
+            data.update(changed)
+            self.sessions.put(session_id, (created, renewed, expires, data))
+
+    def delete(self, session_id):
+        self.sessions.pop(session_id)
+
+
+@implementer(ISessionStore)
+class DBMSessionStore(object):
+    """ A :class:`pyramid.interfaces.ISessionStore` which keeps sessions in
+    the :mod:`dbm` database file named ``filename``, created if needed.
+    Each session is stored as a single record serialized by ``serializer``
+    (by default a :class:`pyramid.session.JSONSerializer`).
+
+    The database is opened on first use and kept open until :meth:`close`
+    is called.  Most :mod:`dbm` implementations do not support concurrent
+    writers, so the file should only be used by one process.  Sessions which
+    timed out are discarded when loaded or by calling :meth:`purge`.
+
+    .. versionadded:: 2.0
+    """
+
+    def __init__(self, filename, serializer=None):
+        if serializer is None:
+            serializer = JSONSerializer()
+        self.filename = filename
+        self.serializer = serializer
+        self._db = None
+        self._lock = threading.Lock()
+
+    def _open(self):
+        if self._db is None:
+            self._db = dbm.open(self.filename, 'c')
+        return self._db
+
+    def _read(self, db, session_id):
+        try:
+            value = db[session_id]
+        except KeyError:
+            return None
+        return self.serializer.loads(value)
+
+    def load(self, session_id):
+        with self._lock:
+            db = self._open()
+            record = self._read(db, session_id)
+            if record is None:
+                return None
+            created, renewed, expires, state = record
+            if expires is not None and expires < time.time():
+                del db[session_id]
+                return None
+        return state, created, renewed
+
+    def save(self, session_id, changed, deleted, created, renewed, timeout):
+        expires = None if timeout is None else renewed + timeout
+        with self._lock:
+            db = self._open()
+            record = self._read(db, session_id)
+            state = {} if record is None else record[3]
+            for key in deleted:
+                state.pop(key, None)
+            state.update(changed)
+            db[session_id] = self.serializer.dumps(
+                [created, renewed, expires, state]
+            )
+
+    def delete(self, session_id):
+        with self._lock:
+            db = self._open()
+            if session_id in db:
+                del db[session_id]
+
+    def purge(self):
+        """ Remove the sessions which have timed out."""
+        now = time.time()
+        with self._lock:
+            db = self._open()
+            for session_id in list(db.keys()):
+                expires = self._read(db, session_id)[2]
+                if expires is not None and expires < now:
+                    del db[session_id]
+
+    def close(self):
+        """ Close the database file."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+@implementer(ISessionStore)
+class RedisSessionStore(object):
+    """ A :class:`pyramid.interfaces.ISessionStore` which keeps each session
+    in a hash of a Redis server, so that only the keys of a session which
+    changed are written.  ``client`` is a client object such as a
+    ``redis.Redis`` instance; only its ``hgetall``, ``delete`` and
+    ``pipeline`` methods are used, along with the ``hset`` (with a
+    ``mapping`` argument), ``hdel``, ``expire``, ``persist`` and ``execute``
+    methods of pipelines, so any other client providing them may be used.
+
+    The name of each hash is the session identifier prefixed by ``prefix``.
+    Values are serialized by ``serializer`` (by default a
+    :class:`pyramid.session.JSONSerializer`).  Redis discards the sessions
+    which timed out by itself.
+
+    .. versionadded:: 2.0
+    """
+
+    def __init__(self, client, prefix='session:', serializer=None):
+        if serializer is None:
+            serializer = JSONSerializer()
+        self.client = client
+        self.prefix = prefix
+        self.serializer = serializer
+
+    def load(self, session_id):
+        fields = self.client.hgetall(self.prefix + session_id)
+        if not fields:
+            return None
+        loads = self.serializer.loads
+        state = {}
+        created = renewed = None
+        for field, value in fields.items():
+            field = text_(field)
+            if field.startswith('k:'):
+                state[field[2:]] = loads(value)
+            elif field == 'created':
+                created = float(value)
+            elif field == 'renewed':
+                renewed = float(value)
+        if created is None or renewed is None:
+            return None
+        return state, created, renewed
+
+    def save(self, session_id, changed, deleted, created, renewed, timeout):
+        name = self.prefix + session_id
+        dumps = self.serializer.dumps
+        mapping = {'k:' + key: dumps(value) for key, value in changed.items()}
+        mapping['created'] = repr(created)
+        mapping['renewed'] = repr(renewed)
+        pipe = self.client.pipeline()
+        deleted = ['k:' + key for key in deleted if key not in changed]
+        if deleted:
+            pipe.hdel(name, *deleted)
+        pipe.hset(name, mapping=mapping)
+        if timeout is None:
+            pipe.persist(name)
+        else:
+            pipe.expire(name, int(math.ceil(timeout)))
+        pipe.execute()
+
+    def delete(self, session_id):
+        self.client.delete(self.prefix + session_id)
+
+
 check_csrf_origin = check_csrf_origin  # api
 deprecated(
     'check_csrf_origin',
@@ -1,16 +1,24 @@
 # -*- coding: utf-8 -*-
 from functools import lru_cache
+import hashlib
 import json
 import mimetypes
 import os
+import threading
 from os.path import exists, getmtime, getsize, isdir, join, normcase, normpath
-from pkg_resources import resource_exists, resource_filename, resource_isdir
+from pkg_resources import (
+    resource_exists,
+    resource_filename,
+    resource_isdir,
+    resource_listdir,
+)
 
 from pyramid.asset import abspath_from_asset_spec, resolve_asset_spec
 from pyramid.httpexceptions import HTTPMovedPermanently, HTTPNotFound
 from pyramid.path import caller_package
-from pyramid.response import FileResponse, _guess_type
+from pyramid.response import FileResponse, Response, _guess_type
 from pyramid.traversal import traversal_path_info
+from pyramid.util import LRUCache
 
 
 class static_view(object):
@@ -61,6 +69,27 @@ class static_view(object):
     ``Accept-Encoding`` value will be added to the response's ``Vary`` header.
     By default, the list is empty and no alternatives will be supported.
 
+    ``memory_cache_size`` is the number of files whose contents are kept in
+    memory, so that serving them again does not touch the disk.  Only files
+    no larger than ``memory_cache_max_file_size`` bytes (64KiB by default)
+    are kept, the least recently served being discarded first.  Responses
+    served from memory have an ``ETag`` computed from the contents of the
+    file.  Larger files are streamed from disk, using the
+    ``wsgi.file_wrapper`` of the server if it has one.  If ``reload`` is
+    ``True`` the modification time of a file kept in memory is checked each
+    time it is served.  By default, this is ``0`` and no files are kept in
+    memory.
+
+    ``prescan`` controls whether every file below ``root_dir`` is found
+    up front, the first time the view is called (or when :meth:`scan` is
+    called), instead of the disk being searched for each requested file and
+    its encoded variants the first time it is requested.  Requests arriving
+    during the scan wait for it to finish.  The size,
+    modification time and a hash of each file are recorded too, the hash
+    being used as the ``ETag`` of responses.  Files added after the scan are
+    not served.  This option is ignored if ``reload`` is ``True``.  By
+    default, this is ``False``.
+
     .. note::
 
        If the ``root_dir`` is relative to a :term:`package`, or is a
@@ -72,7 +101,8 @@ class static_view(object):
 
     .. versionchanged:: 2.0
 
-       Added ``reload`` and ``content_encodings`` options.
+       Added ``reload``, ``content_encodings``, ``memory_cache_size``,
+       ``memory_cache_max_file_size`` and ``prescan`` options.
 
     """
 
@@ -85,6 +115,9 @@ class static_view(object):
         index='index.html',
         reload=False,
         content_encodings=(),
+        memory_cache_size=0,
+        memory_cache_max_file_size=65536,
+        prescan=False,
     ):
         # package_name is for bw compat; it is preferred to pass in a
         # package-relative path as root_dir
@@ -101,6 +134,14 @@ class static_view(object):
         self.reload = reload
         self.content_encodings = _compile_content_encodings(content_encodings)
         self.filemap = {}
+        self.memory_cache = None
+        if memory_cache_size:
+            self.memory_cache = LRUCache(memory_cache_size)
+        self.memory_cache_max_file_size = memory_cache_max_file_size
+        self.prescan = prescan and not reload
+        self.fileinfo = None
+        self._scan_lock = threading.Lock()
+        self.accept_encoding_cache = LRUCache(1000)
 
     def __call__(self, context, request):
         resource_name = self.get_resource_name(request)
@@ -110,13 +151,32 @@ class static_view(object):
             raise HTTPNotFound(request.url)
 
         content_type, _ = _guess_type(resource_name)
-        response = FileResponse(
-            filepath,
-            request,
-            self.cache_max_age,
-            content_type,
-            content_encoding,
-        )
+        body = None
+        if self.memory_cache is not None:
+            body, last_modified, etag = self.get_cached_file(filepath)
+        if body is not None:
+            response = Response(
+                body=body,
+                conditional_response=True,
+                content_type=content_type,
+                content_encoding=content_encoding,
+            )
+            response.last_modified = last_modified
+            response.etag = etag
+            if self.cache_max_age is not None:
+                response.cache_expires = self.cache_max_age
+        else:
+            response = FileResponse(
+                filepath,
+                request,
+                self.cache_max_age,
+                content_type,
+                content_encoding,
+            )
+            if self.fileinfo is not None:
+                info = self.fileinfo.get(filepath)
+                if info is not None:
+                    response.etag = info[2]
         if len(files) > 1:
             _add_vary(response, 'Accept-Encoding')
         return response
@@ -177,6 +237,16 @@ class static_view(object):
         if result is not None:
             return result
 
+        if self.prescan:
+            if self.fileinfo is None:
+                with self._scan_lock:
+                    # another request may have scanned while we waited
+                    if self.fileinfo is None:
+                        self.scan()
+                return self.filemap.get(resource_name, [])
+            # every existing file was found by the scan
+            return []
+
         # XXX we could put a lock around this work but worst case scenario a
         # couple requests scan the disk for files at the same time and then
         # the cache is set going forward so do not bother
@@ -206,6 +276,92 @@ class static_view(object):
             self.filemap[resource_name] = result
         return result
 
+    def scan(self):
+        """
+        Find every file below the ``root_dir`` along with its encoded
+        variants, replacing the cached results of
+        :meth:`get_possible_files`, and record the ``(size, mtime, hash)``
+        of each file in ``fileinfo``.
+
+        """
+        fileinfo = {}
+        filemap = {}
+        for resource_name, path in self._walk():
+            st = os.stat(path)
+            fileinfo[path] = (st.st_size, st.st_mtime, _hash_file(path))
+            filemap.setdefault(resource_name, []).append((path, None))
+            for encoding, extensions in self.content_encodings.items():
+                for ext in extensions:
+                    if resource_name.endswith(ext):
+                        name = resource_name[: -len(ext)]
+                        filemap.setdefault(name, []).append((path, encoding))
+
+        for result in filemap.values():
+            # sort the files by size, smallest first
+            result.sort(key=lambda x: fileinfo[x[0]][0])
+
+        self.filemap = filemap
+        self.fileinfo = fileinfo
+
+    def _walk(self, resource_dir=None, parents=frozenset()):
+        """ Yield ``(resource_name, path)`` for every file below
+        ``resource_dir``, the ``root_dir`` by default.  A directory linked
+        from below itself is not entered again; ``parents`` holds the
+        ``(st_dev, st_ino)`` of the directories being walked."""
+        if self.package_name:
+            if resource_dir is None:
+                resource_dir = self.docroot.rstrip('/')
+            path = resource_filename(self.package_name, resource_dir)
+        else:
+            if resource_dir is None:
+                resource_dir = self.norm_docroot
+            path = resource_dir
+        st = os.stat(path)
+        key = (st.st_dev, st.st_ino)
+        if key in parents:
+            return
+        parents = parents | {key}
+
+        if self.package_name:
+            for name in resource_listdir(self.package_name, resource_dir):
+                resource_name = '%s/%s' % (resource_dir, name)
+                if resource_isdir(self.package_name, resource_name):
+                    yield from self._walk(resource_name, parents)
+                else:
+                    path = resource_filename(self.package_name, resource_name)
+                    yield resource_name, path
+        else:
+            for name in os.listdir(resource_dir):
+                resource_name = normcase(join(resource_dir, name))
+                if isdir(resource_name):
+                    yield from self._walk(resource_name, parents)
+                else:
+                    yield resource_name, resource_name
+
+    def get_cached_file(self, path):
+        """ Return a ``(body, last_modified, etag)`` tuple for the file at
+        ``path`` from the memory cache, reading it into the cache if needed.
+        ``body`` and ``etag`` are ``None`` if the file is too large to be
+        kept in memory."""
+        cache = self.memory_cache
+        entry = cache.get(path)
+        if entry is not None and self.reload:
+            if getmtime(path) != entry[1]:
+                entry = None
+        if entry is None:
+            st = os.stat(path)
+            if st.st_size > self.memory_cache_max_file_size:
+                # remember that it is too large so that the file is not
+                # read again the next time it is served
+                entry = (None, st.st_mtime, None)
+            else:
+                with open(path, 'rb') as f:
+                    body = f.read()
+                etag = hashlib.sha1(body).hexdigest()
+                entry = (body, st.st_mtime, etag)
+            cache.put(path, entry)
+        return entry
+
     def find_best_match(self, request, files):
         """ Return ``(path | None, encoding)``."""
         # if the client did not specify encodings then assume only the
@@ -216,14 +372,20 @@ class static_view(object):
             )
             return identity_path, None
 
-        # find encodings the client will accept
-        acceptable_encodings = {
-            x[0]
-            for x in request.accept_encoding.acceptable_offers(
-                [encoding for path, encoding in files if encoding is not None]
-            )
-        }
-        acceptable_encodings.add(None)
+        # find encodings the client will accept, remembering the result for
+        # the header value as clients send a handful of distinct values
+        offers = tuple(
+            encoding for path, encoding in files if encoding is not None
+        )
+        header = request.headers.get('Accept-Encoding', '')
+        key = (''.join(header.split()).lower(), offers)
+        acceptable_encodings = self.accept_encoding_cache.get(key)
+        if acceptable_encodings is None:
+            acceptable_encodings = {
+                x[0] for x in request.accept_encoding.acceptable_offers(offers)
+            }
+            acceptable_encodings.add(None)
+            self.accept_encoding_cache.put(key, acceptable_encodings)
 
         # return the smallest file from the acceptable encodings
         # we know that files is sorted by size, smallest first
@@ -253,6 +415,14 @@ def _compile_content_encodings(encodings):
     return result
 
 
+def _hash_file(path):
+    sha1 = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(65536), b''):
+            sha1.update(block)
+    return sha1.hexdigest()
+
+
 def _add_vary(response, option):
     vary = response.vary or []
     if not any(x.lower() == option.lower() for x in vary):
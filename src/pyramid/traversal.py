@@ -1,5 +1,6 @@
 from functools import lru_cache
 from urllib.parse import unquote_to_bytes
+import weakref
 from zope.interface import implementer
 from zope.interface.interfaces import IInterface
 
@@ -13,7 +14,7 @@ from pyramid.interfaces import (
 )
 from pyramid.location import lineage
 from pyramid.threadlocal import get_current_registry
-from pyramid.util import ascii_, is_nonstr_iter, text_
+from pyramid.util import FIFOCache, LRUCache, ascii_, is_nonstr_iter
 
 PATH_SEGMENT_SAFE = "~!$&'()*+,;=:@"  # from webob
 PATH_SAFE = PATH_SEGMENT_SAFE + "/"
@@ -533,7 +534,7 @@ def unquote_bytes_to_wsgi(bytestring):
     return unquote_to_bytes(bytestring).decode('latin-1')
 
 
-_segment_cache = {}
+_segment_cache = FIFOCache(10000)
 
 
 def quote_path_segment(segment, safe=PATH_SEGMENT_SAFE):
@@ -552,31 +553,59 @@ def quote_path_segment(segment, safe=PATH_SEGMENT_SAFE):
     .. note::
 
        The return value for each segment passed to this
-       function is cached in a module-scope dictionary for
-       speed: the cached version is returned when possible
-       rather than recomputing the quoted version.  No cache
-       emptying is ever done for the lifetime of an
-       application, however.  If you pass arbitrary
-       user-supplied strings to this function (as opposed to
-       some bounded set of values from a 'working set' known to
-       your application), it may become a memory leak.
+       function is cached in a module-scope cache for speed: the
+       cached version is returned when possible rather than
+       recomputing the quoted version.  The cache holds at most
+       10000 segments by default, forgetting the oldest ones
+       first; this may be changed with
+       :func:`pyramid.traversal.set_quote_path_segment_cache_size`.
+       See also
+       :func:`pyramid.traversal.quote_path_segment_cache_stats`.
+
+    .. versionchanged:: 2.0
+       The cache is bounded.
 
     """
     # The bit of this code that deals with ``_segment_cache`` is an
     # optimization: we cache all the computation of URL path segments
-    # in this module-scope dictionary with the original string as the
-    # key, so we can look it up later without needing to reencode
-    # or re-url-quote it
-    try:
-        if segment.__class__ not in (str, bytes):
+    # keyed on the text of the segment, so we can look it up later
+    # without needing to reencode or re-url-quote it
+    if segment.__class__ is not str:
+        if segment.__class__ is bytes:
+            segment = segment.decode('utf-8')
+        else:
             segment = str(segment)
-        return _segment_cache[(segment, safe)]
-    except KeyError:
-        result = url_quote(text_(segment, 'utf-8'), safe)
-        # we don't need a lock to mutate _segment_cache, as the below
-        # will generate exactly one Python bytecode (STORE_SUBSCR)
-        _segment_cache[(segment, safe)] = result
-        return result
+    key = (segment, safe)
+    result = _segment_cache.get(key)
+    if result is None:
+        result = url_quote(segment, safe)
+        _segment_cache.put(key, result)
+    return result
+
+
+def quote_path_segment_cache_stats():
+    """ Return a dictionary describing the cache used by
+    :func:`pyramid.traversal.quote_path_segment`: the number of ``hits``
+    and ``misses`` of lookups in it, the number of ``evictions`` of the
+    oldest segments, its current ``size`` and its ``maxsize``.
+
+    .. versionadded:: 2.0
+    """
+    return _segment_cache.stats()
+
+
+def set_quote_path_segment_cache_size(maxsize):
+    """ Set the maximum number of segments held by the cache used by
+    :func:`pyramid.traversal.quote_path_segment`, forgetting the oldest
+    segments if it holds more.  ``0`` disables the cache.  The default is
+    ``10000``.
+
+    The cache is shared by every application in the process, so this is
+    best called once, before the applications are created.
+
+    .. versionadded:: 2.0
+    """
+    _segment_cache.resize(int(maxsize))
 
 
 @implementer(ITraverser)
@@ -710,6 +739,81 @@ ModelGraphTraverser = (
 )
 
 
+class CachingResourceTreeTraverser(ResourceTreeTraverser):
+    """ A :class:`ResourceTreeTraverser` which remembers the result of
+    traversing a path when every resource in the :term:`lineage` of the
+    resulting :term:`context` has a true ``__cacheable__`` attribute, and
+    returns it without traversing the resource tree again when the same
+    path is requested.
+
+    Results are cached per :term:`root` object, so the root factory must
+    return the same root object for every request for the cache to be of
+    use.  At most ``cache_size`` results are kept for each root, the least
+    recently used being discarded first.  When the value of the
+    ``__tree_version__`` attribute of the root changes, all the results
+    cached for it are discarded; change it whenever a cacheable part of the
+    tree is modified.
+
+    The cache used for a root is available as the ``cache`` attribute of a
+    traverser of that root.  It is a ``pyramid.util.LRUCache``, which
+    may be used to monitor the hit rate of the cache:
+
+    .. code-block:: python
+
+       stats = CachingResourceTreeTraverser(root).cache.stats()
+
+    Use it with :meth:`pyramid.config.Configurator.add_traverser`.
+
+    .. versionadded:: 2.0
+    """
+
+    cache_size = 1000
+
+    _caches = weakref.WeakKeyDictionary()
+
+    def __init__(self, root):
+        self.root = root
+        version = getattr(root, '__tree_version__', None)
+        try:
+            cached_version, cache = self._caches[root]
+        except KeyError:
+            cache = None
+        except TypeError:
+            # the root cannot be weakly referenced
+            self.cache = None
+            return
+        if cache is None or cached_version != version:
+            cache = LRUCache(self.cache_size)
+            self._caches[root] = (version, cache)
+        self.cache = cache
+
+    def __call__(self, request):
+        cache = self.cache
+        if cache is None:
+            return ResourceTreeTraverser.__call__(self, request)
+        environ = request.environ
+        matchdict = request.matchdict
+        if matchdict is not None:
+            path = (matchdict.get('traverse'), matchdict.get('subpath'))
+        else:
+            path = environ.get('PATH_INFO')
+        key = (path, environ.get(self.VH_ROOT_KEY))
+        try:
+            result = cache.get(key)
+        except TypeError:
+            # an unhashable matchdict value
+            return ResourceTreeTraverser.__call__(self, request)
+        if result is not None:
+            return dict(result)
+        result = ResourceTreeTraverser.__call__(self, request)
+        for resource in lineage(result['context']):
+            if not getattr(resource, '__cacheable__', False):
+                break
+        else:
+            cache.put(key, dict(result))
+        return result
+
+
 @implementer(IResourceURL)
 class ResourceURL(object):
     VH_ROOT_KEY = VH_ROOT_KEY
@@ -1,5 +1,11 @@
+import inspect
 import sys
 
+from pyramid.asgi import (
+    in_request_context,
+    is_async_callable,
+    run_in_threadpool,
+)
 from pyramid.httpexceptions import HTTPNotFound
 from pyramid.util import reraise
 
@@ -19,6 +25,14 @@ def _error_handler(request, exc):
     return response
 
 
+def _async_error_handler(request, exc_info):
+    # sys.exc_info() is empty in the thread pool, so exc_info is passed
+    try:
+        return request.invoke_exception_view(exc_info)
+    except HTTPNotFound:
+        reraise(*exc_info)
+
+
 def excview_tween_factory(handler, registry):
     """ A :term:`tween` factory which produces a tween that catches an
     exception raised by downstream tweens (or the main Pyramid request
@@ -34,7 +48,29 @@ def excview_tween_factory(handler, registry):
        the tween handles an exception and returns a response otherwise they
        are left at their original values.
 
+    .. versionchanged:: 2.0
+       Supports the asynchronous request pipeline. The exception view is
+       looked up and called in the thread pool, and awaited if it is an
+       ``async def`` view.
+
     """
+    if is_async_callable(handler):
+
+        async def async_excview_tween(request):
+            try:
+                response = await handler(request)
+            except Exception as exc:
+                response = await run_in_threadpool(
+                    request,
+                    _async_error_handler,
+                    request,
+                    (exc.__class__, exc, exc.__traceback__),
+                )
+                if inspect.isawaitable(response):
+                    response = await in_request_context(request, response)
+            return response
+
+        return async_excview_tween
 
     def excview_tween(request):
         try:
@@ -46,6 +82,8 @@ def excview_tween_factory(handler, registry):
     return excview_tween
 
 
+excview_tween_factory.supports_async = True
+
 MAIN = 'MAIN'
 INGRESS = 'INGRESS'
 EXCVIEW = 'pyramid.tweens.excview_tween_factory'
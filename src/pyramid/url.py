@@ -242,6 +242,10 @@ class URLMethodsMixin(object):
            empty string) they will not be included in the generated url.
 
         """
+        route = self._get_route(route_name)
+        return self._generate_route_url(route, elements, kw)
+
+    def _get_route(self, route_name):
         try:
             reg = self.registry
         except AttributeError:
@@ -251,7 +255,9 @@ class URLMethodsMixin(object):
 
         if route is None:
             raise KeyError('No such route named %s' % route_name)
+        return route
 
+    def _generate_route_url(self, route, elements, kw):
         if route.pregenerator is not None:
             elements, kw = route.pregenerator(self, elements, kw)
 
@@ -299,6 +305,39 @@ class URLMethodsMixin(object):
         kw['_app_url'] = self.script_name
         return self.route_url(route_name, *elements, **kw)
 
+    def route_paths(self, route_name, kws):
+        """
+        Generates a path for a named :app:`Pyramid` :term:`route
+        configuration` for each dictionary of keyword arguments in the
+        iterable ``kws``, returning a list of paths.
+
+        The result is the same as that of::
+
+            [request.route_path(route_name, **kw) for kw in kws]
+
+        but the route is looked up only once, which makes it cheaper to
+        generate many links to the same route, e.g.:
+
+        .. code-block:: python
+
+            paths = request.route_paths(
+                'item', ({'id': item.id} for item in items)
+            )
+
+        The dictionaries in ``kws`` are not modified.
+
+        .. versionadded:: 2.0
+
+        """
+        route = self._get_route(route_name)
+        script_name = self.script_name
+        paths = []
+        for kw in kws:
+            kw = dict(kw)
+            kw['_app_url'] = script_name
+            paths.append(self._generate_route_url(route, (), kw))
+        return paths
+
     def resource_url(self, resource, *elements, **kw):
         """
         Generate a string representing the absolute URL of the
@@ -23,13 +23,58 @@ class Route(object):
         self.pregenerator = pregenerator
 
 
+class RouteIndex(object):
+    """ An index of routes keyed on the literal prefix of each route
+    pattern.  Given a path, :meth:`candidates` returns, in their original
+    order, only the routes whose literal prefix could possibly match it.
+
+    Routes without any replacement markers are stored in a dictionary keyed
+    on their full pattern, the rest in a tree keyed on each complete segment
+    of their literal prefix.  Routes with no complete literal segment (e.g.
+    ``/{foo}``) are always candidates."""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.exact = {}
+        self.tree = ({}, [])
+        for position, route in enumerate(routes):
+            prefix = getattr(route.match, 'prefix', '')
+            if getattr(route.match, 'exact', False):
+                self.exact.setdefault(prefix, []).append(position)
+                continue
+            node = self.tree
+            for segment in prefix.split('/')[1:-1]:
+                node = node[0].setdefault(segment, ({}, []))
+            node[1].append(position)
+
+    def candidates(self, path):
+        node = self.tree
+        positions = list(node[1])
+        exact = self.exact.get(path)
+        if exact is None and path.endswith('\n'):
+            # ``$`` in the compiled pattern also matches before a trailing
+            # newline
+            exact = self.exact.get(path[:-1])
+        if exact is not None:
+            positions.extend(exact)
+        for segment in path.split('/')[1:]:
+            node = node[0].get(segment)
+            if node is None:
+                break
+            positions.extend(node[1])
+        routes = self.routes
+        return [routes[i] for i in sorted(positions)]
+
+
 @implementer(IRoutesMapper)
 class RoutesMapper(object):
-    def __init__(self):
+    def __init__(self, indexed=False):
         self.routelist = []
         self.static_routes = []
 
         self.routes = {}
+        self.indexed = indexed
+        self._index = None
 
     def has_routes(self):
         return bool(self.routelist)
@@ -64,8 +109,18 @@ class RoutesMapper(object):
             self.static_routes.append(route)
 
         self.routes[name] = route
+        self._index = None
         return route
 
+    def get_index(self):
+        """ Return the :class:`RouteIndex` for the current route list,
+        building it if the route list has changed since it was last
+        built."""
+        index = self._index
+        if index is None or index.routes is not self.routelist:
+            index = self._index = RouteIndex(self.routelist)
+        return index
+
     def generate(self, name, kw):
         return self.routes[name].generate(kw)
 
@@ -80,7 +135,12 @@ class RoutesMapper(object):
                 e.encoding, e.object, e.start, e.end, e.reason
             )
 
-        for route in self.routelist:
+        if self.indexed:
+            routelist = self.get_index().candidates(path)
+        else:
+            routelist = self.routelist
+
+        for route in routelist:
             match = route.match(path)
             if match is not None:
                 preds = route.predicates
@@ -140,16 +200,15 @@ def _compile_route(route):
     # route_re regex pattern is itself Unicode or str)
     pat.reverse()
     rpat = []
-    gen = []
+    # the literal parts of the pattern, url-quoted, between which the values
+    # of the replacement markers named in "names" are placed when generating
+    literals = []
+    names = []
     prefix = pat.pop()  # invar: always at least one element (route='/'+route)
 
     # We want to generate URL-encoded URLs, so we url-quote the prefix, being
-    # careful not to quote any embedded slashes.  We have to replace '%' with
-    # '%%' afterwards, as the strings that go into "gen" are used as string
-    # replacement targets.
-    gen.append(
-        quote_path_segment(prefix, safe='/').replace('%', '%%')
-    )  # native
+    # careful not to quote any embedded slashes.
+    literals.append(quote_path_segment(prefix, safe='/'))  # native
     rpat.append(re.escape(prefix))  # unicode
 
     while pat:
@@ -161,22 +220,24 @@ def _compile_route(route):
             name, reg = name.split(':', 1)
         else:
             reg = '[^/]+'
-        gen.append('%%(%s)s' % name)  # native
+        names.append(name)
         name = '(?P<%s>%s)' % (name, reg)  # unicode
         rpat.append(name)
         s = pat.pop()  # unicode
         if s:
             rpat.append(re.escape(s))  # unicode
-            # We want to generate URL-encoded URLs, so we url-quote this
-            # literal in the pattern, being careful not to quote the embedded
-            # slashes.  We have to replace '%' with '%%' afterwards, as the
-            # strings that go into "gen" are used as string replacement
-            # targets.  What is appended to gen is a native string.
-            gen.append(quote_path_segment(s, safe='/').replace('%', '%%'))
+        # We want to generate URL-encoded URLs, so we url-quote this literal
+        # in the pattern, being careful not to quote the embedded slashes.
+        # What is appended to literals is a native string.
+        literals.append(quote_path_segment(s, safe='/'))
 
     if remainder:
         rpat.append('(?P<%s>.*?)' % remainder)  # unicode
-        gen.append('%%(%s)s' % remainder)  # native
+        names.append(remainder)
+        literals.append('')
+
+    # a pattern without any replacement markers matches only itself
+    exact = len(rpat) == 1
 
     pattern = ''.join(rpat) + '$'  # unicode
 
@@ -194,14 +255,21 @@ def _compile_route(route):
                 d[k] = v
         return d
 
-    gen = ''.join(gen)
+    # every path matched by this route starts with the literal prefix; this
+    # is used by RouteIndex to narrow down the routes tried for a path
+    matcher.prefix = prefix
+    matcher.exact = exact
 
-    def q(v):
-        return quote_path_segment(v, safe=PATH_SAFE)
+    # pairs of (name, literal following it) for generating
+    steps = list(zip(names, literals[1:]))
+    start = literals[0]
 
     def generator(dict):
-        newdict = {}
-        for k, v in dict.items():
+        # only the values named by the pattern are looked up and quoted;
+        # quote_path_segment remembers the quoted form of recent values
+        result = [start]
+        for k, literal in steps:
+            v = dict[k]  # raises KeyError if a value is missing
             if v.__class__ is bytes:
                 # url_quote below needs a native string
                 v = v.decode('utf-8')
@@ -209,20 +277,17 @@ def _compile_route(route):
             if k == remainder:
                 # a stararg argument
                 if is_nonstr_iter(v):
-                    v = '/'.join([q(x) for x in v])  # native
+                    v = '/'.join(
+                        [quote_path_segment(x, PATH_SAFE) for x in v]
+                    )  # native
                 else:
-                    if v.__class__ is not str:
-                        v = str(v)
-                    v = q(v)
+                    v = quote_path_segment(v, PATH_SAFE)
             else:
-                if v.__class__ is not str:
-                    v = str(v)
-                v = q(v)
+                v = quote_path_segment(v, PATH_SAFE)
 
             # at this point, the value will be a native string
-            newdict[k] = v
-
-        result = gen % newdict  # native string result
-        return result
+            result.append(v)
+            result.append(literal)
+        return ''.join(result)
 
     return matcher, generator
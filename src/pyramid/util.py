@@ -1,8 +1,10 @@
+from collections import OrderedDict
 from contextlib import contextmanager
 import functools
 from hmac import compare_digest
 import inspect
 import platform
+import threading
 import weakref
 
 from pyramid.path import DottedNameResolver as _DottedNameResolver
@@ -317,6 +319,163 @@ class WeakOrderedSet(object):
             return self._items[oid]()
 
 
+class LRUCache(object):
+    """ A thread-safe mapping which holds at most ``maxsize`` items.
+
+    When the cache is full, storing a new item evicts the least recently used
+    one.  The number of lookups made via :meth:`get` which found an item and
+    which did not are kept in ``hits`` and ``misses``, the number of evicted
+    items in ``evictions``.
+
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a') == 1
+        cache.put('c', 3)
+        cache.get('b') is None
+        cache.stats() == {
+            'hits': 1, 'misses': 1, 'evictions': 1, 'size': 2, 'maxsize': 2,
+        }
+    """
+
+    def __init__(self, maxsize=1000):
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        """ Remove all items from the cache and reset its counters."""
+        with self._lock:
+            self._data = OrderedDict()
+            self.hits = self.misses = self.evictions = 0
+
+    def get(self, key, default=None):
+        """ Return the item stored at ``key``, marking it as recently used,
+        or ``default`` if there is none."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """ Store ``value`` at ``key``, evicting the least recently used
+        item if the cache is full."""
+        with self._lock:
+            data = self._data
+            data[key] = value
+            data.move_to_end(key)
+            if len(data) > self.maxsize:
+                data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key, default=None):
+        """ Remove the item stored at ``key`` and return it, or return
+        ``default`` if there is none."""
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def stats(self):
+        """ Return a dictionary of the cache counters along with its current
+        and maximum size."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+            }
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+
+class FIFOCache(object):
+    """ A mapping which holds at most ``maxsize`` items, evicting the oldest
+    one when a new item is stored in it while it is full.  A ``maxsize`` of
+    ``0`` stores nothing.
+
+    Unlike :class:`LRUCache`, :meth:`get` takes no lock, so ``hits`` and
+    ``misses`` are approximate.  The other methods are thread-safe.
+    """
+
+    def __init__(self, maxsize=1000):
+        if maxsize < 0:
+            raise ValueError('maxsize must not be negative')
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        """ Remove all items from the cache and reset its counters."""
+        with self._lock:
+            self._data = {}
+            self.hits = self.misses = self.evictions = 0
+
+    def get(self, key, default=None):
+        """ Return the item stored at ``key`` or ``default`` if there is
+        none."""
+        value = self._data.get(key, _marker)
+        if value is _marker:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """ Store ``value`` at ``key``, evicting the oldest item if the cache
+        is full."""
+        with self._lock:
+            data = self._data
+            if key not in data:
+                if not self.maxsize:
+                    return
+                if len(data) >= self.maxsize:
+                    del data[next(iter(data))]
+                    self.evictions += 1
+            data[key] = value
+
+    def resize(self, maxsize):
+        """ Change ``maxsize``, evicting the oldest items if the cache holds
+        more."""
+        if maxsize < 0:
+            raise ValueError('maxsize must not be negative')
+        with self._lock:
+            self.maxsize = maxsize
+            data = self._data
+            while len(data) > maxsize:
+                del data[next(iter(data))]
+                self.evictions += 1
+
+    def stats(self):
+        """ Return a dictionary of the cache counters along with its current
+        and maximum size."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+            }
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+
 def strings_differ(string1, string2):
     """Check whether two strings differ while avoiding timing attacks.
 
@@ -4,6 +4,7 @@ import sys
 import venusian
 from zope.interface import providedBy
 
+from pyramid.asgi import in_request_context, run_in_threadpool
 from pyramid.exceptions import ConfigurationError, PredicateMismatch
 from pyramid.httpexceptions import (
     HTTPNotFound,
@@ -593,6 +594,22 @@ def _find_views(
     cache = registry._view_lookup_cache
     views = cache.get((request_iface, context_iface, view_name))
     if views is None:
+        # misses are kept in a separate, bounded LRU cache so that somebody
+        # hitting the site with many missing URLs can neither grow memory
+        # without bound nor make misses more expensive than hits.  unlike
+        # hits, misses are keyed on the view types and classifier too, as
+        # a miss for one kind of view says nothing about another kind.
+        misses = registry._view_lookup_miss_cache
+        if misses is not None:
+            miss_key = (
+                request_iface,
+                context_iface,
+                view_name,
+                tuple(view_types),
+                view_classifier,
+            )
+            if misses.get(miss_key):
+                return []
         views = []
         for req_type, ctx_type in itertools.product(
             request_iface.__sro__, context_iface.__sro__
@@ -605,14 +622,10 @@ def _find_views(
                 if view_callable is not None:
                     views.append(view_callable)
         if views:
-            # do not cache view lookup misses.  rationale: dont allow cache to
-            # grow without bound if somebody tries to hit the site with many
-            # missing URLs.  we could use an LRU cache instead, but then
-            # purposeful misses by an attacker would just blow out the cache
-            # anyway. downside: misses will almost always consume more CPU than
-            # hits in steady state.
             with registry._lock:
                 cache[(request_iface, context_iface, view_name)] = views
+        elif misses is not None:
+            misses.put(miss_key, True)
 
     return views
 
@@ -638,7 +651,10 @@ def _call_view(
         view_types=view_types,
         view_classifier=view_classifier,
     )
+    return _call_views(view_callables, context, request, secure)
+
 
+def _call_views(view_callables, context, request, secure=True):
     pme = None
     response = None
 
@@ -666,6 +682,57 @@ def _call_view(
     return response
 
 
+async def _call_view_async(
+    registry,
+    request,
+    context,
+    context_iface,
+    view_name,
+    view_types=None,
+    view_classifier=None,
+    secure=True,
+    request_iface=None,
+):
+    # the asynchronous analogue of _call_view: views are called in the
+    # thread pool, so that their permission, CSRF and predicate checks do
+    # not block the event loop, and awaitable results (the coroutines of
+    # async def view callables) are awaited on the event loop
+    if request_iface is None:
+        request_iface = getattr(request, 'request_iface', IRequest)
+    view_callables = _find_views(
+        registry,
+        request_iface,
+        context_iface,
+        view_name,
+        view_types=view_types,
+        view_classifier=view_classifier,
+    )
+
+    pme = None
+    response = None
+
+    for view_callable in view_callables:
+        try:
+            if not secure:
+                view_callable = getattr(
+                    view_callable, '__call_permissive__', view_callable
+                )
+
+            response = await run_in_threadpool(
+                request, view_callable, context, request
+            )
+            if inspect.isawaitable(response):
+                response = await in_request_context(request, response)
+            return response
+        except PredicateMismatch as _pme:
+            pme = _pme
+
+    if pme is not None:
+        raise pme
+
+    return response
+
+
 class ViewMethodsMixin(object):
     """ Request methods mixin for BaseRequest having to do with executing
     views """
@@ -2,9 +2,11 @@ import inspect
 from zope.interface import implementer, provider
 
 from pyramid import renderers
+from pyramid.asgi import then
 from pyramid.csrf import check_csrf_origin, check_csrf_token
 from pyramid.exceptions import ConfigurationError
 from pyramid.httpexceptions import HTTPForbidden
+from pyramid.instrumentation import get_request_tracer, traced
 from pyramid.interfaces import (
     IDebugLogger,
     IDefaultCSRFOptions,
@@ -207,6 +209,93 @@ def preserve_view_attrs(view, wrapper):
     return wrapper
 
 
+class ViewStep(object):
+    """ The work a :term:`view deriver` does around the view it wraps,
+    which can be compiled together with the work of other view derivers
+    into a single view callable.
+
+    ``before`` is called with ``(context, request)`` before the view and
+    may raise an exception.  ``after`` is called with ``(context, request,
+    response)`` after the view and returns the response to use.
+    ``decorate`` is called with the compiled view and sets the attributes
+    the view deriver would have set on its own wrapper."""
+
+    def __init__(self, before=None, after=None, decorate=None):
+        self.before = before
+        self.after = after
+        self.decorate = decorate
+
+
+def compile_view(view, steps):
+    """ Return a view callable which runs the ``steps``, ordered from the
+    outermost to the innermost, around ``view`` in a single call."""
+    befores = tuple(s.before for s in steps if s.before is not None)
+    afters = tuple(s.after for s in reversed(steps) if s.after is not None)
+
+    def finish(context, request, response):
+        for after in afters:
+            response = after(context, request, response)
+        return response
+
+    if afters:
+
+        def compiled_view(context, request):
+            for before in befores:
+                before(context, request)
+            response = view(context, request)
+            if response.__class__ is not Response and inspect.isawaitable(
+                response
+            ):
+                return then(
+                    request, response, lambda r: finish(context, request, r)
+                )
+            return finish(context, request, response)
+
+    else:
+
+        def compiled_view(context, request):
+            for before in befores:
+                before(context, request)
+            return view(context, request)
+
+    compiled_view = preserve_view_attrs(view, compiled_view)
+    for step in reversed(steps):
+        if step.decorate is not None:
+            step.decorate(compiled_view)
+    return compiled_view
+
+
+def compile_view_derivers(view, info, derivers):
+    """ Apply the ``(name, deriver)`` pairs in ``derivers``, ordered from
+    the innermost to the outermost, to ``view``.  The work of consecutive
+    derivers which define a ``step`` is compiled into a single view
+    callable, the other derivers wrap the view as usual.
+
+    Returns the derived view and its plan: a list of the stages a request
+    goes through, from the outermost to the innermost, each stage being a
+    tuple of the names of the derivers which run in the same callable."""
+    base = view
+    steps = []
+    plan = []
+    for name, deriver in derivers:
+        make_step = getattr(deriver, 'step', None)
+        if make_step is None:
+            derived = wraps_view(deriver)(view, info)
+            if derived is not view:
+                base = view = derived
+                steps = []
+                plan.insert(0, (name,))
+            continue
+        step = make_step(view, info)
+        if step is not None:
+            if not steps:
+                plan.insert(0, ())
+            plan[0] = (name,) + plan[0]
+            steps.insert(0, step)
+            view = compile_view(base, steps)
+    return view, plan
+
+
 def mapped_view(view, info):
     mapper = info.options.get('mapper')
     if mapper is None:
@@ -216,21 +305,35 @@ def mapped_view(view, info):
             if mapper is None:
                 mapper = DefaultViewMapper
 
-    mapped_view = mapper(**info.options)(view)
-    return mapped_view
+    return mapper(**info.options)(view)
 
 
 mapped_view.options = ('mapper', 'attr')
 
 
 def owrapped_view(view, info):
-    wrapper_viewname = info.options.get('wrapper')
-    viewname = info.options.get('name')
-    if not wrapper_viewname:
+    wrap_response = _response_wrapper(view, info)
+    if wrap_response is None:
         return view
 
     def _owrapped_view(context, request):
         response = view(context, request)
+        if inspect.isawaitable(response):
+            return then(
+                request, response, lambda r: wrap_response(context, request, r)
+            )
+        return wrap_response(context, request, response)
+
+    return _owrapped_view
+
+
+def _response_wrapper(view, info):
+    wrapper_viewname = info.options.get('wrapper')
+    viewname = info.options.get('name')
+    if not wrapper_viewname:
+        return None
+
+    def wrap_response(context, request, response):
         request.wrapped_response = response
         request.wrapped_body = response.body
         request.wrapped_view = view
@@ -244,20 +347,41 @@ def owrapped_view(view, info):
             )
         return wrapped_response
 
-    return _owrapped_view
+    return wrap_response
+
+
+def _owrapped_step(view, info):
+    wrap_response = _response_wrapper(view, info)
+    if wrap_response is not None:
+        return ViewStep(after=wrap_response)
 
 
 owrapped_view.options = ('name', 'wrapper')
+owrapped_view.step = _owrapped_step
 
 
 def http_cached_view(view, info):
-    if info.settings.get('prevent_http_cache', False):
+    cache_response = _response_cacher(info)
+    if cache_response is None:
         return view
 
+    def wrapper(context, request):
+        response = view(context, request)
+        if inspect.isawaitable(response):
+            return then(request, response, cache_response)
+        return cache_response(response)
+
+    return wrapper
+
+
+def _response_cacher(info):
+    if info.settings.get('prevent_http_cache', False):
+        return None
+
     seconds = info.options.get('http_cache')
 
     if seconds is None:
-        return view
+        return None
 
     options = {}
 
@@ -270,8 +394,7 @@ def http_cached_view(view, info):
                 'in the form (seconds, options); not %s' % (seconds,)
             )
 
-    def wrapper(context, request):
-        response = view(context, request)
+    def cache_response(response):
         prevent_caching = getattr(
             response.cache_control, 'prevent_auto', False
         )
@@ -279,10 +402,22 @@ def http_cached_view(view, info):
             response.cache_expires(seconds, **options)
         return response
 
-    return wrapper
+    return cache_response
+
+
+def _http_cached_step(view, info):
+    cache_response = _response_cacher(info)
+    if cache_response is None:
+        return None
+
+    def after(context, request, response):
+        return cache_response(response)
+
+    return ViewStep(after=after)
 
 
 http_cached_view.options = ('http_cache',)
+http_cached_view.step = _http_cached_step
 
 
 def secured_view(view, info):
@@ -291,10 +426,43 @@ def secured_view(view, info):
     return view
 
 
+def _secured_step(view, info):
+    authdebug = _authdebug(info)
+    security = _security(info)
+    if security is None:
+        if authdebug is not None:
+            return ViewStep(before=authdebug)
+        return None
+    policy, permission = security
+
+    def permitted(context, request):
+        return policy.permits(request, context, permission)
+
+    def check_permission(context, request):
+        result = policy.permits(request, context, permission)
+        if not result:
+            _raise_forbidden(view, request, result)
+
+    def debug_permission(context, request):
+        authdebug(context, request)
+        check_permission(context, request)
+
+    def decorate(wrapper):
+        wrapper.__call_permissive__ = view
+        wrapper.__permitted__ = permitted
+        wrapper.__permission__ = permission
+
+    if authdebug is not None:
+        return ViewStep(before=debug_permission, decorate=decorate)
+    return ViewStep(before=check_permission, decorate=decorate)
+
+
 secured_view.options = ('permission',)
+secured_view.step = _secured_step
 
 
-def _secured_view(view, info):
+def _security(info):
+    # the security policy and the permission which secure the view, if any
     permission = explicit_val = info.options.get('permission')
     if permission is None:
         permission = info.registry.queryUtility(IDefaultPermission)
@@ -308,35 +476,57 @@ def _secured_view(view, info):
 
     # no-op on exception-only views without an explicit permission
     if explicit_val is None and info.exception_only:
-        return view
+        return None
 
     if policy and (permission is not None):
+        return policy, permission
+    return None
 
-        def permitted(context, request):
-            return policy.permits(request, context, permission)
-
-        def secured_view(context, request):
-            result = permitted(context, request)
-            if result:
-                return view(context, request)
-            view_name = getattr(view, '__name__', view)
-            msg = getattr(
-                request,
-                'authdebug_message',
-                'Unauthorized: %s failed permission check' % view_name,
-            )
-            raise HTTPForbidden(msg, result=result)
 
-        secured_view.__call_permissive__ = view
-        secured_view.__permitted__ = permitted
-        secured_view.__permission__ = permission
-        return secured_view
-    else:
+def _raise_forbidden(view, request, result):
+    view_name = getattr(view, '__name__', view)
+    msg = getattr(
+        request,
+        'authdebug_message',
+        'Unauthorized: %s failed permission check' % view_name,
+    )
+    raise HTTPForbidden(msg, result=result)
+
+
+def _secured_view(view, info):
+    security = _security(info)
+    if security is None:
         return view
+    policy, permission = security
+
+    def permitted(context, request):
+        return policy.permits(request, context, permission)
+
+    def secured_view(context, request):
+        result = permitted(context, request)
+        if result:
+            return view(context, request)
+        _raise_forbidden(view, request, result)
+
+    secured_view.__call_permissive__ = view
+    secured_view.__permitted__ = permitted
+    secured_view.__permission__ = permission
+    return secured_view
 
 
 def _authdebug_view(view, info):
-    wrapped_view = view
+    authdebug = _authdebug(info)
+    if authdebug is None:
+        return view
+
+    def authdebug_view(context, request):
+        authdebug(context, request)
+        return view(context, request)
+
+    return authdebug_view
+
+
+def _authdebug(info):
     settings = info.settings
     permission = explicit_val = info.options.get('permission')
     if permission is None:
@@ -346,11 +536,11 @@ def _authdebug_view(view, info):
 
     # no-op on exception-only views without an explicit permission
     if explicit_val is None and info.exception_only:
-        return view
+        return None
 
     if settings and settings.get('debug_authorization', False):
 
-        def authdebug_view(context, request):
+        def authdebug(context, request):
             view_name = getattr(request, 'view_name', None)
 
             if policy:
@@ -374,25 +564,40 @@ def _authdebug_view(view, info):
                 logger.debug(msg)
             if request is not None:
                 request.authdebug_message = msg
-            return view(context, request)
 
-        wrapped_view = authdebug_view
-
-    return wrapped_view
+        return authdebug
+    return None
 
 
 def rendered_view(view, info):
     # one way or another this wrapper must produce a Response (unless
     # the renderer is a NullRendererHelper)
+    render_result = _result_renderer(view, info)
+    if render_result is None:
+        return view
+
+    def rendered_view(context, request):
+        result = view(context, request)
+        if result.__class__ is Response:  # potential common case
+            return result
+        if inspect.isawaitable(result):
+            return then(
+                request, result, lambda r: render_result(context, request, r)
+            )
+        return render_result(context, request, result)
+
+    return rendered_view
+
+
+def _result_renderer(view, info):
     renderer = info.options.get('renderer')
     if renderer is None:
         # register a default renderer if you want super-dynamic
         # rendering.  registering a default renderer will also allow
         # override_renderer to work if a renderer is left unspecified for
         # a view registration.
-        def viewresult_to_response(context, request):
-            result = view(context, request)
-            if result.__class__ is Response:  # common case
+        def result_to_response(context, request, result):
+            if result.__class__ is Response:
                 response = result
             else:
                 response = info.registry.queryAdapterOrSelf(result, IResponse)
@@ -420,14 +625,17 @@ def rendered_view(view, info):
 
             return response
 
-        return viewresult_to_response
+        return result_to_response
 
     if renderer is renderers.null_renderer:
-        return view
+        return None
 
-    def rendered_view(context, request):
-        result = view(context, request)
-        if result.__class__ is Response:  # potential common case
+    # render plan: what can be decided once rather than for every request
+    default_view_inst = getattr(view, '__original_view__', view)
+    needs_system_values = getattr(renderer, 'needs_system_values', None)
+
+    def render_result(context, request, result):
+        if result.__class__ is Response:
             response = result
         else:
             # this must adapt, it can't do a simple interface check
@@ -443,21 +651,35 @@ def rendered_view(view, info):
                         package=info.package,
                         registry=info.registry,
                     )
-                else:
+                elif needs_system_values is None or needs_system_values():
                     view_renderer = renderer.clone()
+                else:
+                    # a renderer which only needs the request and context
+                    # can be shared by every request
+                    view_renderer = renderer
                 if '__view__' in attrs:
                     view_inst = attrs.pop('__view__')
                 else:
-                    view_inst = getattr(view, '__original_view__', view)
+                    view_inst = default_view_inst
                 response = view_renderer.render_view(
                     request, result, view_inst, context
                 )
         return response
 
-    return rendered_view
+    tracer = get_request_tracer(info.registry)
+    if tracer is not None:
+        return traced(tracer, 'render', render_result)
+    return render_result
+
+
+def _rendered_step(view, info):
+    render_result = _result_renderer(view, info)
+    if render_result is not None:
+        return ViewStep(after=render_result)
 
 
 rendered_view.options = ('renderer',)
+rendered_view.step = _rendered_step
 
 
 def decorated_view(view, info):
@@ -471,6 +693,18 @@ decorated_view.options = ('decorator',)
 
 
 def csrf_view(view, info):
+    check_csrf = _csrf_checker(info)
+    if check_csrf is None:
+        return view
+
+    def csrf_view(context, request):
+        check_csrf(context, request)
+        return view(context, request)
+
+    return csrf_view
+
+
+def _csrf_checker(info):
     explicit_val = info.options.get('require_csrf')
     defaults = info.registry.queryUtility(IDefaultCSRFOptions)
     if defaults is None:
@@ -499,10 +733,9 @@ def csrf_view(view, info):
     )
     # disable if both header and token are disabled
     enabled = enabled and (token or header)
-    wrapped_view = view
     if enabled:
 
-        def csrf_view(context, request):
+        def check_csrf(context, request):
             if request.method not in safe_methods and (
                 callback is None or callback(request)
             ):
@@ -511,13 +744,19 @@ def csrf_view(view, info):
                         request, raises=True, allow_no_origin=allow_no_origin
                     )
                 check_csrf_token(request, token, header, raises=True)
-            return view(context, request)
 
-        wrapped_view = csrf_view
-    return wrapped_view
+        return check_csrf
+    return None
+
+
+def _csrf_step(view, info):
+    check_csrf = _csrf_checker(info)
+    if check_csrf is not None:
+        return ViewStep(before=check_csrf)
 
 
 csrf_view.options = ('require_csrf',)
+csrf_view.step = _csrf_step
 
 VIEW = 'VIEW'
 INGRESS = 'INGRESS'
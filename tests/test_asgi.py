@@ -0,0 +1,394 @@
+import asyncio
+import unittest
+
+from pyramid import testing
+
+
+def run(awaitable):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(awaitable)
+    finally:
+        loop.close()
+
+
+class Test_environ_from_scope(unittest.TestCase):
+    def _callFUT(self, scope, body=b''):
+        from pyramid.asgi import environ_from_scope
+
+        return environ_from_scope(scope, body)
+
+    def _makeScope(self, **kw):
+        scope = {
+            'type': 'http',
+            'method': 'POST',
+            'path': '/foo',
+            'query_string': b'a=1',
+            'headers': [],
+        }
+        scope.update(kw)
+        return scope
+
+    def test_it(self):
+        scope = self._makeScope(
+            server=('example.com', 8080),
+            client=('10.0.0.1', 1234),
+            scheme='https',
+            http_version='2',
+        )
+        environ = self._callFUT(scope, b'body')
+        self.assertEqual(environ['REQUEST_METHOD'], 'POST')
+        self.assertEqual(environ['SCRIPT_NAME'], '')
+        self.assertEqual(environ['PATH_INFO'], '/foo')
+        self.assertEqual(environ['QUERY_STRING'], 'a=1')
+        self.assertEqual(environ['SERVER_NAME'], 'example.com')
+        self.assertEqual(environ['SERVER_PORT'], '8080')
+        self.assertEqual(environ['SERVER_PROTOCOL'], 'HTTP/2')
+        self.assertEqual(environ['REMOTE_ADDR'], '10.0.0.1')
+        self.assertEqual(environ['wsgi.url_scheme'], 'https')
+        self.assertEqual(environ['wsgi.input'].read(), b'body')
+        self.assertEqual(environ['CONTENT_LENGTH'], '4')
+        self.assertTrue(environ['asgi.scope'] is scope)
+
+    def test_defaults(self):
+        environ = self._callFUT({'type': 'http', 'method': 'GET'})
+        self.assertEqual(environ['PATH_INFO'], '/')
+        self.assertEqual(environ['QUERY_STRING'], '')
+        self.assertEqual(environ['SERVER_NAME'], 'localhost')
+        self.assertEqual(environ['SERVER_PORT'], '80')
+        self.assertEqual(environ['wsgi.url_scheme'], 'http')
+        self.assertFalse('REMOTE_ADDR' in environ)
+
+    def test_root_path(self):
+        scope = self._makeScope(root_path='/app', path='/app/foo')
+        environ = self._callFUT(scope)
+        self.assertEqual(environ['SCRIPT_NAME'], '/app')
+        self.assertEqual(environ['PATH_INFO'], '/foo')
+
+    def test_non_ascii_path(self):
+        scope = self._makeScope(path='/La Pe\xf1a')
+        environ = self._callFUT(scope)
+        self.assertEqual(
+            environ['PATH_INFO'],
+            '/La Pe\xf1a'.encode('utf-8').decode('latin-1'),
+        )
+
+    def test_headers(self):
+        scope = self._makeScope(
+            headers=[
+                (b'content-type', b'text/plain'),
+                (b'content-length', b'4'),
+                (b'x-forwarded-for', b'a'),
+                (b'x-forwarded-for', b'b'),
+            ]
+        )
+        environ = self._callFUT(scope)
+        self.assertEqual(environ['CONTENT_TYPE'], 'text/plain')
+        self.assertEqual(environ['CONTENT_LENGTH'], '4')
+        self.assertEqual(environ['HTTP_X_FORWARDED_FOR'], 'a,b')
+
+
+class Test_receive_body(unittest.TestCase):
+    def _callFUT(self, messages):
+        from pyramid.asgi import receive_body
+
+        messages = list(messages)
+
+        async def receive():
+            return messages.pop(0)
+
+        return run(receive_body(receive))
+
+    def test_it(self):
+        result = self._callFUT(
+            [
+                {'type': 'http.request', 'body': b'a', 'more_body': True},
+                {'type': 'http.request', 'body': b'b'},
+            ]
+        )
+        self.assertEqual(result, b'ab')
+
+    def test_disconnect(self):
+        result = self._callFUT(
+            [
+                {'type': 'http.request', 'body': b'a', 'more_body': True},
+                {'type': 'http.disconnect'},
+            ]
+        )
+        self.assertEqual(result, None)
+
+
+class Test_send_response(unittest.TestCase):
+    def _callFUT(self, response, environ=None):
+        from pyramid.asgi import send_response
+
+        if environ is None:
+            environ = {'REQUEST_METHOD': 'GET'}
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        run(send_response(response, environ, send))
+        return sent
+
+    def test_list_body(self):
+        from pyramid.response import Response
+
+        response = Response(app_iter=[b'a', b'', b'b'])
+        sent = self._callFUT(response)
+        self.assertEqual(sent[0]['type'], 'http.response.start')
+        self.assertEqual(sent[0]['status'], 200)
+        self.assertTrue(
+            (b'content-type', b'text/html; charset=UTF-8')
+            in sent[0]['headers']
+        )
+        self.assertEqual(
+            sent[1:],
+            [
+                {
+                    'type': 'http.response.body',
+                    'body': b'a',
+                    'more_body': True,
+                },
+                {
+                    'type': 'http.response.body',
+                    'body': b'b',
+                    'more_body': True,
+                },
+                {'type': 'http.response.body', 'body': b''},
+            ],
+        )
+
+    def test_iterator_body_is_closed(self):
+        from pyramid.response import Response
+
+        app_iter = DummyAppIter([b'a', b'b'])
+        response = Response(app_iter=app_iter)
+        sent = self._callFUT(response)
+        self.assertEqual(b''.join(m['body'] for m in sent[1:]), b'ab')
+        self.assertTrue(app_iter.closed)
+
+    def test_head(self):
+        from pyramid.response import Response
+
+        response = Response(body=b'abc')
+        sent = self._callFUT(response, {'REQUEST_METHOD': 'HEAD'})
+        self.assertTrue((b'content-length', b'3') in sent[0]['headers'])
+        self.assertEqual(b''.join(m['body'] for m in sent[1:]), b'')
+
+
+class Test_run_in_threadpool(unittest.TestCase):
+    def test_it(self):
+        import threading
+        from pyramid.asgi import run_in_threadpool
+        from pyramid.threadlocal import get_current_request
+
+        request = testing.DummyRequest()
+        request.registry = None
+
+        def fn(a, b):
+            return (
+                a + b,
+                get_current_request(),
+                threading.current_thread() is threading.main_thread(),
+            )
+
+        result = run(run_in_threadpool(request, fn, 1, 2))
+        self.assertEqual(result, (3, request, False))
+
+
+class Test_in_request_context(unittest.TestCase):
+    def _callFUT(self, request, awaitable):
+        from pyramid.asgi import in_request_context
+
+        return in_request_context(request, awaitable)
+
+    def _makeRequest(self):
+        request = testing.DummyRequest()
+        request.registry = None
+        return request
+
+    def test_set_after_await(self):
+        from pyramid.threadlocal import get_current_request
+
+        request = self._makeRequest()
+
+        async def view():
+            before = get_current_request()
+            await asyncio.sleep(0)
+            return before, get_current_request()
+
+        result = run(self._callFUT(request, view()))
+        self.assertEqual(result, (request, request))
+        self.assertEqual(get_current_request(), None)
+
+    def test_unset_while_suspended(self):
+        from pyramid.threadlocal import get_current_request
+
+        requests = [self._makeRequest(), self._makeRequest()]
+        seen = []
+
+        async def view(request):
+            for i in range(3):
+                seen.append(get_current_request() is request)
+                await asyncio.sleep(0)
+
+        async def both():
+            await asyncio.gather(
+                *[self._callFUT(r, view(r)) for r in requests]
+            )
+            return get_current_request()
+
+        self.assertEqual(run(both()), None)
+        self.assertEqual(seen, [True] * 6)
+
+    def test_exception_thrown_in(self):
+        from pyramid.threadlocal import get_current_request
+
+        request = self._makeRequest()
+
+        async def view():
+            future = asyncio.get_event_loop().create_future()
+            future.get_loop().call_soon(future.set_exception, ValueError())
+            try:
+                await future
+            except ValueError:
+                return get_current_request()
+
+        self.assertEqual(run(self._callFUT(request, view())), request)
+
+    def test_exception_raised(self):
+        request = self._makeRequest()
+
+        async def view():
+            await asyncio.sleep(0)
+            raise ValueError
+
+        self.assertRaises(ValueError, run, self._callFUT(request, view()))
+
+    def test_close(self):
+        from pyramid.threadlocal import get_current_request
+
+        request = self._makeRequest()
+        closed = []
+
+        async def view():
+            try:
+                await asyncio.sleep(0)
+            finally:
+                closed.append(get_current_request())
+
+        awaiting = self._callFUT(request, view())
+        awaiting.send(None)
+        awaiting.close()
+        self.assertEqual(closed, [request])
+        self.assertEqual(get_current_request(), None)
+
+
+class Test_then(unittest.TestCase):
+    def test_it(self):
+        from pyramid.asgi import then
+        from pyramid.threadlocal import get_current_request
+
+        request = testing.DummyRequest()
+        request.registry = None
+
+        async def value():
+            return 1
+
+        def callback(result):
+            return (result + 1, get_current_request())
+
+        self.assertEqual(run(then(request, value(), callback)), (2, request))
+
+    def test_callback_returns_awaitable(self):
+        from pyramid.asgi import then
+
+        request = testing.DummyRequest()
+        request.registry = None
+
+        async def value(result=1):
+            return result
+
+        result = run(then(request, value(), lambda r: value(r + 1)))
+        self.assertEqual(result, 2)
+
+
+class Test_is_async_callable(unittest.TestCase):
+    def _callFUT(self, ob):
+        from pyramid.asgi import is_async_callable
+
+        return is_async_callable(ob)
+
+    def test_coroutine_function(self):
+        async def fn():
+            pass  # pragma: no cover
+
+        self.assertTrue(self._callFUT(fn))
+
+    def test_async_call(self):
+        class Foo(object):
+            async def __call__(self):
+                pass  # pragma: no cover
+
+        self.assertTrue(self._callFUT(Foo()))
+
+    def test_sync(self):
+        self.assertFalse(self._callFUT(lambda: None))
+        self.assertFalse(self._callFUT(object()))
+
+
+class Test_blocking_and_threaded_handler(unittest.TestCase):
+    def test_it(self):
+        import threading
+        from pyramid.asgi import LOOP_KEY, blocking_handler, threaded_handler
+
+        request = testing.DummyRequest()
+        request.registry = None
+        threads = []
+
+        async def response():
+            threads.append(threading.current_thread())
+            return 'response'
+
+        def handler(request):
+            threads.append(threading.current_thread())
+            return response()
+
+        async def main():
+            request.environ[LOOP_KEY] = asyncio.get_event_loop()
+            threaded = threaded_handler(blocking_handler(handler))
+            return await threaded(request)
+
+        self.assertEqual(run(main()), 'response')
+        self.assertFalse(threads[0] is threading.main_thread())
+        self.assertTrue(threads[1] is threading.main_thread())
+
+    def test_threaded_awaits_result(self):
+        from pyramid.asgi import threaded_handler
+
+        request = testing.DummyRequest()
+        request.registry = None
+
+        async def response():
+            return 'response'
+
+        threaded = threaded_handler(lambda request: response())
+        self.assertEqual(run(threaded(request)), 'response')
+
+
+class DummyAppIter(object):
+    closed = False
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self.chunks)
+
+    def close(self):
+        self.closed = True
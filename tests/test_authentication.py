@@ -1019,6 +1019,92 @@ class TestAuthTktCookieHelper(unittest.TestCase):
         self.assertEqual(response.headerlist[0][0], 'Set-Cookie')
         self.assertTrue("/tokens=/" in response.headerlist[0][1])
 
+    def test_identify_cached(self):
+        helper = self._makeOne('secret', include_ip=True)
+        helper.auth_tkt.user_data = 'userid_type:int'
+        helper.auth_tkt.userid = '1'
+        helper.auth_tkt.tokens = ['a']
+        result = helper.identify(self._makeRequest('ticket'))
+        helper.auth_tkt.parse_raise = True
+        request = self._makeRequest('ticket')
+        cached = helper.identify(request)
+        self.assertEqual(cached, result)
+        self.assertEqual(cached['userid'], 1)
+        self.assertEqual(cached['tokens'], ['a'])
+        self.assertEqual(request.environ['REMOTE_USER_TOKENS'], ['a'])
+        self.assertEqual(
+            request.environ['REMOTE_USER_DATA'], 'userid_type:int'
+        )
+        stats = helper.cache_stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['hit_ratio'], 0.5)
+
+    def test_identify_cached_per_cookie_and_address(self):
+        helper = self._makeOne('secret', include_ip=True)
+        helper.identify(self._makeRequest('ticket'))
+        helper.auth_tkt.parse_raise = True
+        self.assertEqual(helper.identify(self._makeRequest('other')), None)
+        request = self._makeRequest('ticket', ipv6=True)
+        self.assertEqual(helper.identify(request), None)
+
+    def test_identify_bad_cookie_not_cached(self):
+        helper = self._makeOne('secret')
+        helper.auth_tkt.parse_raise = True
+        self.assertEqual(helper.identify(self._makeRequest('ticket')), None)
+        helper.auth_tkt.parse_raise = False
+        self.assertTrue(helper.identify(self._makeRequest('ticket')))
+        self.assertEqual(helper.cache_stats()['size'], 1)
+
+    def test_identify_cached_timeout_aged(self):
+        import time
+
+        helper = self._makeOne('secret', timeout=10)
+        now = time.time()
+        helper.auth_tkt.timestamp = now - 1
+        helper.now = now
+        self.assertTrue(helper.identify(self._makeRequest('ticket')))
+        helper.now = now + 10
+        self.assertEqual(helper.identify(self._makeRequest('ticket')), None)
+        self.assertEqual(helper.cache_stats()['size'], 0)
+
+    def test_identify_cached_reissue(self):
+        import time
+
+        helper = self._makeOne('secret', timeout=20, reissue_time=10)
+        now = time.time()
+        helper.auth_tkt.timestamp = now
+        helper.now = now + 1
+        request = self._makeRequest('ticket')
+        self.assertTrue(helper.identify(request))
+        self.assertEqual(len(request.callbacks), 0)
+        helper.now = now + 11
+        request = self._makeRequest('ticket')
+        self.assertTrue(helper.identify(request))
+        self.assertEqual(len(request.callbacks), 1)
+        self.assertEqual(helper.cache_stats()['hits'], 1)
+
+    def test_cache_disabled(self):
+        helper = self._makeOne('secret', cache_size=0)
+        self.assertEqual(helper.cache_stats(), None)
+        helper.identify(self._makeRequest('ticket'))
+        helper.auth_tkt.parse_raise = True
+        self.assertEqual(helper.identify(self._makeRequest('ticket')), None)
+
+    def test_cache_stats_empty(self):
+        helper = self._makeOne('secret')
+        self.assertEqual(
+            helper.cache_stats(),
+            {
+                'hits': 0,
+                'misses': 0,
+                'evictions': 0,
+                'size': 0,
+                'maxsize': 1000,
+                'hit_ratio': 0.0,
+            },
+        )
+
     def test_remember(self):
         helper = self._makeOne('secret')
         request = self._makeRequest()
@@ -30,11 +30,53 @@ class TestACLAuthorizationPolicy(unittest.TestCase):
 
         verifyObject(IAuthorizationPolicy, self._makeOne())
 
+    def test_permits_many(self):
+        from pyramid.authorization import Allow
+
+        root = DummyContext()
+        root.__acl__ = [(Allow, 'fred', 'view')]
+        child = DummyContext(__parent__=root)
+        policy = self._makeOne()
+        result = policy.permits_many([root, child], ['fred'], 'view')
+        self.assertEqual(result, [True, True])
+        result = policy.permits_many([child], ['fred'], 'edit')
+        self.assertEqual(result, [False])
+
     def test_permits_no_acl(self):
         context = DummyContext()
         policy = self._makeOne()
         self.assertEqual(policy.permits(context, [], 'view'), False)
 
+    def test_cache_disabled_by_default(self):
+        policy = self._makeOne()
+        self.assertIsNone(policy.cache)
+
+    def test_permits_uses_cache(self):
+        from pyramid.authorization import Allow
+
+        policy = self._makeOne()
+        policy.set_cache_size(10)
+        for i in range(2):
+            context = DummyContext()
+            context.__acl__ = [(Allow, 'fred', 'view')]
+            self.assertTrue(policy.permits(context, ['fred'], 'view'))
+        stats = policy.cache.stats()
+        self.assertEqual((stats['misses'], stats['hits']), (1, 1))
+
+    def test_set_cache_size(self):
+        from pyramid.authorization import Allow
+
+        policy = self._makeOne()
+        policy.set_cache_size(10)
+        self.assertEqual(policy.cache.stats()['maxsize'], 10)
+        policy.set_cache_size(0)
+        self.assertIsNone(policy.cache)
+        context = DummyContext()
+        context.__acl__ = [(Allow, 'fred', 'view')]
+        self.assertTrue(policy.permits(context, ['fred'], 'view'))
+        result = policy.permits_many([context], ['fred'], 'view')
+        self.assertEqual(result, [True])
+
     def test_permits(self):
         from pyramid.authorization import Deny
         from pyramid.authorization import Allow
@@ -384,6 +426,168 @@ class TestACLHelper(unittest.TestCase):
             result.acl, '<No ACL found on any object in resource lineage>'
         )
 
+    def test_acl_with_cache(self):
+        from pyramid.authorization import ACLCache
+        from pyramid.authorization import ACLHelper
+        from pyramid.authorization import Allow
+        from pyramid.authorization import Everyone
+        from pyramid.authorization import Authenticated
+        from pyramid.authorization import ALL_PERMISSIONS
+        from pyramid.authorization import DENY_ALL
+
+        helper = ACLHelper()
+        root = DummyContext()
+        community = DummyContext(__name__='community', __parent__=root)
+        blog = DummyContext(__name__='blog', __parent__=community)
+        root.__acl__ = [(Allow, Authenticated, VIEW)]
+        community.__acl__ = [
+            (Allow, 'fred', ALL_PERMISSIONS),
+            (Allow, 'wilma', VIEW),
+            DENY_ALL,
+        ]
+        blog.__acl__ = [
+            (Allow, 'barney', MEMBER_PERMS),
+            (Allow, 'wilma', VIEW),
+        ]
+        cache = ACLCache()
+        for context in (root, community, blog, DummyContext()):
+            for user in ('wilma', 'fred', 'barney', 'someguy'):
+                for principals in (
+                    [Everyone],
+                    [Everyone, Authenticated, user],
+                    [user, Authenticated, Everyone],
+                ):
+                    for permission in ADMINISTRATOR_PERMS + ('unknown',):
+                        expected = helper.permits(
+                            context, principals, permission
+                        )
+                        for i in range(2):
+                            result = helper.permits(
+                                context, principals, permission, cache=cache
+                            )
+                            self.assertEqual(result, expected)
+                            self.assertEqual(result.ace, expected.ace)
+                            self.assertEqual(result.acl, expected.acl)
+                            self.assertEqual(result.context, expected.context)
+                            self.assertEqual(result.principals, principals)
+
+    def test_cache_reuses_parent_results(self):
+        from pyramid.authorization import ACLCache
+        from pyramid.authorization import ACLHelper
+        from pyramid.authorization import Allow
+
+        helper = ACLHelper()
+        root = DummyContext()
+        root.__acl__ = [(Allow, 'fred', 'view')]
+        cache = ACLCache()
+        for i in range(3):
+            child = DummyContext(__parent__=root)
+            self.assertTrue(helper.permits(child, ['fred'], 'view', cache))
+        stats = cache.stats()
+        self.assertEqual((stats['misses'], stats['hits']), (1, 2))
+
+    def test_cache_rebuilt_acl(self):
+        from pyramid.authorization import ACLCache
+        from pyramid.authorization import ACLHelper
+        from pyramid.authorization import Allow
+
+        helper = ACLHelper()
+        cache = ACLCache()
+        for i in range(3):
+            context = DummyContext()
+            context.__acl__ = [(Allow, 'fred', ['view', 'edit'])]
+            result = helper.permits(context, ['fred'], 'edit', cache)
+            self.assertTrue(result)
+            self.assertIs(result.acl, context.__acl__)
+        stats = cache.stats()
+        self.assertEqual((stats['misses'], stats['hits']), (1, 2))
+
+    def test_cache_replaced_acl(self):
+        from pyramid.authorization import ACLCache
+        from pyramid.authorization import ACLHelper
+        from pyramid.authorization import Allow
+        from pyramid.authorization import Deny
+
+        helper = ACLHelper()
+        context = DummyContext()
+        context.__acl__ = [(Allow, 'fred', 'view')]
+        cache = ACLCache()
+        self.assertTrue(helper.permits(context, ['fred'], 'view', cache))
+        context.__acl__ = [(Deny, 'fred', 'view')]
+        self.assertFalse(helper.permits(context, ['fred'], 'view', cache))
+
+    def test_cache_modified_acl(self):
+        from pyramid.authorization import ACLCache
+        from pyramid.authorization import ACLHelper
+        from pyramid.authorization import Allow
+        from pyramid.authorization import Deny
+
+        helper = ACLHelper()
+        context = DummyContext()
+        context.__acl__ = [(Allow, 'fred', 'view')]
+        cache = ACLCache()
+        self.assertTrue(helper.permits(context, ['fred'], 'view', cache))
+        context.__acl__.insert(0, (Deny, 'fred', 'view'))
+        self.assertFalse(helper.permits(context, ['fred'], 'view', cache))
+
+    def test_cache_unhashable_principals(self):
+        from pyramid.authorization import ACLCache
+        from pyramid.authorization import ACLHelper
+        from pyramid.authorization import Allow
+
+        helper = ACLHelper()
+        context = DummyContext()
+        context.__acl__ = [(Allow, 'fred', 'view')]
+        cache = ACLCache()
+        result = helper.permits(context, [['fred'], 'fred'], 'view', cache)
+        self.assertTrue(result)
+
+    def test_cache_unhashable_ace_principal(self):
+        from pyramid.authorization import ACLCache
+        from pyramid.authorization import ACLHelper
+        from pyramid.authorization import Allow
+
+        helper = ACLHelper()
+        context = DummyContext()
+        context.__acl__ = [(Allow, ['bob'], 'view'), (Allow, 'fred', 'view')]
+        cache = ACLCache()
+        result = helper.permits(context, ['fred'], 'view', cache)
+        self.assertTrue(result)
+        self.assertEqual(result.ace, (Allow, 'fred', 'view'))
+        self.assertEqual(cache.stats()['size'], 0)
+
+    def test_permits_many(self):
+        from pyramid.authorization import ACLHelper
+        from pyramid.authorization import Allow
+        from pyramid.authorization import Deny
+
+        helper = ACLHelper()
+        root = DummyContext()
+        root.__acl__ = [(Allow, 'fred', 'view'), (Deny, 'fred', 'edit')]
+        children = [DummyContext(__parent__=root) for i in range(3)]
+        children[1].__acl__ = [(Allow, 'fred', 'edit')]
+        result = helper.permits_many(children, ['fred'], 'view')
+        self.assertEqual(result, [True, True, True])
+        result = helper.permits_many(children, ['fred'], 'edit')
+        self.assertEqual(result, [False, True, False])
+        self.assertEqual(result[1].context, children[1])
+        self.assertEqual(result[2].context, root)
+
+    def test_permits_many_shared_cache(self):
+        from pyramid.authorization import ACLCache
+        from pyramid.authorization import ACLHelper
+        from pyramid.authorization import Allow
+
+        helper = ACLHelper()
+        root = DummyContext()
+        root.__acl__ = [(Allow, 'fred', 'view')]
+        children = [DummyContext(__parent__=root) for i in range(3)]
+        cache = ACLCache()
+        result = helper.permits_many(children, ['fred'], 'view', cache)
+        self.assertEqual(result, [True, True, True])
+        stats = cache.stats()
+        self.assertEqual((stats['misses'], stats['hits']), (1, 2))
+
     def test_string_permissions_in_acl(self):
         from pyramid.authorization import ACLHelper
         from pyramid.authorization import Allow
@@ -533,6 +737,82 @@ class TestACLHelper(unittest.TestCase):
         self.assertEqual(result, [])
 
 
+class TestACLCache(unittest.TestCase):
+    def _makeOne(self, maxsize=1000):
+        from pyramid.authorization import ACLCache
+
+        return ACLCache(maxsize)
+
+    def test_maxsize_too_small(self):
+        self.assertRaises(ValueError, self._makeOne, 0)
+
+    def test_find_ace(self):
+        from pyramid.authorization import Allow
+        from pyramid.authorization import Deny
+
+        cache = self._makeOne()
+        acl = [(Deny, 'barney', 'view'), (Allow, 'fred', ('view', 'edit'))]
+        self.assertEqual(
+            cache.find_ace(acl, ['wilma', 'fred'], 'edit'), acl[1]
+        )
+        self.assertEqual(
+            cache.find_ace(acl, ['fred', 'barney'], 'view'), acl[0]
+        )
+        self.assertIsNone(cache.find_ace(acl, ['barney'], 'edit'))
+        self.assertEqual(cache.stats()['size'], 1)
+
+    def test_evicts_oldest(self):
+        from pyramid.authorization import Allow
+
+        cache = self._makeOne(2)
+        acls = [[(Allow, name, 'view')] for name in ('a', 'b', 'c')]
+        for acl in acls:
+            cache.find_ace(acl, ['a'], 'view')
+        cache.find_ace(list(acls[0]), ['a'], 'view')
+        self.assertEqual(
+            cache.stats(),
+            {
+                'hits': 0,
+                'misses': 4,
+                'evictions': 2,
+                'size': 2,
+                'maxsize': 2,
+            },
+        )
+
+    def test_clear(self):
+        from pyramid.authorization import Allow
+
+        cache = self._makeOne()
+        cache.find_ace([(Allow, 'fred', 'view')], ['fred'], 'view')
+        cache.clear()
+        self.assertEqual(cache.stats()['size'], 0)
+        self.assertEqual(cache.stats()['misses'], 0)
+
+    def test_deny_all(self):
+        from pyramid.authorization import DENY_ALL
+        from pyramid.authorization import Allow
+        from pyramid.authorization import Everyone
+
+        cache = self._makeOne()
+        for i in range(2):
+            acl = [(Allow, 'fred', 'view'), DENY_ALL]
+            ace = cache.find_ace(acl, ['fred', Everyone], 'edit')
+            self.assertEqual(ace, DENY_ALL)
+        stats = cache.stats()
+        self.assertEqual((stats['misses'], stats['hits']), (1, 1))
+
+    def test_unhashable_permissions(self):
+        from pyramid.authorization import Allow
+
+        cache = self._makeOne()
+        for i in range(2):
+            acl = [(Allow, 'fred', ['view', 'edit'])]
+            self.assertEqual(cache.find_ace(acl, ['fred'], 'edit'), acl[0])
+        stats = cache.stats()
+        self.assertEqual((stats['misses'], stats['hits']), (1, 1))
+
+
 class DummyContext:
     def __init__(self, *arg, **kw):
         self.__dict__.update(kw)
@@ -0,0 +1 @@
+# package without decorated objects
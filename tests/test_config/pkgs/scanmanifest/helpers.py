@@ -0,0 +1 @@
+message = 'manifest'
@@ -0,0 +1 @@
+# subpackage without decorated objects
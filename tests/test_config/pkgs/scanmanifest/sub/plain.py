@@ -0,0 +1 @@
+# module without decorated objects
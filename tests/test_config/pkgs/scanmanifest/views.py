@@ -0,0 +1,9 @@
+from pyramid.renderers import null_renderer
+from pyramid.view import view_config
+
+from . import helpers
+
+
+@view_config(name='manifest', renderer=null_renderer)
+def manifest_view(context, request):
+    return helpers.message
@@ -286,6 +286,22 @@ class ActionConfiguratorMixinTests(unittest.TestCase):
         else:  # pragma: no cover
             raise AssertionError
 
+    def test_commit_records_timings(self):
+        config = self._makeOne()
+        config.action(None)
+        config.commit()
+        self.assertEqual(
+            sorted(config.registry.action_timings),
+            ['check', 'execute', 'group', 'sort'],
+        )
+
+    def test_commit_without_settings(self):
+        config = self._makeOne()
+        config.registry.settings = None
+        config.action(None)
+        config.commit()
+        self.assertIn('execute', config.registry.action_timings)
+
 
 class TestActionState(unittest.TestCase):
     def _makeOne(self):
@@ -745,10 +761,30 @@ class Test_reentrant_action_functional(unittest.TestCase):
 
 
 class Test_resolveConflicts(unittest.TestCase):
-    def _callFUT(self, actions):
+    def _callFUT(self, actions, state=None):
         from pyramid.config.actions import resolveConflicts
 
-        return resolveConflicts(actions)
+        return resolveConflicts(actions, state=state)
+
+    def test_it_timings(self):
+        from pyramid.config.actions import ConflictResolverState
+
+        state = ConflictResolverState()
+        result = self._callFUT([(None, None), (1, None)], state=state)
+        self.assertEqual(len(list(result)), 2)
+        self.assertEqual(sorted(state.timings), ['check', 'group', 'sort'])
+        self.assertTrue(all(t >= 0 for t in state.timings.values()))
+
+    def test_it_many_actions(self):
+        from pyramid.config.actions import ConflictResolverState
+
+        state = ConflictResolverState()
+        actions = [(i % 1000, None, (), {}, (str(i),)) for i in range(2000)]
+        actions += [(i, None, (), {}, ()) for i in range(1000)]
+        result = list(self._callFUT(actions, state=state))
+        self.assertEqual(len(result), 1000)
+        self.assertTrue(all(a['includepath'] == () for a in result))
+        self.assertEqual(len(state.remaining_actions), 2000)
 
     def test_it_success_tuples(self):
         from . import dummyfactory as f
@@ -196,3 +196,32 @@ class TestFactoriesMixin(unittest.TestCase):
         registry = config.registry
         result = registry.queryUtility(IExecutionPolicy)
         self.assertEqual(result, default_execution_policy)
+
+    def test_set_request_tracer(self):
+        from pyramid.interfaces import IRequestTracer
+
+        config = self._makeOne(autocommit=True)
+
+        def dummy_tracer(request, step, timing):  # pragma: no cover
+            pass
+
+        config.set_request_tracer(dummy_tracer)
+        result = config.registry.queryUtility(IRequestTracer)
+        self.assertEqual(result, dummy_tracer)
+
+    def test_set_request_tracer_before_views_are_derived(self):
+        from pyramid.interfaces import IRequestTracer
+
+        config = self._makeOne()
+        traced = []
+
+        def dummy_tracer(request, step, timing):  # pragma: no cover
+            pass
+
+        def register_view():
+            traced.append(config.registry.queryUtility(IRequestTracer))
+
+        config.action(None, register_view)
+        config.set_request_tracer(dummy_tracer)
+        config.commit()
+        self.assertEqual(traced, [dummy_tracer])
@@ -420,6 +420,12 @@ class ConfiguratorTests(unittest.TestCase):
         config._fix_registry()
         self.assertEqual(reg.has_listeners, True)
 
+    def test__fix_registry_has_listeners_for(self):
+        reg = DummyRegistry()
+        config = self._makeOne(reg)
+        config._fix_registry()
+        self.assertEqual(reg.has_listeners_for(object), True)
+
     def test__fix_registry_notify(self):
         reg = DummyRegistry()
         config = self._makeOne(reg)
@@ -483,6 +489,7 @@ class ConfiguratorTests(unittest.TestCase):
         self.assertFalse(hasattr(reg, '_view_lookup_cache'))
         reg._clear_view_lookup_cache()
         self.assertEqual(reg._view_lookup_cache, {})
+        self.assertEqual(len(reg._view_lookup_miss_cache), 0)
 
     def test_setup_registry_calls_fix_registry(self):
         reg = DummyRegistry()
@@ -1142,6 +1149,121 @@ test_config.dummy_include2"""
         finally:
             sys.path.remove(path)
 
+    def _makeManifestPath(self):
+        import shutil
+        import tempfile
+
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        return os.path.join(tmpdir, 'manifest.json')
+
+    def _scanWithManifest(self, path, **kw):
+        import tests.test_config.pkgs.scanmanifest as package
+
+        config = self._makeOne(
+            autocommit=True, settings={'pyramid.scan_manifest': path}
+        )
+        config.scan(package, **kw)
+        return config
+
+    def _forgetModules(self, *names):
+        import sys
+
+        prefix = 'tests.test_config.pkgs.scanmanifest.'
+        for name in names:
+            sys.modules.pop(prefix + name, None)
+
+    def test_scan_with_manifest(self):
+        import json
+        import sys
+        from zope.interface import alsoProvides
+        from pyramid.view import render_view_to_response
+
+        path = self._makeManifestPath()
+        prefix = 'tests.test_config.pkgs.scanmanifest.'
+        self._scanWithManifest(path)
+        with open(path) as f:
+            data = json.load(f)
+        (scan,) = data['scans'].values()
+        self.assertEqual(
+            scan['skipped'],
+            [prefix + 'helpers', prefix + 'plain', prefix + 'sub']
+            + [prefix + 'sub.plain'],
+        )
+        self.assertTrue('0:sub/plain.py' in scan['files'])
+
+        self._forgetModules('plain', 'sub', 'sub.plain', 'views')
+        config = self._scanWithManifest(path)
+        self.assertFalse(prefix + 'plain' in sys.modules)
+        self.assertFalse(prefix + 'sub' in sys.modules)
+        self.assertTrue(prefix + 'views' in sys.modules)
+        ctx = DummyContext()
+        req = DummyRequest()
+        alsoProvides(req, IRequest)
+        req.registry = config.registry
+        result = render_view_to_response(ctx, req, 'manifest')
+        self.assertEqual(result, 'manifest')
+
+    def test_scan_with_stale_manifest(self):
+        import json
+        import sys
+
+        path = self._makeManifestPath()
+        self._scanWithManifest(path)
+        with open(path) as f:
+            data = json.load(f)
+        (scan,) = data['scans'].values()
+        scan['files']['0:plain.py'] -= 1
+        with open(path, 'w') as f:
+            json.dump(data, f)
+        self._forgetModules('plain')
+        self._scanWithManifest(path)
+        self.assertTrue(
+            'tests.test_config.pkgs.scanmanifest.plain' in sys.modules
+        )
+
+    def test_scan_with_manifest_and_ignore(self):
+        import json
+        import sys
+
+        path = self._makeManifestPath()
+        prefix = 'tests.test_config.pkgs.scanmanifest.'
+        self._forgetModules('plain', 'sub', 'sub.plain')
+        self._scanWithManifest(path, ignore='.sub')
+        self._scanWithManifest(path, ignore=['.plain'])
+        with open(path) as f:
+            data = json.load(f)
+        self.assertEqual(len(data['scans']), 2)
+        self._forgetModules('plain', 'sub', 'sub.plain')
+        self._scanWithManifest(path, ignore='.sub')
+        self._scanWithManifest(path, ignore=['.plain'])
+        self.assertFalse(prefix + 'plain' in sys.modules)
+        self.assertFalse(prefix + 'sub' in sys.modules)
+
+    def test_scan_with_manifest_and_callable_ignore(self):
+        import sys
+
+        path = self._makeManifestPath()
+        self._scanWithManifest(path, ignore=lambda name: False)
+        self.assertFalse(os.path.exists(path))
+        self._forgetModules('plain')
+        self._scanWithManifest(path)
+        self._forgetModules('plain')
+        self._scanWithManifest(path, ignore=[lambda name: False])
+        self.assertTrue(
+            'tests.test_config.pkgs.scanmanifest.plain' in sys.modules
+        )
+
+    def test_scan_module_with_manifest(self):
+        import tests.test_config.pkgs.scanmanifest.views as module
+
+        path = self._makeManifestPath()
+        config = self._makeOne(
+            autocommit=True, settings={'pyramid.scan_manifest': path}
+        )
+        config.scan(module)
+        self.assertFalse(os.path.exists(path))
+
     def test_scan_integration_conflict(self):
         from tests.test_config.pkgs import selfscan
         from pyramid.config import Configurator
@@ -1406,6 +1528,86 @@ class TestGlobalRegistriesIntegration(unittest.TestCase):
         self.assertEqual(global_registries.last, config1.registry)
 
 
+class TestScanManifest(unittest.TestCase):
+    def setUp(self):
+        import shutil
+        import tempfile
+
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        self.path = os.path.join(self.tmpdir, 'manifest.json')
+
+    def _makeOne(self, path=None):
+        from pyramid.config import ScanManifest
+
+        return ScanManifest(path or self.path)
+
+    def _write(self, data):
+        with open(self.path, 'w') as f:
+            f.write(data)
+
+    def test_invalid_file(self):
+        self._write('{')
+        self.assertEqual(self._makeOne().scans, {})
+
+    def test_other_version(self):
+        self._write('{"version": 0, "scans": {"a": {}}}')
+        self.assertEqual(self._makeOne().scans, {})
+
+    def test_invalid_scans(self):
+        self._write('{"version": 1, "scans": []}')
+        self.assertEqual(self._makeOne().scans, {})
+
+    def test_lookup_all_categories(self):
+        import tests.test_config.pkgs.scanmanifest as package
+
+        manifest = self._makeOne()
+        entry = manifest.lookup(package, None, None)
+        self.assertEqual(entry.skipped, None)
+        manifest.record(entry, package, None)
+        entry = self._makeOne().lookup(package, None, None)
+        self.assertTrue(
+            'tests.test_config.pkgs.scanmanifest.sub' in entry.skipped
+        )
+
+    def test_record_unwritable(self):
+        import tests.test_config.pkgs.scanmanifest as package
+
+        manifest = self._makeOne(os.path.join(self.tmpdir, 'no', 'file'))
+        entry = manifest.lookup(package, ('pyramid',), None)
+        manifest.record(entry, package, ('pyramid',))
+        self.assertEqual(list(manifest.scans), [entry.key])
+
+
+class Test_has_callbacks(unittest.TestCase):
+    def _callFUT(self, module, name, categories=('pyramid',)):
+        from pyramid.config import _has_callbacks
+
+        return _has_callbacks(module, name, categories)
+
+    def _makeModule(self, **kw):
+        import types
+
+        module = types.ModuleType('mod')
+        module.__dict__.update(kw)
+        return module
+
+    def test_decorated(self):
+        import tests.test_config.pkgs.scanmanifest.views as module
+
+        self.assertTrue(self._callFUT(module, module.__name__))
+        self.assertTrue(self._callFUT(module, module.__name__, None))
+        self.assertFalse(self._callFUT(module, module.__name__, ('other',)))
+        self.assertFalse(self._callFUT(module, 'other'))
+
+    def test_misbehaving_object(self):
+        class Proxy(object):
+            def __getattr__(self, name):
+                raise RuntimeError(name)
+
+        self.assertFalse(self._callFUT(self._makeModule(p=Proxy()), 'mod'))
+
+
 class DummyRequest:
     subpath = ()
     matchdict = None
@@ -385,6 +385,31 @@ class TestPredicateList(unittest.TestCase):
         self.assertEqual(predicates[2](None, request), True)
 
 
+class Test_cache_predicates(unittest.TestCase):
+    def _callFUT(self, preds):
+        from pyramid.config.predicates import cache_predicates
+
+        return cache_predicates(preds)
+
+    def test_it(self):
+        from pyramid.predicates import (
+            CachedPredicate,
+            HeaderPredicate,
+            Notted,
+            RequestMethodPredicate,
+        )
+
+        header = HeaderPredicate('X-Foo', None)
+        notted = Notted(HeaderPredicate('X-Bar', None))
+        method = RequestMethodPredicate('GET', None)
+        result = self._callFUT([header, notted, method])
+        self.assertIsInstance(result[0], CachedPredicate)
+        self.assertIs(result[0].predicate, header)
+        self.assertIsInstance(result[1], CachedPredicate)
+        self.assertIs(result[1].predicate, notted)
+        self.assertIs(result[2], method)
+
+
 class Test_sort_accept_offers(unittest.TestCase):
     def _callFUT(self, offers, order=None):
         from pyramid.config.predicates import sort_accept_offers
@@ -34,6 +34,12 @@ class RoutesConfiguratorMixinTests(unittest.TestCase):
         config = self._makeOne()
         mapper = config.get_routes_mapper()
         self.assertEqual(mapper.routelist, [])
+        self.assertFalse(mapper.indexed)
+
+    def test_get_routes_mapper_indexed(self):
+        config = self._makeOne(settings={'pyramid.index_routes': 'true'})
+        mapper = config.get_routes_mapper()
+        self.assertTrue(mapper.indexed)
 
     def test_get_routes_mapper_already_registered(self):
         from pyramid.interfaces import IRoutesMapper
@@ -126,6 +126,26 @@ class ConfiguratorSecurityMethodsTests(unittest.TestCase):
             config.registry.getUtility(IAuthorizationPolicy), authz_policy
         )
 
+    def test_set_authorization_policy_acl_cache_size(self):
+        from pyramid.authorization import ACLAuthorizationPolicy
+
+        config = self._makeOne(
+            autocommit=True, settings={'acl_cache_size': '10'}
+        )
+        policy = ACLAuthorizationPolicy()
+        config.set_authorization_policy(policy)
+        self.assertEqual(policy.cache.stats()['maxsize'], 10)
+
+    def test_set_authorization_policy_acl_cache_disabled(self):
+        from pyramid.authorization import ACLAuthorizationPolicy
+
+        config = self._makeOne(
+            autocommit=True, settings={'acl_cache_size': '0'}
+        )
+        policy = ACLAuthorizationPolicy()
+        config.set_authorization_policy(policy)
+        self.assertIsNone(policy.cache)
+
     def test_set_default_permission(self):
         from pyramid.interfaces import IDefaultPermission
 
@@ -605,6 +605,76 @@ class TestSettings(unittest.TestCase):
         self.assertEqual(result['default_locale_name'], 'abc')
         self.assertEqual(result['pyramid.default_locale_name'], 'abc')
 
+    def test_index_routes(self):
+        settings = self._makeOne({})
+        self.assertEqual(settings['index_routes'], False)
+        self.assertEqual(settings['pyramid.index_routes'], False)
+        result = self._makeOne({'index_routes': 'true'})
+        self.assertEqual(result['index_routes'], True)
+        self.assertEqual(result['pyramid.index_routes'], True)
+        result = self._makeOne({}, {'PYRAMID_INDEX_ROUTES': '1'})
+        self.assertEqual(result['index_routes'], True)
+        self.assertEqual(result['pyramid.index_routes'], True)
+
+    def test_view_lookup_miss_cache_size(self):
+        settings = self._makeOne({})
+        self.assertEqual(settings['view_lookup_miss_cache_size'], 1000)
+        self.assertEqual(settings['pyramid.view_lookup_miss_cache_size'], 1000)
+        result = self._makeOne({'view_lookup_miss_cache_size': '10'})
+        self.assertEqual(result['view_lookup_miss_cache_size'], 10)
+        self.assertEqual(result['pyramid.view_lookup_miss_cache_size'], 10)
+        result = self._makeOne(
+            {}, {'PYRAMID_VIEW_LOOKUP_MISS_CACHE_SIZE': '0'}
+        )
+        self.assertEqual(result['view_lookup_miss_cache_size'], 0)
+        self.assertEqual(result['pyramid.view_lookup_miss_cache_size'], 0)
+
+    def test_asgi_max_threads(self):
+        settings = self._makeOne({})
+        self.assertEqual(settings['asgi_max_threads'], 40)
+        self.assertEqual(settings['pyramid.asgi_max_threads'], 40)
+        result = self._makeOne({'asgi_max_threads': '10'})
+        self.assertEqual(result['asgi_max_threads'], 10)
+        self.assertEqual(result['pyramid.asgi_max_threads'], 10)
+        result = self._makeOne({}, {'PYRAMID_ASGI_MAX_THREADS': '5'})
+        self.assertEqual(result['asgi_max_threads'], 5)
+        self.assertEqual(result['pyramid.asgi_max_threads'], 5)
+
+    def test_acl_cache_size(self):
+        settings = self._makeOne({})
+        self.assertEqual(settings['acl_cache_size'], 0)
+        self.assertEqual(settings['pyramid.acl_cache_size'], 0)
+        result = self._makeOne({'acl_cache_size': '10'})
+        self.assertEqual(result['acl_cache_size'], 10)
+        self.assertEqual(result['pyramid.acl_cache_size'], 10)
+        result = self._makeOne({}, {'PYRAMID_ACL_CACHE_SIZE': '100'})
+        self.assertEqual(result['acl_cache_size'], 100)
+        self.assertEqual(result['pyramid.acl_cache_size'], 100)
+
+    def test_scan_manifest(self):
+        settings = self._makeOne({})
+        self.assertEqual(settings['pyramid.scan_manifest'], '')
+        result = self._makeOne({'scan_manifest': 'scan.json'})
+        self.assertEqual(result['pyramid.scan_manifest'], 'scan.json')
+        result = self._makeOne({}, {'PYRAMID_SCAN_MANIFEST': 'env.json'})
+        self.assertEqual(result['pyramid.scan_manifest'], 'env.json')
+
+    def test_compile_view_derivers(self):
+        settings = self._makeOne({})
+        self.assertFalse(settings['pyramid.compile_view_derivers'])
+        result = self._makeOne({'compile_view_derivers': 'true'})
+        self.assertTrue(result['pyramid.compile_view_derivers'])
+        result = self._makeOne({}, {'PYRAMID_COMPILE_VIEW_DERIVERS': '1'})
+        self.assertTrue(result['pyramid.compile_view_derivers'])
+
+    def test_request_timings(self):
+        settings = self._makeOne({})
+        self.assertFalse(settings['pyramid.request_timings'])
+        result = self._makeOne({'request_timings': 'true'})
+        self.assertTrue(result['pyramid.request_timings'])
+        result = self._makeOne({}, {'PYRAMID_REQUEST_TIMINGS': '1'})
+        self.assertTrue(result['pyramid.request_timings'])
+
     def test_csrf_trusted_origins(self):
         result = self._makeOne({})
         self.assertEqual(result['pyramid.csrf_trusted_origins'], [])
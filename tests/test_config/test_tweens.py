@@ -251,6 +251,116 @@ class TestTweens(unittest.TestCase):
         tweens.add_implicit('name1', factory1)
         self.assertEqual(tweens(None, None), '123')
 
+    def test_instrumented(self):
+        from pyramid.instrumentation import RequestTimings
+        from pyramid.tweens import MAIN
+
+        tweens = self._makeOne()
+
+        def factory(name):
+            def tween_factory(handler, registry):
+                def tween(request):
+                    return name + handler(request)
+
+                return tween
+
+            return tween_factory
+
+        tweens.add_implicit('name1', factory('1'))
+        tweens.add_implicit('name2', factory('2'))
+        timings = RequestTimings()
+        chain = tweens.instrumented(lambda request: 'main', None, timings)
+        self.assertEqual(chain(None), '21main')
+        self.assertEqual(chain(None), '21main')
+        self.assertEqual(sorted(timings.tweens), [MAIN, 'name1', 'name2'])
+        for histogram in timings.tweens.values():
+            self.assertEqual(histogram.count, 2)
+        tweens.add_explicit('name1', factory('1'))
+        chain = tweens.instrumented(lambda request: 'main', None, timings)
+        self.assertEqual(chain(None), '1main')
+        self.assertEqual(timings.tween('name1').count, 3)
+        self.assertEqual(timings.tween('name2').count, 2)
+
+    def test_async_handler_all_async(self):
+        import asyncio
+
+        tweens = self._makeOne()
+
+        def factory(name):
+            def tween_factory(handler, registry):
+                async def tween(request):
+                    return name + await handler(request)
+
+                return tween
+
+            tween_factory.supports_async = True
+            return tween_factory
+
+        tweens.add_implicit('name1', factory('1'))
+        tweens.add_implicit('name2', factory('2'))
+
+        async def handler(request):
+            return 'main'
+
+        chain = tweens.async_handler(handler, None, None)
+        loop = asyncio.new_event_loop()
+        try:
+            self.assertEqual(loop.run_until_complete(chain(None)), '21main')
+        finally:
+            loop.close()
+
+    def test_async_handler_sync_tween(self):
+        import asyncio
+        from pyramid import testing
+
+        tweens = self._makeOne()
+        calls = []
+
+        def async_factory(handler, registry):
+            from pyramid.asgi import is_async_callable
+
+            async def async_tween(request):
+                calls.append('async')
+                return await handler(request)
+
+            def sync_tween(request):
+                calls.append('async factory, sync tween')
+                return handler(request)
+
+            if is_async_callable(handler):
+                return async_tween
+            return sync_tween
+
+        async_factory.supports_async = True
+
+        def sync_factory(handler, registry):
+            def tween(request):
+                calls.append('sync')
+                return handler(request)
+
+            return tween
+
+        tweens.add_explicit('name1', async_factory)
+        tweens.add_explicit('name2', sync_factory)
+        tweens.add_explicit('name3', async_factory)
+
+        async def handler(request):
+            raise AssertionError('not called')  # pragma: no cover
+
+        def sync_handler(request):
+            return 'main'
+
+        chain = tweens.async_handler(handler, sync_handler, None)
+        request = testing.DummyRequest()
+        request.registry = None
+        loop = asyncio.new_event_loop()
+        try:
+            self.assertEqual(loop.run_until_complete(chain(request)), 'main')
+        finally:
+            loop.close()
+        # name3 is called with a sync handler and so returns a sync tween
+        self.assertEqual(calls, ['async', 'sync', 'async factory, sync tween'])
+
     def test_implicit_ordering_1(self):
         tweens = self._makeOne()
         tweens.add_implicit('name1', 'factory1')
@@ -1788,6 +1788,64 @@ class TestViewsConfigurationMixin(unittest.TestCase):
         request.headers = {'Host': 'abc'}
         self._assertNotFound(wrapper, None, request)
 
+    def test_add_view_with_cacheable_predicate(self):
+        from pyramid.renderers import null_renderer
+        from pyramid.testing import DummyRequest
+
+        calls = []
+
+        class CountedPredicate(DummyPredicate):
+            cacheable = True
+
+            def __call__(self, context, request):
+                calls.append(self.val)
+                return True
+
+        config = self._makeOne(autocommit=True)
+        config.add_view_predicate('counted', CountedPredicate)
+        config.add_view(
+            view=lambda *arg: 'NO',
+            counted='a',
+            header='X-Missing',
+            renderer=null_renderer,
+        )
+        config.add_view(
+            view=lambda *arg: 'OK', counted='a', renderer=null_renderer
+        )
+        wrapper = self._getViewCallable(config)
+        request = DummyRequest(registry=config.registry)
+        self.assertEqual(wrapper(None, request), 'OK')
+        self.assertEqual(calls, ['a'])
+
+    def test_add_view_compiled_derivers_multiview(self):
+        from pyramid.renderers import null_renderer
+
+        config = self._makeOne(
+            autocommit=True, settings={'compile_view_derivers': True}
+        )
+        config.add_view(
+            view=lambda *arg: 'GET',
+            request_method='GET',
+            renderer=null_renderer,
+        )
+        config.add_view(
+            view=lambda *arg: 'POST',
+            request_method='POST',
+            renderer=null_renderer,
+        )
+        wrapper = self._getViewCallable(config)
+        request = self._makeRequest(config)
+        request.method = 'GET'
+        self.assertEqual(wrapper(None, request), 'GET')
+        request.method = 'POST'
+        self.assertEqual(wrapper(None, request), 'POST')
+        view = wrapper.match(None, request)
+        self.assertEqual(
+            view.__deriver_plan__, (('attr_wrapped_view', 'predicated_view'),)
+        )
+        request.method = 'PUT'
+        self._assertNotFound(wrapper, None, request)
+
     def test_add_view_with_header_val_missing(self):
         from pyramid.httpexceptions import HTTPNotFound
 
@@ -3403,6 +3461,118 @@ class TestMultiView(unittest.TestCase):
         response = mv(context, request)
         self.assertEqual(response, expected_response)
 
+    def _makePredicated(self, name, *preds, **kw):
+        from pyramid.config.views import attr_wrapped_view, predicated_view
+        from pyramid.viewderivers import wraps_view
+
+        calls = []
+
+        def view(context, request):
+            calls.append(name)
+            return name
+
+        info = DummyViewInfo(preds, **kw)
+        for deriver in (predicated_view, attr_wrapped_view):
+            view = wraps_view(deriver)(view, info)
+        return view, calls
+
+    def _makePredicates(self, request_method=None, xhr=None, other=None):
+        from pyramid.predicates import RequestMethodPredicate, XHRPredicate
+
+        preds = []
+        if request_method is not None:
+            preds.append(RequestMethodPredicate(request_method, None))
+        if xhr is not None:
+            preds.append(XHRPredicate(xhr, None))
+        if other is not None:
+            preds.append(lambda context, request: other)
+        return preds
+
+    def test___call__compiled_predicates(self):
+        from pyramid.exceptions import PredicateMismatch
+
+        mv = self._makeOne()
+        views = {}
+        calls = {}
+        for name, order, preds in [
+            ('get', 1, self._makePredicates('GET')),
+            ('xhr', 2, self._makePredicates(('GET', 'POST'), True)),
+            ('post', 3, self._makePredicates('POST', other=False)),
+            ('any', 4, self._makePredicates(other=True)),
+        ]:
+            views[name], calls[name] = self._makePredicated(
+                name, *preds, order=order
+            )
+            mv.add(views[name], order)
+        request = DummyRequest()
+        for method, is_xhr, expected in [
+            ('GET', False, 'get'),
+            ('HEAD', True, 'get'),
+            ('POST', True, 'xhr'),
+            ('POST', False, 'any'),
+            ('PUT', True, 'any'),
+            ('PUT', True, 'any'),
+        ]:
+            request.method = method
+            request.is_xhr = is_xhr
+            self.assertEqual(mv(None, request), expected)
+            self.assertEqual(mv.match(None, request), views[expected])
+        self.assertEqual(calls['get'], ['get', 'get'])
+        self.assertEqual(calls['xhr'], ['xhr'])
+        self.assertEqual(calls['post'], [])
+        self.assertEqual(calls['any'], ['any'] * 3)
+        mv = self._makeOne()
+        mv.add(views['post'], 3)
+        request.method = 'POST'
+        self.assertRaises(PredicateMismatch, mv, None, request)
+        self.assertRaises(PredicateMismatch, mv.match, None, request)
+
+    def test___call__compiled_predicates_repeated(self):
+        from pyramid.exceptions import PredicateMismatch
+
+        preds = self._makePredicates(('GET', 'POST'), True)
+        preds += self._makePredicates('POST', True)
+        view, calls = self._makePredicated('view', *preds)
+        mv = self._makeOne()
+        mv.add(view, 1)
+        request = DummyRequest()
+        request.method = 'POST'
+        request.is_xhr = True
+        self.assertEqual(mv(None, request), 'view')
+        request.is_xhr = False
+        self.assertRaises(PredicateMismatch, mv, None, request)
+        request.method = 'GET'
+        self.assertRaises(PredicateMismatch, mv, None, request)
+
+    def test___call__compiled_view_raises_predicate_mismatch(self):
+        from pyramid.exceptions import PredicateMismatch
+
+        def raises(context, request):
+            raise PredicateMismatch
+
+        mv = self._makeOne()
+        view1, _ = self._makePredicated('view1', *self._makePredicates('GET'))
+        view1.__unpredicated__ = raises
+        view2, _ = self._makePredicated('view2', *self._makePredicates('GET'))
+        mv.add(view1, 1)
+        mv.add(view2, 2)
+        request = DummyRequest()
+        request.method = 'GET'
+        self.assertEqual(mv(None, request), 'view2')
+
+    def test_tables_recompiled(self):
+        mv = self._makeOne()
+        view1, _ = self._makePredicated('view1', *self._makePredicates('GET'))
+        view2, _ = self._makePredicated('view2', *self._makePredicates('GET'))
+        request = DummyRequest()
+        request.method = 'GET'
+        mv.add(view2, 2)
+        self.assertEqual(mv(None, request), 'view2')
+        mv.add(view1, 1)
+        self.assertEqual(mv(None, request), 'view1')
+        mv.views = [(1, view2, None)]
+        self.assertEqual(mv(None, request), 'view2')
+
 
 class TestDefaultViewMapper(unittest.TestCase):
     def setUp(self):
@@ -4003,6 +4173,21 @@ class TestStaticURLInfo(unittest.TestCase):
         self.assertEqual(config.view_kw['permission'], NO_PERMISSION_REQUIRED)
         self.assertEqual(config.view_kw['view'].__class__, static_view)
 
+    def test_add_viewname_with_memory_cache(self):
+        config = DummyConfig()
+        inst = self._makeOne()
+        inst.add(
+            config,
+            'view',
+            'anotherpackage:path',
+            memory_cache_size=10,
+            memory_cache_max_file_size=100,
+        )
+        view = config.view_kw['view']
+        self.assertEqual(view.memory_cache.maxsize, 10)
+        self.assertEqual(view.memory_cache_max_file_size, 100)
+        self.assertFalse('memory_cache_size' in config.route_kw)
+
     def test_add_viewname_with_route_prefix(self):
         config = DummyConfig()
         config.route_prefix = '/abc'
@@ -4313,6 +4498,14 @@ class DummyPredicate(object):
     phash = text
 
 
+class DummyViewInfo(object):
+    def __init__(self, predicates, order=1):
+        self.predicates = predicates
+        self.order = order
+        self.phash = 'phash'
+        self.options = {}
+
+
 class DummyIntrospector(object):
     def __init__(self, getval=None):
         self.related = []
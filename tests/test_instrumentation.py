@@ -0,0 +1,213 @@
+import unittest
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def _makeOne(self, bounds=(0.001, 0.01, 0.1)):
+        from pyramid.instrumentation import LatencyHistogram
+
+        return LatencyHistogram(bounds)
+
+    def test_empty(self):
+        histogram = self._makeOne()
+        self.assertEqual(histogram.count, 0)
+        self.assertEqual(histogram.mean, 0.0)
+        self.assertEqual(histogram.percentile(99), 0.0)
+
+    def test_add(self):
+        histogram = self._makeOne()
+        for seconds in (0.0005, 0.001, 0.005, 0.05, 0.5):
+            histogram.add(seconds)
+        self.assertEqual(histogram.counts, [2, 1, 1, 1])
+        self.assertEqual(histogram.count, 5)
+        self.assertAlmostEqual(histogram.total, 0.5565)
+        self.assertAlmostEqual(histogram.mean, 0.1113)
+        self.assertEqual(histogram.max, 0.5)
+
+    def test_percentile(self):
+        histogram = self._makeOne()
+        for seconds in [0.0005] * 90 + [0.005] * 9 + [0.5]:
+            histogram.add(seconds)
+        self.assertEqual(histogram.percentile(50), 0.001)
+        self.assertEqual(histogram.percentile(90), 0.001)
+        self.assertEqual(histogram.percentile(95), 0.01)
+        self.assertEqual(histogram.percentile(99), 0.01)
+        self.assertEqual(histogram.percentile(100), 0.5)
+
+    def test_percentile_bounded_by_max(self):
+        histogram = self._makeOne()
+        histogram.add(0.02)
+        self.assertEqual(histogram.percentile(50), 0.02)
+
+    def test_reset(self):
+        histogram = self._makeOne()
+        histogram.add(0.5)
+        histogram.reset()
+        self.assertEqual(histogram.counts, [0, 0, 0, 0])
+        self.assertEqual(histogram.count, 0)
+        self.assertEqual(histogram.total, 0.0)
+        self.assertEqual(histogram.max, 0.0)
+
+
+class TestRequestTimings(unittest.TestCase):
+    def _makeOne(self):
+        from pyramid.instrumentation import RequestTimings
+
+        return RequestTimings()
+
+    def test_tween_and_phase(self):
+        timings = self._makeOne()
+        histogram = timings.tween('a')
+        self.assertIs(timings.tween('a'), histogram)
+        self.assertIsNot(timings.phase('a'), histogram)
+        self.assertEqual(list(timings.tweens), ['a'])
+        self.assertEqual(list(timings.phases), ['a'])
+
+    def test_call(self):
+        timings = self._makeOne()
+        timings(None, 'render', (1.0, 1.5))
+        histogram = timings.phase('render')
+        self.assertEqual(histogram.count, 1)
+        self.assertEqual(histogram.total, 0.5)
+
+    def test_reset(self):
+        timings = self._makeOne()
+        timings.tween('a').add(1)
+        timings.phase('b').add(1)
+        timings.reset()
+        self.assertEqual(timings.tween('a').count, 0)
+        self.assertEqual(timings.phase('b').count, 0)
+
+
+class Test_get_request_timings(unittest.TestCase):
+    def _callFUT(self, registry):
+        from pyramid.instrumentation import get_request_timings
+
+        return get_request_timings(registry)
+
+    def test_it(self):
+        from pyramid.instrumentation import RequestTimings
+        from pyramid.registry import Registry
+
+        registry = Registry()
+        timings = self._callFUT(registry)
+        self.assertIsInstance(timings, RequestTimings)
+        self.assertIs(registry.request_timings, timings)
+        self.assertIs(self._callFUT(registry), timings)
+
+
+class Test_get_request_tracer(unittest.TestCase):
+    def _callFUT(self, registry):
+        from pyramid.instrumentation import get_request_tracer
+
+        return get_request_tracer(registry)
+
+    def _makeRegistry(self, tracer=None, **settings):
+        from pyramid.interfaces import IRequestTracer
+        from pyramid.registry import Registry
+
+        registry = Registry()
+        registry.settings = settings
+        if tracer is not None:
+            registry.registerUtility(tracer, IRequestTracer)
+        return registry
+
+    def test_no_tracer(self):
+        registry = self._makeRegistry()
+        self.assertIsNone(self._callFUT(registry))
+
+    def test_tracer(self):
+        tracer = DummyTracer()
+        registry = self._makeRegistry(tracer)
+        self.assertIs(self._callFUT(registry), tracer)
+
+    def test_request_timings(self):
+        registry = self._makeRegistry(request_timings=True)
+        self.assertIs(self._callFUT(registry), registry.request_timings)
+
+    def test_tracer_and_request_timings(self):
+        tracer = DummyTracer()
+        registry = self._makeRegistry(tracer, request_timings=True)
+        trace = self._callFUT(registry)
+        trace('request', 'render', (1.0, 2.0))
+        self.assertEqual(tracer.steps, [('request', 'render', (1.0, 2.0))])
+        self.assertEqual(registry.request_timings.phase('render').count, 1)
+
+
+class Test_traced(unittest.TestCase):
+    def _callFUT(self, tracer, step, func):
+        from pyramid.instrumentation import traced
+
+        return traced(tracer, step, func)
+
+    def test_it(self):
+        tracer = DummyTracer()
+        func = self._callFUT(tracer, 'render', lambda c, r, a: (c, r, a))
+        result = func('context', 'request', 1)
+        self.assertEqual(result, ('context', 'request', 1))
+        [(request, step, (start, stop))] = tracer.steps
+        self.assertEqual(request, 'request')
+        self.assertEqual(step, 'render')
+        self.assertLessEqual(start, stop)
+
+    def test_raises(self):
+        def func(context, request):
+            raise ValueError
+
+        tracer = DummyTracer()
+        self.assertRaises(
+            ValueError, self._callFUT(tracer, 'render', func), None, 'request'
+        )
+        self.assertEqual(len(tracer.steps), 1)
+
+
+class Test_step_tracer(unittest.TestCase):
+    def _callFUT(self, tracer, request):
+        from pyramid.instrumentation import step_tracer
+
+        return step_tracer(tracer, request)
+
+    def test_it(self):
+        tracer = DummyTracer()
+        mark = self._callFUT(tracer, 'request')
+        self.assertEqual(tracer.steps, [])
+        mark('new_request')
+        mark('route_match')
+        [first, second] = tracer.steps
+        self.assertEqual(first[:2], ('request', 'new_request'))
+        self.assertEqual(second[:2], ('request', 'route_match'))
+        self.assertLessEqual(first[2][0], first[2][1])
+        self.assertEqual(first[2][1], second[2][0])
+        self.assertLessEqual(second[2][0], second[2][1])
+
+
+class Test_timed(unittest.TestCase):
+    def _callFUT(self, histogram, func):
+        from pyramid.instrumentation import timed
+
+        return timed(histogram, func)
+
+    def test_it(self):
+        from pyramid.instrumentation import LatencyHistogram
+
+        histogram = LatencyHistogram()
+        func = self._callFUT(histogram, lambda a, b=None: (a, b))
+        self.assertEqual(func(1, b=2), (1, 2))
+        self.assertEqual(histogram.count, 1)
+
+    def test_raises(self):
+        from pyramid.instrumentation import LatencyHistogram
+
+        def func():
+            raise ValueError
+
+        histogram = LatencyHistogram()
+        self.assertRaises(ValueError, self._callFUT(histogram, func))
+        self.assertEqual(histogram.count, 1)
+
+
+class DummyTracer(object):
+    def __init__(self):
+        self.steps = []
+
+    def __call__(self, request, step, timing):
+        self.steps.append((request, step, timing))
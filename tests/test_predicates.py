@@ -536,6 +536,73 @@ class TestNotted(unittest.TestCase):
         self.assertEqual(inst.phash(), '')
         self.assertEqual(inst(None, None), True)
 
+    def test_cacheable(self):
+        pred = DummyPredicate('val')
+        inst = self._makeOne(pred)
+        self.assertFalse(inst.cacheable)
+        pred.cacheable = True
+        self.assertTrue(inst.cacheable)
+
+
+class TestCachedPredicate(unittest.TestCase):
+    def _makeOne(self, predicate):
+        from pyramid.predicates import CachedPredicate
+
+        return CachedPredicate(predicate)
+
+    def test_text_and_phash(self):
+        inst = self._makeOne(DummyPredicate('val'))
+        self.assertEqual(inst.text(), 'val')
+        self.assertEqual(inst.phash(), 'val')
+
+    def test_call_evaluated_once_per_request(self):
+        pred = CountingPredicate('val')
+        inst = self._makeOne(pred)
+        request = testing.DummyRequest()
+        self.assertTrue(inst(None, request))
+        self.assertTrue(inst(Dummy(), request))
+        self.assertEqual(pred.calls, 1)
+        self.assertTrue(inst(None, testing.DummyRequest()))
+        self.assertEqual(pred.calls, 2)
+
+    def test_call_shared_by_equal_predicates(self):
+        pred1 = CountingPredicate('val')
+        pred2 = CountingPredicate('val')
+        pred3 = CountingPredicate('other', False)
+        request = testing.DummyRequest()
+        self.assertTrue(self._makeOne(pred1)(None, request))
+        self.assertTrue(self._makeOne(pred2)(None, request))
+        self.assertFalse(self._makeOne(pred3)(None, request))
+        self.assertFalse(self._makeOne(pred3)(None, request))
+        self.assertEqual(pred1.calls, 1)
+        self.assertEqual(pred2.calls, 0)
+        self.assertEqual(pred3.calls, 1)
+
+    def test_call_phash_sequence(self):
+        pred1 = CountingPredicate(['a', 'b'])
+        pred2 = CountingPredicate(['a', 'b'])
+        request = testing.DummyRequest()
+        self.assertTrue(self._makeOne(pred1)(None, request))
+        self.assertTrue(self._makeOne(pred2)(None, request))
+        self.assertEqual(pred1.calls + pred2.calls, 1)
+
+    def test_call_notted_not_shared(self):
+        from pyramid.predicates import Notted
+
+        pred = CountingPredicate('val')
+        request = testing.DummyRequest()
+        self.assertTrue(self._makeOne(pred)(None, request))
+        self.assertFalse(self._makeOne(Notted(pred))(None, request))
+        self.assertEqual(pred.calls, 2)
+
+    def test_call_request_without_finished_callbacks(self):
+        pred = CountingPredicate('val')
+        inst = self._makeOne(pred)
+        request = Dummy()
+        self.assertTrue(inst(None, request))
+        self.assertTrue(inst(None, request))
+        self.assertEqual(pred.calls, 2)
+
 
 class predicate(object):
     def __repr__(self):
@@ -560,3 +627,16 @@ class DummyPredicate(object):
 
     def __call__(self, context, request):
         return True
+
+
+class CountingPredicate(DummyPredicate):
+    cacheable = True
+
+    def __init__(self, result, value=True):
+        DummyPredicate.__init__(self, result)
+        self.value = value
+        self.calls = 0
+
+    def __call__(self, context, request):
+        self.calls += 1
+        return self.value
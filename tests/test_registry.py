@@ -22,8 +22,26 @@ class TestRegistry(unittest.TestCase):
     def test_clear_view_cache_lookup(self):
         registry = self._makeOne()
         registry._view_lookup_cache[1] = 2
+        registry._view_lookup_miss_cache.put(3, True)
         registry._clear_view_lookup_cache()
         self.assertEqual(registry._view_lookup_cache, {})
+        self.assertEqual(len(registry._view_lookup_miss_cache), 0)
+
+    def test_view_lookup_miss_cache_default_size(self):
+        registry = self._makeOne()
+        self.assertEqual(registry._view_lookup_miss_cache.maxsize, 1000)
+
+    def test_view_lookup_miss_cache_size_from_settings(self):
+        registry = self._makeOne()
+        registry.settings = {'pyramid.view_lookup_miss_cache_size': '10'}
+        registry._clear_view_lookup_cache()
+        self.assertEqual(registry._view_lookup_miss_cache.maxsize, 10)
+
+    def test_view_lookup_miss_cache_disabled(self):
+        registry = self._makeOne()
+        registry.settings = {'pyramid.view_lookup_miss_cache_size': 0}
+        registry._clear_view_lookup_cache()
+        self.assertEqual(registry._view_lookup_miss_cache, None)
 
     def test_package_name(self):
         package_name = 'testing'
@@ -58,6 +76,32 @@ class TestRegistry(unittest.TestCase):
         )
         self.assertEqual(registry.has_listeners, True)
 
+    def test_has_listeners_for(self):
+        from zope.interface import Interface
+
+        class IOther(Interface):
+            pass
+
+        registry = self._makeOne()
+        self.assertFalse(registry.has_listeners_for(DummyEvent))
+        registry.registerHandler(lambda event: None, [IOther])
+        self.assertFalse(registry.has_listeners_for(DummyEvent))
+        handler = lambda event: None  # noqa: E731
+        registry.registerHandler(handler, [IDummyEvent])
+        self.assertTrue(registry.has_listeners_for(DummyEvent))
+        registry.unregisterHandler(handler, [IDummyEvent])
+        self.assertFalse(registry.has_listeners_for(DummyEvent))
+
+    def test_has_listeners_for_ignores_subscription_adapters(self):
+        from zope.interface import Interface
+
+        registry = self._makeOne()
+        registry.registerSubscriptionAdapter(
+            DummyEvent, [IDummyEvent], Interface
+        )
+        self.assertTrue(registry.has_listeners)
+        self.assertFalse(registry.has_listeners_for(DummyEvent))
+
     def test__get_settings(self):
         registry = self._makeOne()
         registry._settings = 'foo'
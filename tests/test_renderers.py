@@ -104,6 +104,194 @@ class TestJSON(unittest.TestCase):
         renderer = self._makeOne()(None)
         self.assertRaises(TypeError, renderer, objects, {})
 
+    def test_default_cached_per_class(self):
+        from datetime import date
+
+        calls = []
+
+        def adapter(obj, req):
+            return obj.isoformat()
+
+        renderer = self._makeOne()
+        renderer.add_adapter(date, adapter)
+        lookup = renderer.components.adapters.lookup
+
+        def counting_lookup(*arg, **kw):
+            calls.append(arg)
+            return lookup(*arg, **kw)
+
+        renderer.components.adapters.lookup = counting_lookup
+        value = [date(2020, 1, i) for i in range(1, 4)]
+        result = renderer(None)(value, {})
+        self.assertEqual(result, '["2020-01-01", "2020-01-02", "2020-01-03"]')
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(renderer._default_cache[date], adapter)
+
+    def test_default_cache_reset_by_add_adapter(self):
+        class Foo(object):
+            pass
+
+        renderer = self._makeOne()
+        render = renderer(None)
+        self.assertRaises(TypeError, render, [Foo()], {})
+        self.assertTrue(Foo in renderer._default_cache)
+        renderer.add_adapter(Foo, lambda obj, req: 'foo')
+        self.assertEqual(renderer._default_cache, {})
+        self.assertEqual(render([Foo()], {}), '["foo"]')
+
+    def test_default_instance___json__(self):
+        class Foo(object):
+            def __json__(self, request):
+                return 'class'
+
+        foo = Foo()
+        foo.__json__ = lambda request: 'instance'
+        renderer = self._makeOne()
+        renderer.add_adapter(Foo, lambda obj, req: 'adapter')
+        result = renderer(None)([Foo(), foo, Foo()], {})
+        self.assertEqual(result, '["class", "instance", "class"]')
+
+    def test_default_dynamic___json__(self):
+        class Foo(object):
+            def __getattr__(self, name):
+                if name == '__json__':
+                    return lambda request: 'dynamic'
+                raise AttributeError(name)
+
+        renderer = self._makeOne()
+        result = renderer(None)([Foo(), Foo()], {})
+        self.assertEqual(result, '["dynamic", "dynamic"]')
+        self.assertFalse(Foo in renderer._default_cache)
+
+    def test_default_instance_provides(self):
+        from zope.interface import Interface, directlyProvides
+
+        class IFoo(Interface):
+            pass
+
+        class Foo(object):
+            pass
+
+        foo = Foo()
+        directlyProvides(foo, IFoo)
+        renderer = self._makeOne()
+        renderer.add_adapter(Foo, lambda obj, req: 'foo')
+        renderer.add_adapter(IFoo, lambda obj, req: 'ifoo')
+        result = renderer(None)([Foo(), foo], {})
+        self.assertEqual(result, '["foo", "ifoo"]')
+
+    def test_with_bytes_serializer(self):
+        def serializer(obj, default, **kw):
+            return b'[' + default(obj[0]) + b']'
+
+        renderer = self._makeOne(serializer=serializer)
+        renderer.add_adapter(object, lambda obj, req: b'1')
+        self.assertEqual(renderer(None)([object()], {}), b'[1]')
+
+    def test_stream_with_indent(self):
+        self.assertRaises(ValueError, self._makeOne, stream=True, indent=2)
+
+    def test_stream(self):
+        import json
+
+        request = testing.DummyRequest()
+        renderer = self._makeOne(stream=True)(None)
+        value = {
+            'a': [1, 2.5, None, True],
+            'b': ('x', {'c': 'La Pe\xf1a'}),
+            'd': {},
+            'e': [],
+            1: False,
+        }
+        result = renderer(value, {'request': request})
+        self.assertFalse(isinstance(result, (str, bytes)))
+        body = b''.join(result)
+        self.assertEqual(body, json.dumps(value).encode('utf-8'))
+        self.assertEqual(request.response.content_type, 'application/json')
+
+    def test_stream_iterators(self):
+        renderer = self._makeOne(stream=True)(None)
+        value = {'rows': ({'x': x} for x in range(3)), 'ids': iter([1])}
+        result = renderer(value, {})
+        self.assertEqual(
+            b''.join(result),
+            b'{"rows": [{"x": 0}, {"x": 1}, {"x": 2}], "ids": [1]}',
+        )
+
+    def test_stream_chunks(self):
+        renderer = self._makeOne(stream=True, chunk_size=10)(None)
+        result = list(renderer(('a' * 8 for i in range(5)), {}))
+        self.assertTrue(len(result) > 1)
+        for chunk in result[:-1]:
+            self.assertTrue(len(chunk) >= 10)
+            self.assertTrue(len(chunk) < 20)
+        self.assertEqual(
+            b''.join(result), b'[' + b', '.join([b'"aaaaaaaa"'] * 5) + b']'
+        )
+
+    def test_stream_is_lazy(self):
+        consumed = []
+
+        def rows():
+            for x in range(3):
+                consumed.append(x)
+                yield x
+
+        renderer = self._makeOne(stream=True, chunk_size=1)(None)
+        result = renderer(rows(), {})
+        self.assertEqual(consumed, [])
+        self.assertEqual(next(result), b'[')
+        self.assertEqual(next(result), b'0')
+        self.assertEqual(consumed, [0])
+
+    def test_stream_with_adapters(self):
+        from datetime import date
+
+        request = testing.DummyRequest()
+        outerself = self
+
+        class MyObject(object):
+            def __json__(self, req):
+                outerself.assertEqual(req, request)
+                return iter([1, 2])
+
+        renderer = self._makeOne(stream=True)
+        renderer.add_adapter(date, lambda obj, req: obj.isoformat())
+        value = [MyObject(), date(2020, 1, 2)]
+        result = renderer(None)(value, {'request': request})
+        self.assertEqual(b''.join(result), b'[[1, 2], "2020-01-02"]')
+
+    def test_stream_no_adapter(self):
+        renderer = self._makeOne(stream=True)(None)
+        result = renderer([object()], {})
+        self.assertRaises(TypeError, b''.join, result)
+
+    def test_stream_with_kw(self):
+        renderer = self._makeOne(
+            stream=True, sort_keys=True, separators=(',', ':')
+        )(None)
+        result = renderer({'b': 1, 'a': [1, 2]}, {})
+        self.assertEqual(b''.join(result), b'{"a":[1,2],"b":1}')
+
+    def test_stream_skipkeys(self):
+        renderer = self._makeOne(stream=True, skipkeys=True)(None)
+        result = renderer({(1,): 3, 'a': 1}, {})
+        self.assertEqual(b''.join(result), b'{"a": 1}')
+
+    def test_stream_bad_key(self):
+        renderer = self._makeOne(stream=True)(None)
+        result = renderer({(1,): 3}, {})
+        self.assertRaises(TypeError, b''.join, result)
+
+    def test_stream_response(self):
+        from pyramid.renderers import RendererHelper
+
+        self.config.add_renderer('json', self._makeOne(stream=True))
+        helper = RendererHelper('json', registry=self.config.registry)
+        response = helper.render_to_response(iter([1]), None)
+        self.assertFalse(isinstance(response.app_iter, list))
+        self.assertEqual(response.body, b'[1]')
+
 
 class Test_string_renderer_factory(unittest.TestCase):
     def _callFUT(self, name):
@@ -251,6 +439,73 @@ class TestRendererHelper(unittest.TestCase):
             },
         )
 
+    def _registerLeanRendererFactory(self):
+        from pyramid.interfaces import IRendererFactory
+
+        def renderer(*arg):
+            def respond(*arg):
+                return arg
+
+            respond.needs_system_values = False
+            return respond
+
+        self.config.registry.registerUtility(
+            renderer, IRendererFactory, name='.foo'
+        )
+
+    def test_needs_system_values(self):
+        self._registerRendererFactory()
+        helper = self._makeOne('loo.foo')
+        self.assertTrue(helper.needs_system_values())
+
+    def test_needs_system_values_renderer_declares_not(self):
+        self._registerLeanRendererFactory()
+        helper = self._makeOne('loo.foo')
+        self.assertFalse(helper.needs_system_values())
+
+    def test_needs_system_values_before_render_subscriber(self):
+        from pyramid.interfaces import IBeforeRender
+
+        self._registerLeanRendererFactory()
+        self.config.registry.registerHandler(lambda e: None, [IBeforeRender])
+        helper = self._makeOne('loo.foo')
+        self.assertTrue(helper.needs_system_values())
+
+    def test_render_view_lean(self):
+        self._registerLeanRendererFactory()
+        helper = self._makeOne('loo.foo')
+        request = testing.DummyRequest()
+        response = helper.render_view(request, 'response', 'view', 'context')
+        self.assertEqual(response.app_iter[0], 'response')
+        self.assertEqual(
+            response.app_iter[1], {'request': request, 'context': 'context'}
+        )
+
+    def test_render_lean(self):
+        from pyramid.interfaces import IBeforeRender
+
+        from zope.interface import Interface
+
+        class IOther(Interface):
+            pass
+
+        events = []
+        self.config.registry.registerHandler(events.append, [IOther])
+        self._registerLeanRendererFactory()
+        helper = self._makeOne('loo.foo')
+        request = Dummy()
+        request.context = 'context'
+        result = helper.render('value', None, request=request)
+        self.assertEqual(result[1], {'request': request, 'context': 'context'})
+        result = helper.render('value', {'a': 1})
+        self.assertEqual(result[1], {'a': 1})
+        self.assertEqual(result[1].__class__, dict)
+        self.assertEqual(events, [])
+        self.config.registry.registerHandler(events.append, [IBeforeRender])
+        result = helper.render('value', {'a': 1})
+        self.assertEqual(result[1].__class__.__name__, 'BeforeRender')
+        self.assertEqual(len(events), 1)
+
     def test_render_explicit_registry(self):
         factory = self._registerRendererFactory()
 
@@ -487,6 +742,10 @@ class TestNullRendererHelper(unittest.TestCase):
         helper = self._makeOne()
         verifyObject(IRendererInfo, helper)
 
+    def test_needs_system_values(self):
+        helper = self._makeOne()
+        self.assertFalse(helper.needs_system_values())
+
     def test_render_view(self):
         helper = self._makeOne()
         self.assertEqual(helper.render_view(None, True, None, None), True)
@@ -749,6 +1008,36 @@ class TestJSONP(unittest.TestCase):
         result = renderer({'a': '1'}, {})
         self.assertEqual(result, '{"a": "1"}')
 
+    def test_render_to_jsonp_with_bytes_serializer(self):
+        from pyramid.renderers import JSONP
+
+        renderer = JSONP(serializer=lambda obj, default: b'[1]')(None)
+        request = testing.DummyRequest()
+        request.GET['callback'] = 'callback'
+        result = renderer([1], {'request': request})
+        self.assertEqual(result, '/**/callback([1]);')
+
+    def test_render_to_jsonp_stream(self):
+        from pyramid.renderers import JSONP
+
+        renderer = JSONP(stream=True)(None)
+        request = testing.DummyRequest()
+        request.GET['callback'] = 'callback'
+        result = renderer(iter(['1']), {'request': request})
+        self.assertEqual(b''.join(result), b'/**/callback(["1"]);')
+        self.assertEqual(
+            request.response.content_type, 'application/javascript'
+        )
+
+    def test_render_to_json_stream(self):
+        from pyramid.renderers import JSONP
+
+        renderer = JSONP(stream=True)(None)
+        request = testing.DummyRequest()
+        result = renderer(iter(['1']), {'request': request})
+        self.assertEqual(b''.join(result), b'["1"]')
+        self.assertEqual(request.response.content_type, 'application/json')
+
     def test_render_to_jsonp_invalid_callback(self):
         from pyramid.httpexceptions import HTTPBadRequest
 
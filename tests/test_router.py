@@ -821,6 +821,216 @@ class TestRouter(unittest.TestCase):
             'no route matched for url http://localhost:8080/wontmatch',
         )
 
+    def test_call_request_timings(self):
+        from pyramid.interfaces import IViewClassifier
+        from pyramid.tweens import MAIN
+
+        logger = self._registerLogger()
+        self._registerSettings(debug_routematch=True, request_timings=True)
+        self._registerRouteRequest('foo')
+        root = object()
+
+        def factory(request):
+            return root
+
+        route = self._connectRoute('foo', 'archives/:action/:article', factory)
+        route.predicates = [DummyPredicate()]
+        context = DummyContext()
+        self._registerTraverserFactory(context)
+        response = DummyResponse()
+        response.app_iter = ['Hello world']
+
+        def view(context, request):
+            request.add_response_callback(lambda request, response: None)
+            return response
+
+        environ = self._makeEnviron(PATH_INFO='/archives/action1/article1')
+        self._registerView(view, '', IViewClassifier, None, None)
+        router = self._makeOne()
+        self.assertIs(router.request_timings, self.registry.request_timings)
+        handle_request = router.orig_handle_request.__func__
+        self.assertIs(handle_request, router.__class__.handle_request)
+        start_response = DummyStartResponse()
+        result = router(environ, start_response)
+        self.assertEqual(result, ['Hello world'])
+        self.assertEqual(start_response.status, '200 OK')
+        timings = router.request_timings
+        for name in (
+            'route_match',
+            'root_factory',
+            'traversal',
+            'view_lookup',
+            'view_call',
+            'response_callbacks',
+        ):
+            self.assertEqual(timings.phase(name).count, 1)
+        self.assertEqual(timings.tween(MAIN).count, 1)
+        self.assertEqual(len(logger.messages), 1)
+        self.assertTrue(
+            logger.messages[0].startswith(
+                "route matched for url http://localhost:8080"
+                "/archives/action1/article1; "
+            )
+        )
+
+    def test_call_request_timings_notfound(self):
+        from pyramid.httpexceptions import HTTPNotFound
+
+        logger = self._registerLogger()
+        self._registerSettings(debug_routematch=True, request_timings=True)
+        self._connectRoute('foo', 'archives/:action/:article')
+        context = DummyContext()
+        self._registerTraverserFactory(context)
+        environ = self._makeEnviron(PATH_INFO='/wontmatch')
+        self._registerRootFactory(context)
+        router = self._makeOne()
+        start_response = DummyStartResponse()
+        self.assertRaises(HTTPNotFound, router, environ, start_response)
+        timings = router.request_timings
+        self.assertEqual(timings.phase('route_match').count, 1)
+        self.assertEqual(timings.phase('view_call').count, 1)
+        self.assertEqual(timings.phase('response_callbacks').count, 0)
+        self.assertEqual(
+            logger.messages,
+            ['no route matched for url http://localhost:8080/wontmatch'],
+        )
+
+    def test_call_request_timings_view_raises(self):
+        from pyramid.interfaces import IViewClassifier
+
+        self._registerSettings(request_timings=True)
+        context = DummyContext()
+        self._registerTraverserFactory(context)
+
+        def view(context, request):
+            raise ValueError
+
+        self._registerView(view, '', IViewClassifier, None, None)
+        router = self._makeOne()
+        start_response = DummyStartResponse()
+        self.assertRaises(
+            ValueError, router, self._makeEnviron(), start_response
+        )
+        timings = router.request_timings
+        self.assertEqual(timings.phase('route_match').count, 0)
+        self.assertEqual(timings.phase('view_call').count, 1)
+
+    def test_call_request_tracer(self):
+        from pyramid.instrumentation import TRACE_STEPS
+        from pyramid.interfaces import IRequestTracer, IViewClassifier
+
+        tracer = DummyTracer()
+        self.registry.registerUtility(tracer, IRequestTracer)
+        self._registerRouteRequest('foo')
+        self._connectRoute('foo', 'archives/:action/:article')
+        context = DummyContext()
+        self._registerTraverserFactory(context)
+        self._registerRootFactory(context)
+        response = DummyResponse()
+        response.app_iter = ['Hello world']
+
+        def view(context, request):
+            request.add_finished_callback(lambda request: None)
+            return response
+
+        self._registerView(view, '', IViewClassifier, None, None)
+        router = self._makeOne()
+        self.assertIs(router.tracer, tracer)
+        self.assertIsNone(router.request_timings)
+        environ = self._makeEnviron(PATH_INFO='/archives/action1/article1')
+        start_response = DummyStartResponse()
+        result = router(environ, start_response)
+        self.assertEqual(result, ['Hello world'])
+        steps = [step for request, step, timing in tracer.steps]
+        self.assertEqual(
+            steps, [step for step in TRACE_STEPS if step != 'render']
+        )
+        for request, step, (start, stop) in tracer.steps:
+            self.assertEqual(request.matched_route.name, 'foo')
+            self.assertLessEqual(start, stop)
+
+    def test_call_request_tracer_debug_routematch(self):
+        from pyramid.httpexceptions import HTTPNotFound
+        from pyramid.interfaces import IRequestTracer
+
+        logger = self._registerLogger()
+        self._registerSettings(debug_routematch=True)
+        messages = []
+
+        def tracer(request, step, timing):
+            messages.append((step, len(logger.messages)))
+
+        self.registry.registerUtility(tracer, IRequestTracer)
+        self._connectRoute('foo', 'archives/:action/:article')
+        context = DummyContext()
+        self._registerTraverserFactory(context)
+        router = self._makeOne()
+        environ = self._makeEnviron(PATH_INFO='/wontmatch')
+        start_response = DummyStartResponse()
+        self.assertRaises(HTTPNotFound, router, environ, start_response)
+        self.assertEqual(
+            messages[:2], [('new_request', 0), ('route_match', 1)]
+        )
+
+    def test_call_request_tracer_view_raises(self):
+        from pyramid.interfaces import IRequestTracer, IViewClassifier
+
+        tracer = DummyTracer()
+        self.registry.registerUtility(tracer, IRequestTracer)
+        context = DummyContext()
+        self._registerTraverserFactory(context)
+
+        def view(context, request):
+            raise ValueError
+
+        self._registerView(view, '', IViewClassifier, None, None)
+        router = self._makeOne()
+        start_response = DummyStartResponse()
+        self.assertRaises(
+            ValueError, router, self._makeEnviron(), start_response
+        )
+        steps = [step for request, step, timing in tracer.steps]
+        self.assertEqual(steps[-2:], ['view_call', 'finished_callbacks'])
+        self.assertNotIn('route_match', steps)
+        self.assertNotIn('new_response', steps)
+
+    def test_call_request_tracer_finished_callback_raises(self):
+        from pyramid.interfaces import IRequestTracer, IViewClassifier
+
+        tracer = DummyTracer()
+        self.registry.registerUtility(tracer, IRequestTracer)
+        context = DummyContext()
+        self._registerTraverserFactory(context)
+        response = DummyResponse()
+
+        def callback(request):
+            raise ValueError
+
+        def view(context, request):
+            request.add_finished_callback(callback)
+            return response
+
+        self._registerView(view, '', IViewClassifier, None, None)
+        router = self._makeOne()
+        start_response = DummyStartResponse()
+        self.assertRaises(
+            ValueError, router, self._makeEnviron(), start_response
+        )
+        steps = [step for request, step, timing in tracer.steps]
+        self.assertEqual(
+            steps[-3:],
+            ['response_callbacks', 'new_response', 'finished_callbacks'],
+        )
+        timings = [timing for request, step, timing in tracer.steps[-3:]]
+        for before, after in zip(timings, timings[1:]):
+            self.assertEqual(before[1], after[0])
+
+    def test_call_no_request_tracer(self):
+        router = self._makeOne()
+        self.assertIsNone(router.tracer)
+        handle_request = router.orig_handle_request.__func__
+        self.assertIs(handle_request, router.__class__.handle_request)
+
     def test_call_route_matches_doesnt_overwrite_subscriber_iface(self):
         from pyramid.interfaces import INewRequest
         from pyramid.interfaces import IViewClassifier
@@ -1642,6 +1852,380 @@ class TestRouter(unittest.TestCase):
         self.assertEqual(result[1], None)
 
 
+class TestRouterASGI(unittest.TestCase):
+    def setUp(self):
+        from pyramid.config import Configurator
+
+        self.config = Configurator()
+
+    def _makeApp(self):
+        from pyramid.router import Router
+
+        self.config.commit()
+        return Router(self.config.registry)
+
+    def _call(self, router, path='/', method='GET', body=b''):
+        import asyncio
+
+        scope = {
+            'type': 'http',
+            'method': method,
+            'path': path,
+            'query_string': b'',
+            'headers': [(b'host', b'example.com')],
+        }
+        messages = [{'type': 'http.request', 'body': body}]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(router.asgi(scope, receive, send))
+        finally:
+            loop.close()
+        if not sent:
+            return None
+        body = b''.join(m.get('body', b'') for m in sent[1:])
+        return sent[0]['status'], dict(sent[0]['headers']), body
+
+    def test_async_view_runs_on_event_loop(self):
+        import threading
+        from pyramid.response import Response
+
+        async def view(request):
+            return Response(threading.current_thread().name)
+
+        self.config.add_view(view)
+        status, headers, body = self._call(self._makeApp())
+        self.assertEqual(status, 200)
+        self.assertEqual(body, threading.current_thread().name.encode())
+
+    def test_sync_view_runs_in_thread_pool(self):
+        import threading
+        from pyramid.response import Response
+        from pyramid.threadlocal import get_current_request
+
+        def view(request):
+            self.assertTrue(get_current_request() is request)
+            return Response(threading.current_thread().name)
+
+        self.config.add_view(view)
+        router = self._makeApp()
+        status, headers, body = self._call(router)
+        self.assertEqual(status, 200)
+        self.assertNotEqual(body, threading.current_thread().name.encode())
+        self.assertEqual(router.executor._max_workers, 40)
+
+    def test_async_view_threadlocals_after_await(self):
+        import asyncio
+        from pyramid.response import Response
+        from pyramid.threadlocal import get_current_registry
+        from pyramid.threadlocal import get_current_request
+
+        async def view(request):
+            await asyncio.sleep(0)
+            self.assertTrue(get_current_request() is request)
+            self.assertTrue(get_current_registry() is request.registry)
+            return Response('ok')
+
+        self.config.add_view(view)
+        status, headers, body = self._call(self._makeApp())
+        self.assertEqual(status, 200)
+
+    def test_route_and_traverse_in_thread_pool(self):
+        import threading
+        from pyramid.events import ContextFound, NewRequest
+        from pyramid.threadlocal import get_current_request
+
+        threads = []
+
+        def subscriber(event):
+            self.assertTrue(get_current_request() is event.request)
+            threads.append(threading.current_thread())
+
+        def root_factory(request):
+            threads.append(threading.current_thread())
+            return testing.DummyResource()
+
+        self.config.add_subscriber(subscriber, NewRequest)
+        self.config.add_subscriber(subscriber, ContextFound)
+        self.config.set_root_factory(root_factory)
+        self.config.add_view(lambda request: 'ok', renderer='string')
+        status, headers, body = self._call(self._makeApp())
+        self.assertEqual(body, b'ok')
+        self.assertEqual(len(threads), 3)
+        self.assertFalse(threading.current_thread() in threads)
+
+    def test_async_view_with_renderer(self):
+        async def view(request):
+            return {'a': 1}
+
+        self.config.add_view(view, renderer='json', http_cache=60)
+        status, headers, body = self._call(self._makeApp())
+        self.assertEqual(body, b'{"a": 1}')
+        self.assertEqual(headers[b'cache-control'], b'max-age=60')
+
+    def test_async_class_view(self):
+        from pyramid.response import Response
+
+        class View(object):
+            def __init__(self, request):
+                self.request = request
+
+            async def get(self):
+                return Response('class')
+
+        self.config.add_view(View, attr='get')
+        router = self._makeApp()
+        self.assertEqual(self._call(router)[2], b'class')
+
+    def test_async_view_exception_handled_by_exception_view(self):
+        from pyramid.response import Response
+
+        async def view(request):
+            raise ValueError
+
+        async def excview(exc, request):
+            return Response('handled', status=500)
+
+        self.config.add_view(view)
+        self.config.add_exception_view(excview, context=ValueError)
+        status, headers, body = self._call(self._makeApp())
+        self.assertEqual(status, 500)
+        self.assertEqual(body, b'handled')
+
+    def test_not_found(self):
+        status, headers, body = self._call(self._makeApp(), '/missing')
+        self.assertEqual(status, 404)
+
+    def test_callbacks(self):
+        from pyramid.response import Response
+
+        calls = []
+
+        async def async_callback(request, response):
+            calls.append('async response')
+
+        def finished_callback(request):
+            calls.append('finished')
+
+        async def view(request):
+            request.add_response_callback(async_callback)
+            request.add_finished_callback(finished_callback)
+            return Response('ok')
+
+        self.config.add_view(view)
+        self._call(self._makeApp())
+        self.assertEqual(calls, ['async response', 'finished'])
+
+    def test_new_response_event(self):
+        from pyramid.events import NewResponse
+        from pyramid.response import Response
+
+        events = []
+        self.config.add_subscriber(events.append, NewResponse)
+
+        async def view(request):
+            return Response('ok')
+
+        self.config.add_view(view)
+        self._call(self._makeApp())
+        self.assertEqual(len(events), 1)
+
+    def test_sync_tween_runs_rest_of_chain_in_thread_pool(self):
+        import threading
+        from pyramid.response import Response
+
+        async def view(request):
+            return Response(threading.current_thread().name)
+
+        self.config.add_view(view)
+        self.config.add_tween('tests.test_router.dummy_sync_tween_factory')
+        status, headers, body = self._call(self._makeApp())
+        self.assertEqual(body, threading.current_thread().name.encode())
+        self.assertNotEqual(
+            headers[b'x-tween-thread'],
+            threading.current_thread().name.encode(),
+        )
+
+    def test_request_body(self):
+        from pyramid.response import Response
+
+        async def view(request):
+            return Response(request.body)
+
+        self.config.add_view(view)
+        result = self._call(self._makeApp(), method='POST', body=b'abc')
+        self.assertEqual(result[2], b'abc')
+
+    def test_client_disconnect(self):
+        import asyncio
+
+        router = self._makeApp()
+        messages = [{'type': 'http.disconnect'}]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)  # pragma: no cover
+
+        scope = {'type': 'http', 'method': 'GET', 'path': '/'}
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(router.asgi(scope, receive, send))
+        finally:
+            loop.close()
+        self.assertEqual(sent, [])
+
+    def test_lifespan(self):
+        import asyncio
+
+        router = self._makeApp()
+        executor = router.executor
+        messages = [
+            {'type': 'lifespan.startup'},
+            {'type': 'lifespan.shutdown'},
+        ]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(
+                router.asgi({'type': 'lifespan'}, receive, send)
+            )
+        finally:
+            loop.close()
+        self.assertEqual(
+            sent,
+            [
+                {'type': 'lifespan.startup.complete'},
+                {'type': 'lifespan.shutdown.complete'},
+            ],
+        )
+        self.assertFalse(router.executor is executor)
+
+    def test_unsupported_scope(self):
+        import asyncio
+
+        router = self._makeApp()
+        loop = asyncio.new_event_loop()
+        try:
+            self.assertRaises(
+                ValueError,
+                loop.run_until_complete,
+                router.asgi({'type': 'websocket'}, None, None),
+            )
+        finally:
+            loop.close()
+
+    def test_async_view_returning_response_with_renderer(self):
+        from pyramid.response import Response
+
+        async def view(request):
+            return Response(b'body')
+
+        self.config.add_view(view, renderer='json')
+        status, headers, body = self._call(self._makeApp())
+        self.assertEqual(body, b'body')
+
+    def test_without_tweens(self):
+        from pyramid.interfaces import ITweens
+
+        async def view(request):
+            return request.response
+
+        self.config.add_view(view)
+        self.config.commit()
+        self.config.registry.unregisterUtility(provided=ITweens)
+        router = self._makeApp()
+        self.assertEqual(
+            router.async_request_handler, router.handle_request_async
+        )
+        status, headers, body = self._call(router)
+        self.assertEqual(status, 200)
+
+    def test_custom_tweens(self):
+        from pyramid.interfaces import ITweens
+
+        def tweens(handler, registry):
+            return dummy_sync_tween_factory(handler, registry)
+
+        async def view(request):
+            return request.response
+
+        self.config.add_view(view)
+        self.config.commit()
+        self.config.registry.registerUtility(tweens, ITweens)
+        status, headers, body = self._call(self._makeApp())
+        self.assertTrue(b'x-tween-thread' in headers)
+
+    def test_request_extensions(self):
+        from pyramid.response import Response
+
+        async def view(request):
+            return Response(request.foo)
+
+        self.config.add_request_method(lambda r: 'foo', 'foo', reify=True)
+        self.config.add_view(view)
+        status, headers, body = self._call(self._makeApp())
+        self.assertEqual(body, b'foo')
+
+    def test_invoke_request_async_without_tweens(self):
+        import asyncio
+        from pyramid.request import Request
+        from pyramid.response import Response
+
+        async def view(request):
+            return Response(b'body')
+
+        self.config.add_tween('tests.test_router.dummy_sync_tween_factory')
+        self.config.add_view(view)
+        router = self._makeApp()
+        request = Request.blank('/')
+        request.registry = router.registry
+        loop = asyncio.new_event_loop()
+        try:
+            request.environ['pyramid.asgi.loop'] = loop
+            response = loop.run_until_complete(
+                router.invoke_request_async(request, _use_tweens=False)
+            )
+        finally:
+            loop.close()
+        self.assertEqual(response.body, b'body')
+        self.assertFalse('X-Tween-Thread' in response.headers)
+
+    def test_asgi_max_threads_setting(self):
+        from pyramid.config import Configurator
+
+        self.config = Configurator(settings={'asgi_max_threads': '3'})
+        router = self._makeApp()
+        self.assertEqual(router.executor._max_workers, 3)
+
+
+def dummy_sync_tween_factory(handler, registry):
+    import threading
+
+    def tween(request):
+        response = handler(request)
+        response.headers['X-Tween-Thread'] = threading.current_thread().name
+        return response
+
+    return tween
+
+
 class DummyPredicate(object):
     def __call__(self, info, request):
         return True
@@ -1699,6 +2283,14 @@ class DummyResponse(object):
         return self.app_iter
 
 
+class DummyTracer:
+    def __init__(self):
+        self.steps = []
+
+    def __call__(self, request, step, timing):
+        self.steps.append((request, step, timing))
+
+
 class DummyLogger:
     def __init__(self):
         self.messages = []
@@ -53,6 +53,37 @@ class TestPTweensCommand(unittest.TestCase):
             'used)',
         )
 
+    def test_command_request_timings(self):
+        from pyramid.instrumentation import RequestTimings
+
+        command = self._makeOne()
+        registry = dummy.DummyRegistry()
+        registry.request_timings = timings = RequestTimings()
+        command.bootstrap = dummy.DummyBootstrap(registry=registry)
+        tweens = dummy.DummyTweens([('name', 'item')], None)
+        command._get_tweens = lambda *arg: tweens
+        timings.tween('name').add(0.003)
+        timings.tween('name').add(0.005)
+        timings.tween('MAIN').add(0.001)
+        timings.tween('MAIN').add(0.003)
+        timings.phase('view_call').add(0.002)
+        L = []
+        command.out = L.append
+        result = command.run()
+        self.assertEqual(result, 0)
+        self.assertEqual(L[4].split()[:2], ['Position', 'Name'])
+        self.assertEqual(L[6], '-           INGRESS')
+        self.assertEqual(
+            L[7].split(), ['0', 'name', '2', '4.000', '2.000', '5.000']
+        )
+        self.assertEqual(
+            L[8].split(), ['-', 'MAIN', '2', '2.000', '2.000', '3.000']
+        )
+        self.assertEqual(L[10], 'Request Phases')
+        self.assertIn(
+            ['view_call', '1', '2.000', '2.000'], [line.split() for line in L]
+        )
+
     def test__get_tweens(self):
         command = self._makeOne()
         registry = dummy.DummyRegistry()
@@ -429,6 +429,29 @@ class TestPViewsCommand(unittest.TestCase):
         self.assertEqual(L[8], '    tests.test_scripts.dummy.DummyView')
         self.assertEqual(L[9], '    view predicates (predicate = x)')
 
+    def test_views_command_single_view_traversal_with_deriver_plan(self):
+        from pyramid.registry import Registry
+
+        registry = Registry()
+        command = self._makeOne(registry=registry)
+        L = []
+        command.out = L.append
+        view = dummy.DummyView(context='context', view_name='a')
+        view.__deriver_plan__ = (
+            ('predicated_view', 'secured_view'),
+            ('mapped_view',),
+        )
+        command._find_view = lambda arg1: view
+        command.args.config_uri = '/foo/bar/myapp.ini#myapp'
+        command.args.url = '/a'
+        result = command.run()
+        self.assertEqual(result, 0)
+        self.assertEqual(L[8], '    tests.test_scripts.dummy.DummyView')
+        self.assertEqual(
+            L[9],
+            '    view derivers (predicated_view + secured_view > mapped_view)',
+        )
+
     def test_views_command_single_view_route(self):
         from pyramid.registry import Registry
 
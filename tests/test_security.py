@@ -32,6 +32,11 @@ class TestAllPermissionsList(unittest.TestCase):
         other = object()
         self.assertFalse(thing.__eq__(other))
 
+    def test_hash(self):
+        thing = self._makeOne()
+        other = self._makeOne()
+        self.assertEqual(hash(thing), hash(other))
+
     def test_contains_w_string(self):
         thing = self._makeOne()
         self.assertTrue('anything' in thing)
@@ -465,6 +470,71 @@ class TestHasPermission(unittest.TestCase):
         self.assertRaises(AttributeError, request.has_permission, 'view')
 
 
+class TestHasPermissions(unittest.TestCase):
+    def setUp(self):
+        testing.setUp()
+
+    def tearDown(self):
+        testing.tearDown()
+
+    def _makeOne(self):
+        from pyramid.security import SecurityAPIMixin
+        from pyramid.registry import Registry
+
+        mixin = SecurityAPIMixin()
+        mixin.registry = Registry()
+        mixin.context = object()
+        return mixin
+
+    def test_no_security_policy(self):
+        request = self._makeOne()
+        result = request.has_permissions('view', [object(), object()])
+        self.assertEqual(len(result), 2)
+        self.assertTrue(all(result))
+        self.assertEqual(result[0].msg, 'No security policy in use.')
+
+    def test_with_security_registered(self):
+        request = self._makeOne()
+        policy = _registerSecurityPolicy(request.registry, 'yo')
+        calls = []
+
+        def permits(request, context, permission):
+            calls.append((context, permission))
+            return permission
+
+        policy.permits = permits
+        result = request.has_permissions('view', iter(['a', 'b']))
+        self.assertEqual(result, ['view', 'view'])
+        self.assertEqual(calls, [('a', 'view'), ('b', 'view')])
+
+    def test_none_context_is_request_context(self):
+        request = self._makeOne()
+        policy = _registerSecurityPolicy(request.registry, 'yo')
+        calls = []
+
+        def permits(request, context, permission):
+            calls.append(context)
+            return True
+
+        policy.permits = permits
+        request.has_permissions('view', ['a', None])
+        self.assertEqual(calls, ['a', request.context])
+
+    def test_with_permits_many(self):
+        request = self._makeOne()
+        policy = _registerSecurityPolicy(request.registry, 'yo')
+        calls = []
+
+        def permits_many(req, contexts, permission):
+            calls.append((req, contexts, permission))
+            return [True] * len(contexts)
+
+        policy.permits_many = permits_many
+        result = request.has_permissions('view', ['a', None])
+        self.assertEqual(result, [True, True])
+        self.assertEqual(calls, [(request, ['a', request.context], 'view')])
+
+
 class TestLegacySecurityPolicy(unittest.TestCase):
     def setUp(self):
         testing.setUp()
@@ -519,6 +589,32 @@ class TestLegacySecurityPolicy(unittest.TestCase):
 
         self.assertTrue(policy.permits(request, request.context, 'permission'))
 
+    def test_permits_many(self):
+        from pyramid.security import LegacySecurityPolicy
+
+        request = _makeRequest()
+        policy = LegacySecurityPolicy()
+        authn = _registerAuthenticationPolicy(request.registry, ['p1', 'p2'])
+        _registerAuthorizationPolicy(request.registry, True)
+        calls = []
+        authn.effective_principals = lambda request: calls.append(request)
+
+        result = policy.permits_many(request, ['a', 'b'], 'view')
+        self.assertEqual(result, [True, True])
+        self.assertEqual(calls, [request])
+
+    def test_permits_many_authz_permits_many(self):
+        from pyramid.security import LegacySecurityPolicy
+
+        request = _makeRequest()
+        policy = LegacySecurityPolicy()
+        _registerAuthenticationPolicy(request.registry, ['p1', 'p2'])
+        authz = _registerAuthorizationPolicy(request.registry, True)
+        authz.permits_many = lambda *arg: arg
+
+        result = policy.permits_many(request, ['a'], 'view')
+        self.assertEqual(result, (['a'], ['p1', 'p2'], 'view'))
+
 
 _TEST_HEADER = 'X-Pyramid-Test'
 
@@ -142,6 +142,101 @@ class SharedCookieSessionTests(object):
         self.assertEqual(session._set_cookie(response), True)
         self.assertEqual(response.headerlist[-1][0], 'Set-Cookie')
 
+    def _reload(self, session, response, **kw):
+        # load the cookie set on ``response`` in a new request
+        request = testing.DummyRequest()
+        cookie = response.headers['Set-Cookie'].split(';')[0]
+        request.cookies['session'] = cookie.split('=', 1)[1].strip('"')
+        return type(session)(request)
+
+    def test__set_cookie_unchanged_skipped(self):
+        import webob
+
+        request = testing.DummyRequest()
+        session = self._makeOne(request, reissue_time=10)
+        session['abc'] = 'x'
+        response = webob.Response()
+        self.assertEqual(session._set_cookie(response), True)
+        session = self._reload(session, response)
+        session['abc'] = 'x'
+        self.assertTrue(session._dirty)
+        response = webob.Response()
+        self.assertEqual(session._set_cookie(response), False)
+        self.assertFalse('Set-Cookie' in response.headers)
+        self.assertEqual(
+            session.stats(), {'serialized': 2, 'issued': 1, 'skipped': 1}
+        )
+
+    def test__set_cookie_changed_renews_timestamp(self):
+        import webob
+
+        request = testing.DummyRequest()
+        session = self._makeOne(request, reissue_time=10)
+        session['abc'] = 'x'
+        response = webob.Response()
+        session._set_cookie(response)
+        session = self._reload(session, response)
+        session['abc'] = 'y'
+        session.accessed = session.renewed + 5
+        response = webob.Response()
+        self.assertEqual(session._set_cookie(response), True)
+        accessed = session.accessed
+        session = self._reload(session, response)
+        self.assertEqual(session.renewed, accessed)
+        self.assertEqual(dict(session), {'abc': 'y'})
+
+    def test__set_cookie_changed_without_reissue_time_stays_valid(self):
+        import time
+        import webob
+        from pyramid import session as session_module
+
+        now = time.time()
+        request = testing.DummyRequest()
+        cookieval = self._serialize((now - 6, now - 6, {'abc': 'x'}))
+        request.cookies['session'] = cookieval
+        session = self._makeOne(request, timeout=10, reissue_time=None)
+        session['abc'] = 'y'
+        response = webob.Response()
+        self.assertEqual(session._set_cookie(response), True)
+        # load the new cookie once the original one has timed out
+        real_time = session_module.time
+        session_module.time = DummyTime(now + 5)
+        try:
+            session = self._reload(session, response)
+        finally:
+            session_module.time = real_time
+        self.assertEqual(dict(session), {'abc': 'y'})
+
+    def test__set_cookie_renewal_due(self):
+        import time
+        import webob
+
+        request = testing.DummyRequest()
+        cookieval = self._serialize((time.time() - 20, 0, {'state': 1}))
+        request.cookies['session'] = cookieval
+        session = self._makeOne(request, reissue_time=10)
+        self.assertEqual(session['state'], 1)
+        self.assertTrue(session._dirty)
+        response = webob.Response()
+        self.assertEqual(session._set_cookie(response), True)
+        session = self._reload(session, response)
+        self.assertTrue(session.renewed > time.time() - 5)
+        self.assertEqual(session.stats()['skipped'], 0)
+
+    def test__set_cookie_expired_session_reissued(self):
+        import time
+        import webob
+
+        request = testing.DummyRequest()
+        cookieval = self._serialize((time.time() - 20, 0, {}))
+        request.cookies['session'] = cookieval
+        session = self._makeOne(request, timeout=10, reissue_time=None)
+        session['abc'] = 'x'
+        response = webob.Response()
+        self.assertEqual(session._set_cookie(response), True)
+        session = self._reload(session, response)
+        self.assertTrue(session.renewed > time.time() - 5)
+
     def test__set_cookie_options(self):
         from pyramid.response import Response
 
@@ -507,6 +602,571 @@ class TestSignedCookieSession(SharedCookieSessionTests, unittest.TestCase):
         self.assertTrue('Set-Cookie' in dict(response.headerlist))
 
 
+class TestSignedCookieSessionCompact(TestSignedCookieSession):
+    def _makeOne(self, request, **kw):
+        from pyramid.session import CompactJSONSerializer
+
+        kw.setdefault('serializer', CompactJSONSerializer())
+        return TestSignedCookieSession._makeOne(self, request, **kw)
+
+    def _serialize(self, value, salt=b'pyramid.session.', hashalg='sha512'):
+        import base64
+        import hashlib
+        import hmac
+        from pyramid.session import CompactJSONSerializer
+
+        digestmod = lambda: hashlib.new(hashalg)
+        cstruct = CompactJSONSerializer().dumps(value)
+        sig = hmac.new(salt + b'secret', cstruct, digestmod).digest()
+        return base64.urlsafe_b64encode(sig + cstruct).rstrip(b'=')
+
+    def test__set_cookie_cookieval_too_long(self):
+        import binascii
+        import os
+
+        request = testing.DummyRequest()
+        session = self._makeOne(request)
+        session['abc'] = binascii.hexlify(os.urandom(10000)).decode('ascii')
+        response = DummyResponse()
+        self.assertRaises(ValueError, session._set_cookie, response)
+
+    def test_reads_json_cookie(self):
+        import time
+
+        request = testing.DummyRequest()
+        cookieval = TestSignedCookieSession._serialize(
+            self, (time.time(), 0, {'state': 1})
+        )
+        request.cookies['session'] = cookieval
+        session = self._makeOne(request)
+        self.assertEqual(session['state'], 1)
+
+    def test_cookie_is_compact(self):
+        from pyramid.response import Response
+
+        request = testing.DummyRequest()
+        session = self._makeOne(request)
+        session['cart'] = ['item-%d' % i for i in range(100)]
+        response = Response()
+        session._set_cookie(response)
+        compact = response.headers['Set-Cookie']
+        session = TestSignedCookieSession._makeOne(self, request)
+        session['cart'] = ['item-%d' % i for i in range(100)]
+        response = Response()
+        session._set_cookie(response)
+        self.assertTrue(len(compact) * 2 < len(response.headers['Set-Cookie']))
+
+
+class TestCompactJSONSerializer(unittest.TestCase):
+    def _makeOne(self, **kw):
+        from pyramid.session import CompactJSONSerializer
+
+        return CompactJSONSerializer(**kw)
+
+    def test_dumps_small(self):
+        serializer = self._makeOne()
+        result = serializer.dumps({'a': [1, 'b\xe9']})
+        self.assertEqual(result, b'\x01{"a":[1,"b\xc3\xa9"]}')
+        self.assertEqual(serializer.loads(result), {'a': [1, 'b\xe9']})
+
+    def test_dumps_compressed(self):
+        serializer = self._makeOne(compress_threshold=10)
+        value = {'a': 'x' * 100}
+        result = serializer.dumps(value)
+        self.assertEqual(result[:1], b'\x81')
+        self.assertTrue(len(result) < 50)
+        self.assertEqual(serializer.loads(result), value)
+
+    def test_dumps_incompressible(self):
+        serializer = self._makeOne(compress_threshold=0)
+        result = serializer.dumps(1)
+        self.assertEqual(result, b'\x011')
+
+    def test_loads_fallback_json(self):
+        serializer = self._makeOne()
+        self.assertEqual(serializer.loads(b'[1, 2]'), [1, 2])
+
+    def test_loads_fallback_pickle(self):
+        from pyramid.session import PickleSerializer
+
+        serializer = self._makeOne(fallback=PickleSerializer())
+        bstruct = pickle.dumps((1, 2, {'a': 1}))
+        self.assertEqual(serializer.loads(bstruct), (1, 2, {'a': 1}))
+
+    def test_loads_no_fallback(self):
+        serializer = self._makeOne(fallback=None)
+        self.assertRaises(ValueError, serializer.loads, b'[1, 2]')
+
+    def test_loads_invalid_json(self):
+        serializer = self._makeOne()
+        self.assertRaises(ValueError, serializer.loads, b'\x01{')
+
+    def test_loads_invalid_compressed_data(self):
+        serializer = self._makeOne()
+        self.assertRaises(ValueError, serializer.loads, b'\x81abc')
+
+    def test_loads_too_large(self):
+        serializer = self._makeOne(compress_threshold=0, max_size=100)
+        bstruct = serializer.dumps('x' * 1000)
+        self.assertRaises(ValueError, serializer.loads, bstruct)
+
+
+class TestServerSideSession(unittest.TestCase):
+    def _makeOne(self, request, store=None, **kw):
+        from pyramid.session import ServerSideSessionFactory
+
+        if store is None:
+            store = DummySessionStore()
+        self.store = store
+        return ServerSideSessionFactory(store, **kw)(request)
+
+    def _makeRequest(self, session_id=None):
+        request = testing.DummyRequest()
+        if session_id is not None:
+            request.cookies['session'] = session_id
+        return request
+
+    def _respond(self, request):
+        from pyramid.response import Response
+
+        response = Response()
+        for callback in request.response_callbacks:
+            callback(request, response)
+        return response
+
+    def _store(self, state, renewed=None, created=0):
+        import time
+
+        if renewed is None:
+            renewed = time.time()
+        session_id = 'a' * 64
+        self.store.sessions[session_id] = (dict(state), created, renewed)
+        return session_id
+
+    def test_instance_conforms(self):
+        from zope.interface.verify import verifyObject
+        from pyramid.interfaces import ISession
+
+        session = self._makeOne(self._makeRequest())
+        verifyObject(ISession, session)
+
+    def test_ctor_no_cookie(self):
+        request = self._makeRequest()
+        session = self._makeOne(request)
+        self.assertEqual(dict(session), {})
+        self.assertTrue(session.new)
+        self.assertEqual(len(session.session_id), 64)
+        self.assertEqual(self.store.loaded, [])
+        self.assertEqual(list(request.response_callbacks), [])
+
+    def test_ctor_bad_cookie(self):
+        session = self._makeOne(self._makeRequest('../etc/passwd'))
+        self.assertTrue(session.new)
+        self.assertEqual(self.store.loaded, [])
+
+    def test_loads_lazily(self):
+        session = self._makeOne(self._makeRequest('a' * 64))
+        session_id = self._store({'a': 1}, created=5)
+        self.assertEqual(self.store.loaded, [])
+        self.assertEqual(session['a'], 1)
+        self.assertEqual(session.get('a'), 1)
+        self.assertEqual(self.store.loaded, [session_id])
+        self.assertFalse(session.new)
+        self.assertEqual(session.created, 5)
+        self.assertEqual(session.session_id, session_id)
+
+    def test_unknown_session(self):
+        session = self._makeOne(self._makeRequest('a' * 64))
+        self.assertEqual(dict(session), {})
+        self.assertTrue(session.new)
+        self.assertNotEqual(session.session_id, 'a' * 64)
+
+    def test_timed_out_session(self):
+        self._makeOne(self._makeRequest())
+        session_id = self._store({'a': 1}, renewed=0)
+        session = self._makeOne(self._makeRequest(session_id), self.store)
+        self.assertEqual(dict(session), {})
+        self.assertTrue(session.new)
+        self.assertNotEqual(session.session_id, session_id)
+
+    def test_timeout_None(self):
+        self._makeOne(self._makeRequest())
+        session_id = self._store({'a': 1}, renewed=0)
+        session = self._makeOne(
+            self._makeRequest(session_id), self.store, timeout=None
+        )
+        self.assertEqual(dict(session), {'a': 1})
+
+    def test_new_session_saved_with_cookie(self):
+        request = self._makeRequest()
+        session = self._makeOne(request, timeout=60)
+        session['a'] = 1
+        response = self._respond(request)
+        saved = self.store.saved[0]
+        self.assertEqual(saved[0], session.session_id)
+        self.assertEqual(saved[1], {'a': 1})
+        self.assertEqual(saved[2], set())
+        self.assertEqual(saved[5], 60)
+        cookie = response.headers['Set-Cookie']
+        self.assertTrue(cookie.startswith('session=%s;' % session.session_id))
+
+    def test_empty_new_session_not_saved(self):
+        request = self._makeRequest()
+        session = self._makeOne(request)
+        session['a'] = 1
+        del session['a']
+        response = self._respond(request)
+        self.assertEqual(self.store.saved, [])
+        self.assertFalse('Set-Cookie' in response.headers)
+
+    def test_only_changed_keys_saved(self):
+        self._makeOne(self._makeRequest())
+        session_id = self._store({'a': 1, 'b': 2, 'c': 3})
+        request = self._makeRequest(session_id)
+        session = self._makeOne(request, self.store, reissue_time=None)
+        session['a'] = 10
+        del session['b']
+        session.update(d=4)
+        response = self._respond(request)
+        self.assertEqual(self.store.saved[0][1], {'a': 10, 'd': 4})
+        self.assertEqual(self.store.saved[0][2], {'b'})
+        self.assertFalse('Set-Cookie' in response.headers)
+        self.assertEqual(
+            self.store.sessions[session_id][0], {'a': 10, 'c': 3, 'd': 4}
+        )
+
+    def test_pop_popitem_clear_setdefault(self):
+        self._makeOne(self._makeRequest())
+        session_id = self._store({'a': 1, 'b': 2})
+        request = self._makeRequest(session_id)
+        session = self._makeOne(request, self.store)
+        self.assertEqual(session.pop('a'), 1)
+        self.assertEqual(session.pop('x', None), None)
+        self.assertEqual(session.popitem(), ('b', 2))
+        session.setdefault('c', []).append(1)
+        session['d'] = 1
+        session.clear()
+        session['e'] = 1
+        self._respond(request)
+        self.assertEqual(self.store.saved[0][1], {'e': 1})
+        self.assertEqual(self.store.saved[0][2], {'a', 'b', 'c', 'd'})
+
+    def test_pop_missing_key_not_saved(self):
+        self._makeOne(self._makeRequest())
+        session_id = self._store({'a': 1})
+        request = self._makeRequest(session_id)
+        session = self._makeOne(request, self.store, reissue_time=None)
+        self.assertEqual(session.pop('x', None), None)
+        self.assertRaises(KeyError, session.pop, 'x')
+        self.assertEqual(list(request.response_callbacks), [])
+
+    def test_pop_flash_empty_not_saved(self):
+        request = self._makeRequest()
+        session = self._makeOne(request)
+        self.assertEqual(session.pop_flash(), [])
+        self.assertEqual(list(request.response_callbacks), [])
+        self._respond(request)
+        self.assertEqual(self.store.saved, [])
+
+    def test_changed_saves_all_keys(self):
+        self._makeOne(self._makeRequest())
+        session_id = self._store({'a': [1], 'b': 2})
+        request = self._makeRequest(session_id)
+        session = self._makeOne(request, self.store)
+        session['a'].append(2)
+        session.changed()
+        self._respond(request)
+        self.assertEqual(self.store.saved[0][1], {'a': [1, 2], 'b': 2})
+
+    def test_reissue(self):
+        self._makeOne(self._makeRequest())
+        session_id = self._store({'a': 1}, renewed=0)
+        request = self._makeRequest(session_id)
+        session = self._makeOne(
+            request, self.store, timeout=None, reissue_time=10
+        )
+        self.assertEqual(session['a'], 1)
+        response = self._respond(request)
+        self.assertEqual(self.store.saved[0][1], {})
+        self.assertTrue(self.store.saved[0][4] > 0)
+        self.assertFalse('Set-Cookie' in response.headers)
+
+    def test_reissue_with_max_age_sets_cookie(self):
+        self._makeOne(self._makeRequest())
+        session_id = self._store({'a': 1}, renewed=0)
+        request = self._makeRequest(session_id)
+        session = self._makeOne(
+            request, self.store, timeout=None, reissue_time=10, max_age=100
+        )
+        self.assertEqual(session['a'], 1)
+        response = self._respond(request)
+        self.assertTrue('Max-Age=100' in response.headers['Set-Cookie'])
+
+    def test_no_reissue_before_reissue_time(self):
+        self._makeOne(self._makeRequest())
+        session_id = self._store({'a': 1})
+        request = self._makeRequest(session_id)
+        session = self._makeOne(request, self.store, reissue_time=10)
+        self.assertEqual(session['a'], 1)
+        self.assertEqual(list(request.response_callbacks), [])
+
+    def test_invalidate(self):
+        self._makeOne(self._makeRequest())
+        session_id = self._store({'a': 1})
+        request = self._makeRequest(session_id)
+        session = self._makeOne(request, self.store)
+        session.invalidate()
+        self.assertEqual(self.store.deleted, [session_id])
+        self.assertEqual(dict(session), {})
+        self.assertTrue(session.new)
+        self.assertNotEqual(session.session_id, session_id)
+        response = self._respond(request)
+        self.assertTrue(response.headers['Set-Cookie'].startswith('session=;'))
+        self.assertEqual(self.store.saved, [])
+
+    def test_invalidate_then_set(self):
+        self._makeOne(self._makeRequest())
+        session_id = self._store({'a': 1})
+        request = self._makeRequest(session_id)
+        session = self._makeOne(request, self.store)
+        session.invalidate()
+        session['b'] = 2
+        response = self._respond(request)
+        self.assertEqual(self.store.saved[0][0], session.session_id)
+        self.assertEqual(self.store.saved[0][1], {'b': 2})
+        self.assertTrue(
+            response.headers['Set-Cookie'].startswith(
+                'session=%s;' % session.session_id
+            )
+        )
+
+    def test_set_on_exception_false(self):
+        request = self._makeRequest()
+        request.exception = Exception()
+        session = self._makeOne(request, set_on_exception=False)
+        session['a'] = 1
+        self._respond(request)
+        self.assertEqual(self.store.saved, [])
+
+    def test_flash(self):
+        request = self._makeRequest()
+        session = self._makeOne(request)
+        session.flash('msg1')
+        session.flash('msg1', allow_duplicate=False)
+        session.flash('msg2', 'q')
+        self.assertEqual(session.peek_flash(), ['msg1'])
+        self.assertEqual(session.pop_flash('q'), ['msg2'])
+        self._respond(request)
+        self.assertEqual(self.store.saved[0][1], {'_f_': ['msg1']})
+        self.assertEqual(self.store.saved[0][2], {'_f_q'})
+
+    def test_get_csrf_token(self):
+        request = self._makeRequest()
+        session = self._makeOne(request)
+        token = session.get_csrf_token()
+        self.assertEqual(len(token), 40)
+        self.assertEqual(session['_csrft_'], token)
+        self.assertEqual(session.get_csrf_token(), token)
+        self._respond(request)
+        self.assertEqual(self.store.saved[0][1], {'_csrft_': token})
+
+    def test_get_csrf_token_stored(self):
+        self._makeOne(self._makeRequest())
+        session_id = self._store({'_csrft_': 'token'})
+        request = self._makeRequest(session_id)
+        session = self._makeOne(request, self.store)
+        self.assertEqual(session.get_csrf_token(), 'token')
+
+    def test_new_csrf_token(self):
+        self._makeOne(self._makeRequest())
+        session_id = self._store({'_csrft_': 'token'})
+        request = self._makeRequest(session_id)
+        session = self._makeOne(request, self.store)
+        token = session.new_csrf_token()
+        self.assertNotEqual(token, 'token')
+        self.assertEqual(session.get_csrf_token(), token)
+        self._respond(request)
+        self.assertEqual(self.store.saved[0][1], {'_csrft_': token})
+
+    def test_csrf_storage_policy(self):
+        from pyramid.csrf import LegacySessionCSRFStoragePolicy
+
+        request = self._makeRequest()
+        request.session = self._makeOne(request)
+        policy = LegacySessionCSRFStoragePolicy()
+        token = policy.get_csrf_token(request)
+        self.assertEqual(request.session['_csrft_'], token)
+        self.assertTrue(policy.check_csrf_token(request, token))
+        self.assertEqual(
+            policy.new_csrf_token(request), request.session['_csrft_']
+        )
+
+    def test_with_memory_store(self):
+        from pyramid.session import MemorySessionStore
+
+        store = MemorySessionStore()
+        request = self._makeRequest()
+        session = self._makeOne(request, store)
+        session['a'] = {'b': 1}
+        self._respond(request)
+        request = self._makeRequest(session.session_id)
+        session = self._makeOne(request, store)
+        self.assertEqual(session['a'], {'b': 1})
+        self.assertFalse(session.new)
+
+
+class TestMemorySessionStore(unittest.TestCase):
+    def _makeOne(self, **kw):
+        from pyramid.session import MemorySessionStore
+
+        return MemorySessionStore(**kw)
+
+    def test_instance_conforms(self):
+        from zope.interface.verify import verifyObject
+        from pyramid.interfaces import ISessionStore
+
+        verifyObject(ISessionStore, self._makeOne())
+
+    def test_load_missing(self):
+        self.assertEqual(self._makeOne().load('a'), None)
+
+    def test_save_and_load(self):
+        import time
+
+        store = self._makeOne()
+        now = time.time()
+        store.save('a', {'x': [1], 'y': 2}, (), 1, now, 10)
+        state, created, renewed = store.load('a')
+        self.assertEqual(state, {'x': [1], 'y': 2})
+        self.assertEqual((created, renewed), (1, now))
+        state['x'].append(2)
+        store.save('a', {'z': 3}, ('y', 'w'), 1, now, 10)
+        self.assertEqual(store.load('a')[0], {'x': [1], 'z': 3})
+
+    def test_timed_out(self):
+        store = self._makeOne()
+        store.save('a', {'x': 1}, (), 0, 0, 10)
+        self.assertEqual(store.load('a'), None)
+        self.assertFalse('a' in store.sessions)
+
+    def test_timeout_None(self):
+        store = self._makeOne()
+        store.save('a', {'x': 1}, (), 0, 0, None)
+        self.assertEqual(store.load('a'), ({'x': 1}, 0, 0))
+
+    def test_bounded(self):
+        store = self._makeOne(maxsize=1)
+        store.save('a', {'x': 1}, (), 0, 0, None)
+        store.save('b', {'x': 1}, (), 0, 0, None)
+        self.assertEqual(store.load('a'), None)
+        self.assertEqual(len(store.sessions), 1)
+
+    def test_delete(self):
+        store = self._makeOne()
+        store.save('a', {'x': 1}, (), 0, 0, None)
+        store.delete('a')
+        store.delete('b')
+        self.assertEqual(store.load('a'), None)
+
+
+class TestDBMSessionStore(unittest.TestCase):
+    def setUp(self):
+        import shutil
+        import tempfile
+
+        self.tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tempdir)
+
+    def _makeOne(self, **kw):
+        import os
+        from pyramid.session import DBMSessionStore
+
+        store = DBMSessionStore(os.path.join(self.tempdir, 'sessions'), **kw)
+        self.addCleanup(store.close)
+        return store
+
+    def test_instance_conforms(self):
+        from zope.interface.verify import verifyObject
+        from pyramid.interfaces import ISessionStore
+
+        verifyObject(ISessionStore, self._makeOne())
+
+    def test_save_and_load(self):
+        store = self._makeOne()
+        self.assertEqual(store.load('a'), None)
+        store.save('a', {'x': 1, 'y': 2}, (), 1, 2, None)
+        store.save('a', {'z': 3}, ('y',), 1, 3, None)
+        store.close()
+        store = self._makeOne()
+        self.assertEqual(store.load('a'), ({'x': 1, 'z': 3}, 1, 3))
+
+    def test_timed_out(self):
+        store = self._makeOne()
+        store.save('a', {'x': 1}, (), 0, 0, 10)
+        self.assertEqual(store.load('a'), None)
+        self.assertEqual(store.load('a'), None)
+
+    def test_delete(self):
+        store = self._makeOne()
+        store.save('a', {'x': 1}, (), 0, 0, None)
+        store.delete('a')
+        store.delete('a')
+        self.assertEqual(store.load('a'), None)
+
+    def test_purge(self):
+        import time
+
+        store = self._makeOne()
+        store.save('a', {'x': 1}, (), 0, 0, 10)
+        store.save('b', {'x': 1}, (), 0, time.time(), 10)
+        store.save('c', {'x': 1}, (), 0, 0, None)
+        store.purge()
+        self.assertEqual(sorted(store._open().keys()), [b'b', b'c'])
+
+    def test_close_unopened(self):
+        store = self._makeOne()
+        store.close()
+        self.assertEqual(store._db, None)
+
+
+class TestRedisSessionStore(unittest.TestCase):
+    def _makeOne(self, **kw):
+        from pyramid.session import RedisSessionStore
+
+        self.client = DummyRedis()
+        return RedisSessionStore(self.client, **kw)
+
+    def test_instance_conforms(self):
+        from zope.interface.verify import verifyObject
+        from pyramid.interfaces import ISessionStore
+
+        verifyObject(ISessionStore, self._makeOne())
+
+    def test_save_and_load(self):
+        store = self._makeOne()
+        self.assertEqual(store.load('a'), None)
+        store.save('a', {'x': 1, 'y': 2}, (), 1.5, 2.5, 10)
+        self.assertEqual(self.client.expires['session:a'], 10)
+        store.save('a', {'z': 3}, ('y', 'z'), 1.5, 3.5, None)
+        self.assertFalse('session:a' in self.client.expires)
+        self.assertEqual(store.load('a'), ({'x': 1, 'z': 3}, 1.5, 3.5))
+        self.assertEqual(
+            self.client.hashes['session:a'][b'k:x'],
+            b'1',
+        )
+
+    def test_load_incomplete(self):
+        store = self._makeOne(prefix='s:')
+        self.client.hashes['s:a'] = {b'k:x': b'1'}
+        self.assertEqual(store.load('a'), None)
+
+    def test_delete(self):
+        store = self._makeOne()
+        store.save('a', {'x': 1}, (), 0, 0, None)
+        store.delete('a')
+        self.assertEqual(store.load('a'), None)
+
+
 class Test_manage_accessed(unittest.TestCase):
     def _makeOne(self, wrapped):
         from pyramid.session import manage_accessed
@@ -637,3 +1297,72 @@ class DummySessionFactory(dict):
 class DummyResponse(object):
     def __init__(self):
         self.headerlist = []
+
+
+class DummyTime(object):
+    def __init__(self, now):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+class DummySessionStore(object):
+    def __init__(self):
+        self.sessions = {}
+        self.loaded = []
+        self.saved = []
+        self.deleted = []
+
+    def load(self, session_id):
+        self.loaded.append(session_id)
+        return self.sessions.get(session_id)
+
+    def save(self, session_id, changed, deleted, created, renewed, timeout):
+        self.saved.append(
+            (session_id, changed, set(deleted), created, renewed, timeout)
+        )
+        state = dict(self.sessions.get(session_id, ({},))[0])
+        for key in deleted:
+            state.pop(key, None)
+        state.update(changed)
+        self.sessions[session_id] = (state, created, renewed)
+
+    def delete(self, session_id):
+        self.deleted.append(session_id)
+        self.sessions.pop(session_id, None)
+
+
+class DummyRedis(object):
+    def __init__(self):
+        self.hashes = {}
+        self.expires = {}
+
+    def hgetall(self, name):
+        return dict(self.hashes.get(name, {}))
+
+    def delete(self, name):
+        self.hashes.pop(name, None)
+
+    def pipeline(self):
+        return self
+
+    def hset(self, name, mapping):
+        hash = self.hashes.setdefault(name, {})
+        for key, value in mapping.items():
+            if not isinstance(value, bytes):
+                value = str(value).encode('utf-8')
+            hash[key.encode('utf-8')] = value
+
+    def hdel(self, name, *keys):
+        for key in keys:
+            self.hashes[name].pop(key.encode('utf-8'), None)
+
+    def expire(self, name, seconds):
+        self.expires[name] = seconds
+
+    def persist(self, name):
+        self.expires.pop(name, None)
+
+    def execute(self):
+        pass
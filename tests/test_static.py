@@ -551,6 +551,302 @@ class Test_static_view_content_encodings(unittest.TestCase):
         self.assertIsNot(result1, result2)
 
 
+class Test_static_view_memory_cache(unittest.TestCase):
+    def _getTargetClass(self):
+        from pyramid.static import static_view
+
+        return static_view
+
+    def _makeOne(self, *arg, **kw):
+        return self._getTargetClass()(*arg, **kw)
+
+    def _makeRequest(self, kw=None):
+        from pyramid.request import Request
+
+        environ = {
+            'wsgi.url_scheme': 'http',
+            'wsgi.version': (1, 0),
+            'SERVER_NAME': 'example.com',
+            'SERVER_PORT': '6543',
+            'PATH_INFO': '/',
+            'SCRIPT_NAME': '',
+            'REQUEST_METHOD': 'GET',
+        }
+        if kw is not None:
+            environ.update(kw)
+        return Request(environ=environ)
+
+    def test_ctor_defaultargs(self):
+        inst = self._makeOne('tests:fixtures/static')
+        self.assertEqual(inst.memory_cache, None)
+        self.assertEqual(inst.memory_cache_max_file_size, 65536)
+
+    def test_call_serves_from_memory(self):
+        inst = self._makeOne('tests:fixtures/static', memory_cache_size=10)
+        uncached = self._makeOne('tests:fixtures/static')
+        request = self._makeRequest({'PATH_INFO': '/index.html'})
+        context = DummyContext()
+        expected = uncached(context, request)
+        response = inst(context, request)
+        self.assertEqual(response.body, expected.body)
+        self.assertEqual(response.content_type, expected.content_type)
+        self.assertEqual(response.content_length, expected.content_length)
+        self.assertEqual(response.last_modified, expected.last_modified)
+        self.assertEqual(response.cache_control.max_age, 3600)
+        self.assertTrue(response.etag)
+        self.assertEqual(inst.memory_cache.stats()['misses'], 1)
+        response = inst(context, request)
+        self.assertEqual(response.body, expected.body)
+        self.assertEqual(inst.memory_cache.stats()['hits'], 1)
+
+    def test_call_if_none_match(self):
+        inst = self._makeOne('tests:fixtures/static', memory_cache_size=10)
+        request = self._makeRequest({'PATH_INFO': '/index.html'})
+        context = DummyContext()
+        etag = inst(context, request).etag
+        request = self._makeRequest(
+            {'PATH_INFO': '/index.html', 'HTTP_IF_NONE_MATCH': '"%s"' % etag}
+        )
+        response = request.get_response(
+            lambda e, s: inst(context, request)(e, s)
+        )
+        self.assertEqual(response.status_int, 304)
+
+    def test_call_with_content_encodings(self):
+        inst = self._makeOne(
+            'tests:fixtures/static',
+            content_encodings=['gzip'],
+            memory_cache_size=10,
+        )
+        request = self._makeRequest(
+            {'PATH_INFO': '/encoded.html', 'HTTP_ACCEPT_ENCODING': 'gzip'}
+        )
+        context = DummyContext()
+        response = inst(context, request)
+        self.assertEqual(response.headers['Vary'], 'Accept-Encoding')
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(len(response.body), 187)
+
+    def test_call_large_file_is_streamed(self):
+        from pyramid.response import FileResponse
+
+        inst = self._makeOne(
+            'tests:fixtures/static',
+            memory_cache_size=10,
+            memory_cache_max_file_size=10,
+        )
+        request = self._makeRequest({'PATH_INFO': '/index.html'})
+        context = DummyContext()
+        response = inst(context, request)
+        self.assertIsInstance(response, FileResponse)
+        self.assertTrue(b'<html>static</html>' in response.body)
+        response = inst(context, request)
+        self.assertIsInstance(response, FileResponse)
+        self.assertTrue(b'<html>static</html>' in response.body)
+        self.assertEqual(inst.memory_cache.stats()['hits'], 1)
+
+    def test_call_reload_checks_mtime(self):
+        import shutil
+        import tempfile
+
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, 'file.txt')
+            with open(path, 'wb') as f:
+                f.write(b'one')
+            inst = self._makeOne(tmpdir, memory_cache_size=10, reload=True)
+            request = self._makeRequest({'PATH_INFO': '/file.txt'})
+            context = DummyContext()
+            self.assertEqual(inst(context, request).body, b'one')
+            with open(path, 'wb') as f:
+                f.write(b'two')
+            mtime = os.path.getmtime(path) + 10
+            os.utime(path, (mtime, mtime))
+            self.assertEqual(inst(context, request).body, b'two')
+        finally:
+            shutil.rmtree(tmpdir)
+
+
+class Test_static_view_prescan(unittest.TestCase):
+    def _getTargetClass(self):
+        from pyramid.static import static_view
+
+        return static_view
+
+    def _makeOne(self, *arg, **kw):
+        return self._getTargetClass()(*arg, **kw)
+
+    def _makeRequest(self, kw=None):
+        from pyramid.request import Request
+
+        environ = {
+            'wsgi.url_scheme': 'http',
+            'wsgi.version': (1, 0),
+            'SERVER_NAME': 'example.com',
+            'SERVER_PORT': '6543',
+            'PATH_INFO': '/',
+            'SCRIPT_NAME': '',
+            'REQUEST_METHOD': 'GET',
+        }
+        if kw is not None:
+            environ.update(kw)
+        return Request(environ=environ)
+
+    def _assertScanned(self, inst, name):
+        files = inst.filemap[name('encoded.html')]
+        self.assertEqual(
+            [encoding for path, encoding in files], ['gzip', None]
+        )
+        self.assertEqual(inst.filemap[name('only_encoded.html')][0][1], 'gzip')
+        self.assertEqual(
+            inst.filemap[name('only_encoded.html.gz')][0][1], None
+        )
+        self.assertTrue(name('subdir/index.html') in inst.filemap)
+        path = files[1][0]
+        size, mtime, etag = inst.fileinfo[path]
+        self.assertEqual(size, 221)
+        self.assertEqual(mtime, os.path.getmtime(path))
+        self.assertEqual(len(etag), 40)
+
+    def test_ctor_defaultargs(self):
+        inst = self._makeOne('tests:fixtures/static')
+        self.assertEqual(inst.prescan, False)
+        self.assertEqual(inst.fileinfo, None)
+
+    def test_ctor_reload_disables_prescan(self):
+        inst = self._makeOne(
+            'tests:fixtures/static', prescan=True, reload=True
+        )
+        self.assertEqual(inst.prescan, False)
+
+    def test_scan_package(self):
+        inst = self._makeOne(
+            'tests:fixtures/static', content_encodings=['gzip']
+        )
+        inst.scan()
+        self._assertScanned(inst, lambda name: 'fixtures/static/' + name)
+
+    def test_scan_filesystem(self):
+        root = os.path.join(here, 'fixtures', 'static')
+        inst = self._makeOne(root, content_encodings=['gzip'])
+        inst.scan()
+        self._assertScanned(
+            inst,
+            lambda name: os.path.normcase(
+                os.path.normpath(os.path.join(root, name))
+            ),
+        )
+
+    def test_call_scans_once(self):
+        inst = self._makeOne(
+            'tests:fixtures/static', content_encodings=['gzip'], prescan=True
+        )
+        request = self._makeRequest(
+            {'PATH_INFO': '/encoded.html', 'HTTP_ACCEPT_ENCODING': 'gzip'}
+        )
+        context = DummyContext()
+        response = inst(context, request)
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(len(response.body), 187)
+        path = inst.filemap['fixtures/static/encoded.html'][0][0]
+        self.assertEqual(response.etag, inst.fileinfo[path][2])
+
+        from pyramid.httpexceptions import HTTPNotFound
+
+        def find_resource_path(name):  # pragma: no cover
+            raise AssertionError('disk searched for %s' % name)
+
+        inst.find_resource_path = find_resource_path
+        fileinfo = inst.fileinfo
+        request = self._makeRequest({'PATH_INFO': '/missing.html'})
+        self.assertRaises(HTTPNotFound, inst, context, request)
+        self.assertTrue(inst.fileinfo is fileinfo)
+
+    @unittest.skipIf(not hasattr(os, 'symlink'), 'no symbolic links')
+    def test_scan_symlink_cycle(self):
+        import shutil
+        import tempfile
+
+        tmpdir = tempfile.mkdtemp()
+        try:
+            os.mkdir(os.path.join(tmpdir, 'sub'))
+            with open(os.path.join(tmpdir, 'sub', 'file.txt'), 'wb') as f:
+                f.write(b'file')
+            os.symlink(tmpdir, os.path.join(tmpdir, 'sub', 'loop'))
+            os.symlink('sub', os.path.join(tmpdir, 'alias'))
+            inst = self._makeOne(tmpdir)
+            inst.scan()
+            root = os.path.normcase(os.path.normpath(tmpdir))
+            self.assertEqual(
+                sorted(inst.filemap),
+                [
+                    os.path.join(root, 'alias', 'file.txt'),
+                    os.path.join(root, 'sub', 'file.txt'),
+                ],
+            )
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_concurrent_calls_scan_once(self):
+        import threading
+
+        inst = self._makeOne('tests:fixtures/static', prescan=True)
+        scanning = threading.Event()
+        proceed = threading.Event()
+        scans = []
+        scan = inst.scan
+
+        def slow_scan():
+            scans.append(1)
+            scanning.set()
+            proceed.wait(5)
+            scan()
+
+        inst.scan = slow_scan
+        results = []
+
+        def get():
+            results.append(
+                inst.get_possible_files('fixtures/static/index.html')
+            )
+
+        first = threading.Thread(target=get)
+        first.start()
+        scanning.wait(5)
+        second = threading.Thread(target=get)
+        second.start()
+        second.join(0.1)
+        self.assertTrue(second.is_alive())
+        proceed.set()
+        first.join(5)
+        second.join(5)
+        self.assertEqual(len(scans), 1)
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0][0][1], None)
+
+    def test_find_best_match_is_memoized(self):
+        inst = self._makeOne(
+            'tests:fixtures/static', content_encodings=['gzip']
+        )
+        files = [('encoded.html.gz', 'gzip'), ('encoded.html', None)]
+        request = self._makeRequest({'HTTP_ACCEPT_ENCODING': 'gzip, br'})
+        self.assertEqual(
+            inst.find_best_match(request, files), ('encoded.html.gz', 'gzip')
+        )
+        request = self._makeRequest({'HTTP_ACCEPT_ENCODING': 'GZIP,br'})
+        self.assertEqual(
+            inst.find_best_match(request, files), ('encoded.html.gz', 'gzip')
+        )
+        stats = inst.accept_encoding_cache.stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['size'], 1)
+        request = self._makeRequest({'HTTP_ACCEPT_ENCODING': 'br'})
+        self.assertEqual(
+            inst.find_best_match(request, files), ('encoded.html', None)
+        )
+
+
 class TestQueryStringConstantCacheBuster(unittest.TestCase):
     def _makeOne(self, param=None):
         from pyramid.static import QueryStringConstantCacheBuster as cls
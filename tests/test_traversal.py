@@ -476,6 +476,121 @@ class ResourceTreeTraverserTests(unittest.TestCase):
         self.assertEqual(result['virtual_root_path'], ('abc',))
 
 
+class CachingResourceTreeTraverserTests(ResourceTreeTraverserTests):
+    def _getTargetClass(self):
+        from pyramid.traversal import CachingResourceTreeTraverser
+
+        return CachingResourceTreeTraverser
+
+    def _makeTree(self):
+        baz = CacheableContext(name='baz')
+        bar = CacheableContext(baz, 'bar')
+        foo = CacheableContext(bar, 'foo')
+        root = CacheableContext(foo, 'root')
+        foo.__parent__ = root
+        bar.__parent__ = foo
+        baz.__parent__ = bar
+        return root, foo, bar, baz
+
+    def _makeRequest(self, path_info, **kw):
+        environ = self._getEnviron(PATH_INFO=path_info, **kw)
+        return DummyRequest(environ, path_info=path_info)
+
+    def test_call_caches_cacheable_result(self):
+        root, foo, bar, baz = self._makeTree()
+        policy = self._makeOne(root)
+        result = policy(self._makeRequest('/foo/bar/@@view/a'))
+        self.assertEqual(result['context'], bar)
+        self.assertEqual(result['view_name'], 'view')
+        self.assertEqual(result['subpath'], ('a',))
+        root.calls = foo.calls = 0
+        policy = self._makeOne(root)
+        cached = policy(self._makeRequest('/foo/bar/@@view/a'))
+        self.assertEqual(cached, result)
+        self.assertFalse(cached is result)
+        self.assertEqual(root.calls, 0)
+        self.assertEqual(foo.calls, 0)
+        stats = policy.cache.stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['size'], 1)
+
+    def test_call_does_not_cache_uncacheable_result(self):
+        root, foo, bar, baz = self._makeTree()
+        foo.__cacheable__ = False
+        policy = self._makeOne(root)
+        policy(self._makeRequest('/foo/bar'))
+        self.assertEqual(len(policy.cache), 0)
+        root.calls = 0
+        result = self._makeOne(root)(self._makeRequest('/foo/bar'))
+        self.assertEqual(result['context'], bar)
+        self.assertEqual(root.calls, 1)
+
+    def test_call_tree_version_change_discards_cache(self):
+        root, foo, bar, baz = self._makeTree()
+        root.__tree_version__ = 1
+        policy = self._makeOne(root)
+        policy(self._makeRequest('/foo'))
+        self.assertEqual(len(policy.cache), 1)
+        self.assertTrue(self._makeOne(root).cache is policy.cache)
+        root.__tree_version__ = 2
+        root.calls = 0
+        policy = self._makeOne(root)
+        self.assertEqual(len(policy.cache), 0)
+        result = policy(self._makeRequest('/foo'))
+        self.assertEqual(result['context'], foo)
+        self.assertEqual(root.calls, 1)
+
+    def test_call_caches_per_root(self):
+        root1 = self._makeTree()[0]
+        root2 = self._makeTree()[0]
+        self._makeOne(root1)(self._makeRequest('/foo'))
+        result = self._makeOne(root2)(self._makeRequest('/foo'))
+        self.assertEqual(result['root'], root2)
+
+    def test_call_distinguishes_virtual_roots(self):
+        from pyramid.interfaces import VH_ROOT_KEY
+
+        root, foo, bar, baz = self._makeTree()
+        policy = self._makeOne(root)
+        result = policy(self._makeRequest('/bar'))
+        self.assertEqual(result['context'], foo)
+        self.assertEqual(result['virtual_root'], root)
+        result = policy(self._makeRequest('/bar', **{VH_ROOT_KEY: '/foo'}))
+        self.assertEqual(result['context'], bar)
+        self.assertEqual(result['virtual_root'], foo)
+
+    def test_call_with_matchdict(self):
+        root, foo, bar, baz = self._makeTree()
+        policy = self._makeOne(root)
+        request = self._makeRequest('/')
+        request.matchdict = {'traverse': ('foo', 'bar'), 'subpath': ('a',)}
+        result = policy(request)
+        self.assertEqual(result['context'], bar)
+        self.assertEqual(result['subpath'], ('a',))
+        request.matchdict = {'traverse': ('foo', 'bar'), 'subpath': ('b',)}
+        result = policy(request)
+        self.assertEqual(result['subpath'], ('b',))
+        self.assertEqual(len(policy.cache), 2)
+
+    def test_call_with_unhashable_matchdict_value(self):
+        root, foo, bar, baz = self._makeTree()
+        policy = self._makeOne(root)
+        request = self._makeRequest('/')
+        request.matchdict = {'traverse': ['foo'], 'subpath': ()}
+        result = policy(request)
+        self.assertEqual(result['context'], foo)
+        self.assertEqual(len(policy.cache), 0)
+
+    def test_cache_size(self):
+        root = self._makeTree()[0]
+        klass = type('Traverser', (self._getTargetClass(),), {'cache_size': 1})
+        policy = klass(root)
+        policy(self._makeRequest('/foo'))
+        policy(self._makeRequest('/foo/bar'))
+        self.assertEqual(len(policy.cache), 1)
+
+
 class FindInterfaceTests(unittest.TestCase):
     def _callFUT(self, context, iface):
         from pyramid.traversal import find_interface
@@ -878,6 +993,100 @@ class QuotePathSegmentTests(unittest.TestCase):
         result = self._callFUT(s)
         self.assertEqual(result, 'abc')
 
+    def test_bytes_and_str_share_cache_entry(self):
+        from pyramid.traversal import _segment_cache
+
+        _segment_cache.clear()
+        self.assertEqual(self._callFUT(b'La Pe\xc3\xb1a'), 'La%20Pe%C3%B1a')
+        self.assertEqual(self._callFUT('La Pe\xf1a'), 'La%20Pe%C3%B1a')
+        self.assertEqual(len(_segment_cache), 1)
+        self.assertEqual(_segment_cache.hits, 1)
+
+    def test_safe_is_part_of_key(self):
+        from pyramid.traversal import quote_path_segment
+
+        self.assertEqual(quote_path_segment('a/b', safe='/'), 'a/b')
+        self.assertEqual(quote_path_segment('a/b', safe=''), 'a%2Fb')
+
+    def test_cache_is_bounded(self):
+        from pyramid.traversal import _segment_cache
+
+        maxsize = _segment_cache.maxsize
+        _segment_cache.resize(2)
+        _segment_cache.clear()
+        try:
+            for s in ('a', 'b', 'c'):
+                self._callFUT(s)
+            self.assertEqual(len(_segment_cache), 2)
+            self.assertEqual(_segment_cache.evictions, 1)
+        finally:
+            _segment_cache.resize(maxsize)
+
+
+class Test_quote_path_segment_cache_stats(unittest.TestCase):
+    def _callFUT(self):
+        from pyramid.traversal import quote_path_segment_cache_stats
+
+        return quote_path_segment_cache_stats()
+
+    def test_it(self):
+        from pyramid.traversal import _segment_cache, quote_path_segment
+
+        _segment_cache.clear()
+        quote_path_segment('a')
+        quote_path_segment('a')
+        stats = self._callFUT()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['size'], 1)
+        self.assertEqual(stats['maxsize'], _segment_cache.maxsize)
+
+
+class Test_set_quote_path_segment_cache_size(unittest.TestCase):
+    def setUp(self):
+        from pyramid.traversal import _segment_cache
+
+        self.maxsize = _segment_cache.maxsize
+
+    def tearDown(self):
+        from pyramid.traversal import _segment_cache
+
+        _segment_cache.resize(self.maxsize)
+
+    def _callFUT(self, maxsize):
+        from pyramid.traversal import set_quote_path_segment_cache_size
+
+        return set_quote_path_segment_cache_size(maxsize)
+
+    def test_it(self):
+        from pyramid.traversal import (
+            PATH_SEGMENT_SAFE,
+            _segment_cache,
+            quote_path_segment,
+        )
+
+        _segment_cache.clear()
+        for s in ('a', 'b', 'c'):
+            quote_path_segment(s)
+        self._callFUT('1')
+        self.assertEqual(_segment_cache.maxsize, 1)
+        self.assertEqual(len(_segment_cache), 1)
+        self.assertTrue(('c', PATH_SEGMENT_SAFE) in _segment_cache)
+        self.assertEqual(_segment_cache.evictions, 2)
+
+    def test_zero_disables_cache(self):
+        from pyramid.traversal import _segment_cache, quote_path_segment
+
+        _segment_cache.clear()
+        self._callFUT(0)
+        self.assertEqual(quote_path_segment('a b'), 'a%20b')
+        self.assertEqual(quote_path_segment('a b'), 'a%20b')
+        self.assertEqual(len(_segment_cache), 0)
+        self.assertEqual(_segment_cache.hits, 0)
+
+    def test_negative(self):
+        self.assertRaises(ValueError, self._callFUT, -1)
+
 
 class ResourceURLTests(unittest.TestCase):
     def _makeOne(self, context, url):
@@ -1266,6 +1475,15 @@ class DummyContext(object):
         )
 
 
+class CacheableContext(DummyContext):
+    __cacheable__ = True
+    calls = 0
+
+    def __getitem__(self, name):
+        self.calls += 1
+        return DummyContext.__getitem__(self, name)
+
+
 class DummyRequest:
 
     application_url = (
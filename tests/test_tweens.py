@@ -100,6 +100,90 @@ class Test_excview_tween_factory(unittest.TestCase):
         self.assertIsNone(request.exc_info)
 
 
+class Test_excview_tween_factory_async(unittest.TestCase):
+    def setUp(self):
+        self.config = testing.setUp()
+
+    def tearDown(self):
+        testing.tearDown()
+
+    def _makeOne(self, handler):
+        from pyramid.tweens import excview_tween_factory
+
+        return excview_tween_factory(handler, self.config.registry)
+
+    def _run(self, awaitable):
+        import asyncio
+
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(awaitable)
+        finally:
+            loop.close()
+
+    def _makeRequest(self):
+        from pyramid.request import Request
+
+        request = Request.blank('/')
+        request.registry = self.config.registry
+        return request
+
+    def test_supports_async(self):
+        from pyramid.tweens import excview_tween_factory
+
+        self.assertTrue(excview_tween_factory.supports_async)
+
+    def test_it_passthrough_no_exception(self):
+        dummy_response = DummyResponse()
+
+        async def handler(request):
+            return dummy_response
+
+        tween = self._makeOne(handler)
+        request = self._makeRequest()
+        self.assertTrue(self._run(tween(request)) is dummy_response)
+        self.assertIsNone(request.exception)
+
+    def test_it_catches_with_sync_exception_view(self):
+        from pyramid.response import Response
+
+        self.config.add_view(
+            lambda exc, request: Response('foo'), context=ValueError
+        )
+
+        async def handler(request):
+            raise ValueError
+
+        tween = self._makeOne(handler)
+        request = self._makeRequest()
+        result = self._run(tween(request))
+        self.assertEqual(result.body, b'foo')
+        self.assertIsInstance(request.exception, ValueError)
+        self.assertEqual(request.exception, request.exc_info[1])
+
+    def test_it_catches_with_async_exception_view(self):
+        from pyramid.response import Response
+
+        async def excview(exc, request):
+            return Response('foo')
+
+        self.config.add_view(excview, context=ValueError)
+
+        async def handler(request):
+            raise ValueError
+
+        tween = self._makeOne(handler)
+        result = self._run(tween(self._makeRequest()))
+        self.assertEqual(result.body, b'foo')
+
+    def test_it_reraises_on_no_match(self):
+        async def handler(request):
+            raise ValueError
+
+        tween = self._makeOne(handler)
+        self.assertRaises(ValueError, self._run, tween(self._makeRequest()))
+
+
 class DummyRequest:
     exception = None
     exc_info = None
@@ -782,6 +782,50 @@ class TestURLMethodsMixin(unittest.TestCase):
         )
         self.assertEqual(result, '/foo/1/2/3/extra1/extra2?a=1#foo')
 
+    def test_route_paths(self):
+        from pyramid.config import Configurator
+
+        config = Configurator(registry=self.config.registry)
+        config.add_route('item', '/items/{id}/{name}')
+        config.commit()
+        request = self._makeOne()
+        request.script_name = '/foo'
+        kws = [
+            {'id': 1, 'name': 'a b'},
+            {'id': 2, 'name': 'c', '_query': {'x': 1}},
+        ]
+        result = request.route_paths('item', iter(kws))
+        self.assertEqual(result, ['/foo/items/1/a%20b', '/foo/items/2/c?x=1'])
+        self.assertEqual(
+            result, [request.route_path('item', **dict(kw)) for kw in kws]
+        )
+        self.assertEqual(kws[1], {'id': 2, 'name': 'c', '_query': {'x': 1}})
+
+    def test_route_paths_with_pregenerator(self):
+        from pyramid.interfaces import IRoutesMapper
+
+        request = self._makeOne()
+        request.script_name = '/foo'
+        route = DummyRoute('/1/2/3')
+
+        def pregenerator(request, elements, kw):
+            self.assertEqual(kw['_app_url'], '/foo')
+            return ('a',), {'_app_url': '/bar'}
+
+        route.pregenerator = pregenerator
+        mapper = DummyRoutesMapper(route=route)
+        request.registry.registerUtility(mapper, IRoutesMapper)
+        result = request.route_paths('flub', [{}, {}])
+        self.assertEqual(result, ['/bar/1/2/3/a', '/bar/1/2/3/a'])
+
+    def test_route_paths_no_such_route(self):
+        from pyramid.interfaces import IRoutesMapper
+
+        request = self._makeOne()
+        mapper = DummyRoutesMapper(route=None)
+        request.registry.registerUtility(mapper, IRoutesMapper)
+        self.assertRaises(KeyError, request.route_paths, 'flub', [{}])
+
     def test_static_url_staticurlinfo_notfound(self):
         request = self._makeOne()
         self.assertRaises(ValueError, request.static_url, 'static/foo.css')
@@ -304,6 +304,105 @@ class RoutesMapperTests(unittest.TestCase):
         self.assertEqual(mapper.generate('abc', {}), 123)
 
 
+class IndexedRoutesMapperTests(RoutesMapperTests):
+    def _makeOne(self):
+        klass = self._getTargetClass()
+        return klass(indexed=True)
+
+    def test___call__preserves_route_order(self):
+        mapper = self._makeOne()
+        mapper.connect('catchall', '/{path:.*}')
+        mapper.connect('foo', '/archives/:action')
+        request = self._getRequest(path_info='/archives/action1')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['catchall'])
+
+    def test___call__skips_routes_with_other_prefixes(self):
+        mapper = self._makeOne()
+        mapper.connect('foo', '/foo/:action')
+        mapper.connect('bar', '/bar/:action')
+        mapper.connect('baz', '/bar/baz')
+        request = self._getRequest(path_info='/bar/baz')
+        index = mapper.get_index()
+        self.assertEqual(
+            index.candidates('/bar/baz'),
+            [mapper.routes['bar'], mapper.routes['baz']],
+        )
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['bar'])
+        self.assertEqual(result['match'], {'action': 'baz'})
+
+    def test___call__static_route_with_trailing_newline(self):
+        mapper = self._makeOne()
+        mapper.connect('foo', '/foo')
+        request = self._getRequest(path_info='/foo\n')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['foo'])
+
+    def test_connect_rebuilds_index(self):
+        mapper = self._makeOne()
+        mapper.connect('foo', '/foo/:action')
+        index = mapper.get_index()
+        self.assertTrue(mapper.get_index() is index)
+        mapper.connect('bar', '/bar/:action')
+        self.assertFalse(mapper.get_index() is index)
+        request = self._getRequest(path_info='/bar/1')
+        result = mapper(request)
+        self.assertEqual(result['route'], mapper.routes['bar'])
+
+    def test_connect_name_exists_updates_index(self):
+        mapper = self._makeOne()
+        mapper.connect('foo', '/foo/:action')
+        request = self._getRequest(path_info='/foo/1')
+        self.assertEqual(mapper(request)['route'], mapper.routes['foo'])
+        mapper.connect('foo', '/bar/:action')
+        self.assertEqual(mapper(request)['route'], None)
+
+
+class TestRouteIndex(unittest.TestCase):
+    def _makeOne(self, *patterns):
+        from pyramid.urldispatch import Route, RouteIndex
+
+        routes = [Route(pattern, pattern) for pattern in patterns]
+        return RouteIndex(routes)
+
+    def _candidates(self, index, path):
+        return [route.pattern for route in index.candidates(path)]
+
+    def test_root_routes_always_candidates(self):
+        index = self._makeOne('/{foo}', '/foo/{bar}', '*traverse')
+        self.assertEqual(
+            self._candidates(index, '/baz/bar'), ['/{foo}', '*traverse']
+        )
+
+    def test_exact_routes(self):
+        index = self._makeOne('/foo', '/foo/', '/foo/bar')
+        self.assertEqual(self._candidates(index, '/foo'), ['/foo'])
+        self.assertEqual(self._candidates(index, '/foo/'), ['/foo/'])
+        self.assertEqual(self._candidates(index, '/foo/baz'), [])
+
+    def test_nested_prefixes_keep_order(self):
+        index = self._makeOne(
+            '/a/b/{c}', '/a/{b}', '/a/b/c/{d}', '/a/bc{d}', '/x/{y}'
+        )
+        self.assertEqual(
+            self._candidates(index, '/a/b/c/d'),
+            ['/a/b/{c}', '/a/{b}', '/a/b/c/{d}', '/a/bc{d}'],
+        )
+
+    def test_path_without_leading_slash(self):
+        index = self._makeOne('/a/{b}', '/{a}')
+        self.assertEqual(self._candidates(index, 'a/b'), ['/{a}'])
+
+    def test_unknown_matcher(self):
+        from pyramid.urldispatch import RouteIndex
+
+        route = DummyRoute(None)
+        route.match = lambda path: {}
+        index = RouteIndex([route])
+        self.assertEqual(index.candidates('/a/b'), [route])
+
+
 class TestCompileRoute(unittest.TestCase):
     def _callFUT(self, pattern):
         from pyramid.urldispatch import _compile_route
@@ -356,6 +455,21 @@ class TestCompileRoute(unittest.TestCase):
             '/foo/1/biz/2/bar/a/b',
         )
 
+    def test_matcher_prefix(self):
+        matcher, generator = self._callFUT('/foo/:baz/biz/:buz/bar')
+        self.assertEqual(matcher.prefix, '/foo/')
+        self.assertFalse(matcher.exact)
+
+    def test_matcher_prefix_exact(self):
+        matcher, generator = self._callFUT('foo/bar')
+        self.assertEqual(matcher.prefix, '/foo/bar')
+        self.assertTrue(matcher.exact)
+
+    def test_matcher_prefix_star(self):
+        matcher, generator = self._callFUT('/static/*subpath')
+        self.assertEqual(matcher.prefix, '/static/')
+        self.assertFalse(matcher.exact)
+
     def test_no_beginning_slash(self):
         matcher, generator = self._callFUT('foo/:baz/biz/:buz/bar')
         self.assertEqual(
@@ -484,6 +598,26 @@ class TestCompileRoute(unittest.TestCase):
         # should be a native string
         self.assertEqual(type(result), str)
 
+    def test_generate_ignores_values_not_in_pattern(self):
+        pattern = '/foo/{x}'
+        _, generator = self._callFUT(pattern)
+
+        class Unquotable(object):
+            def __str__(self):  # pragma: no cover
+                raise AssertionError('quoted')
+
+        result = generator({'x': 'a', 'y': Unquotable()})
+        self.assertEqual(result, '/foo/a')
+
+    def test_generate_missing_value(self):
+        _, generator = self._callFUT('/foo/{x}/*rest')
+        self.assertRaises(KeyError, generator, {'x': 'a'})
+        self.assertRaises(KeyError, generator, {'rest': ()})
+
+    def test_generate_literal_with_percent(self):
+        _, generator = self._callFUT('/100%/{x}')
+        self.assertEqual(generator({'x': '%'}), '/100%25/%25')
+
 
 class TestCompileRouteFunctional(unittest.TestCase):
     def matches(self, pattern, path, expected):
@@ -423,6 +423,153 @@ class Test_WeakOrderedSet(unittest.TestCase):
         self.assertEqual(wos.last, None)
 
 
+class TestLRUCache(unittest.TestCase):
+    def _makeOne(self, maxsize=2):
+        from pyramid.util import LRUCache
+
+        return LRUCache(maxsize)
+
+    def test_ctor_bad_maxsize(self):
+        self.assertRaises(ValueError, self._makeOne, 0)
+
+    def test_get_miss(self):
+        cache = self._makeOne()
+        self.assertEqual(cache.get('a'), None)
+        self.assertEqual(cache.get('a', 1), 1)
+        self.assertEqual(cache.misses, 2)
+        self.assertEqual(cache.hits, 0)
+
+    def test_put_and_get(self):
+        cache = self._makeOne()
+        cache.put('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(len(cache), 1)
+        self.assertTrue('a' in cache)
+
+    def test_put_evicts_least_recently_used(self):
+        cache = self._makeOne()
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertFalse('b' in cache)
+        self.assertTrue('a' in cache)
+        self.assertTrue('c' in cache)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_put_existing_key(self):
+        cache = self._makeOne()
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.put('a', 3)
+        cache.put('c', 4)
+        self.assertEqual(cache.get('a'), 3)
+        self.assertFalse('b' in cache)
+
+    def test_pop(self):
+        cache = self._makeOne()
+        cache.put('a', 1)
+        self.assertEqual(cache.pop('a'), 1)
+        self.assertEqual(cache.pop('a', 2), 2)
+        self.assertEqual(len(cache), 0)
+
+    def test_clear(self):
+        cache = self._makeOne()
+        cache.put('a', 1)
+        cache.get('a')
+        cache.get('b')
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual((cache.hits, cache.misses), (0, 0))
+
+    def test_stats(self):
+        cache = self._makeOne()
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.put('c', 3)
+        cache.get('c')
+        cache.get('a')
+        self.assertEqual(
+            cache.stats(),
+            {'hits': 1, 'misses': 1, 'evictions': 1, 'size': 2, 'maxsize': 2},
+        )
+
+
+class TestFIFOCache(unittest.TestCase):
+    def _makeOne(self, maxsize=2):
+        from pyramid.util import FIFOCache
+
+        return FIFOCache(maxsize)
+
+    def test_ctor_bad_maxsize(self):
+        self.assertRaises(ValueError, self._makeOne, -1)
+
+    def test_get_miss(self):
+        cache = self._makeOne()
+        self.assertEqual(cache.get('a'), None)
+        self.assertEqual(cache.get('a', 1), 1)
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+    def test_put_and_get(self):
+        cache = self._makeOne()
+        cache.put('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(len(cache), 1)
+        self.assertTrue('a' in cache)
+
+    def test_put_evicts_oldest(self):
+        cache = self._makeOne()
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('a', 3)
+        cache.put('c', 4)
+        self.assertFalse('a' in cache)
+        self.assertTrue('b' in cache)
+        self.assertTrue('c' in cache)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_maxsize_zero(self):
+        cache = self._makeOne(0)
+        cache.put('a', 1)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.evictions, 0)
+
+    def test_resize(self):
+        cache = self._makeOne(3)
+        for key in 'abc':
+            cache.put(key, 1)
+        cache.resize(1)
+        self.assertEqual(cache.maxsize, 1)
+        self.assertTrue('c' in cache)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.evictions, 2)
+        self.assertRaises(ValueError, cache.resize, -1)
+
+    def test_clear(self):
+        cache = self._makeOne()
+        cache.put('a', 1)
+        cache.get('a')
+        cache.get('b')
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual((cache.hits, cache.misses), (0, 0))
+
+    def test_stats(self):
+        cache = self._makeOne()
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.put('c', 3)
+        cache.get('c')
+        cache.get('a')
+        self.assertEqual(
+            cache.stats(),
+            {'hits': 1, 'misses': 1, 'evictions': 1, 'size': 2, 'maxsize': 2},
+        )
+
+
 class Test_strings_differ(unittest.TestCase):
     def _callFUT(self, *args, **kw):
         from pyramid.util import strings_differ
@@ -1,6 +1,6 @@
 import sys
 import unittest
-from zope.interface import Interface, implementer
+from zope.interface import Interface, directlyProvides, implementer
 
 from pyramid import testing
 from pyramid.interfaces import IRequest, IResponse
@@ -361,6 +361,84 @@ class RenderViewToResponseTests(BaseTest, unittest.TestCase):
         self.assertEqual(response.app_iter, ['aview'])
 
 
+class Test_find_views(BaseTest, unittest.TestCase):
+    def _callFUT(self, registry, context_iface, name, **kw):
+        from pyramid.view import _find_views
+
+        return _find_views(registry, IRequest, context_iface, name, **kw)
+
+    def test_hit_is_cached(self):
+        request = self._makeRequest()
+        registry = request.registry
+        view = make_view('OK')
+        self._registerView(registry, view, 'registered')
+        self.assertEqual(
+            self._callFUT(registry, IContext, 'registered'), [view]
+        )
+        self.assertEqual(
+            registry._view_lookup_cache[(IRequest, IContext, 'registered')],
+            [view],
+        )
+        self.assertEqual(len(registry._view_lookup_miss_cache), 0)
+
+    def test_miss_is_cached(self):
+        request = self._makeRequest()
+        registry = request.registry
+        misses = registry._view_lookup_miss_cache
+        self.assertEqual(self._callFUT(registry, IContext, 'missing'), [])
+        self.assertEqual(self._callFUT(registry, IContext, 'missing'), [])
+        self.assertEqual(registry._view_lookup_cache, {})
+        self.assertEqual(len(misses), 1)
+        self.assertEqual((misses.hits, misses.misses), (1, 1))
+
+    def test_miss_cache_is_bounded(self):
+        request = self._makeRequest()
+        registry = request.registry
+        registry.settings = {'pyramid.view_lookup_miss_cache_size': 2}
+        registry._clear_view_lookup_cache()
+        for name in ('a', 'b', 'c'):
+            self._callFUT(registry, IContext, name)
+        misses = registry._view_lookup_miss_cache
+        self.assertEqual(len(misses), 2)
+        self.assertEqual(misses.evictions, 1)
+
+    def test_miss_cache_disabled(self):
+        request = self._makeRequest()
+        registry = request.registry
+        registry.settings = {'pyramid.view_lookup_miss_cache_size': 0}
+        registry._clear_view_lookup_cache()
+        self.assertEqual(self._callFUT(registry, IContext, 'missing'), [])
+        self.assertEqual(registry._view_lookup_miss_cache, None)
+
+    def test_miss_keyed_on_view_classifier(self):
+        from pyramid.interfaces import IExceptionViewClassifier, IView
+
+        request = self._makeRequest()
+        registry = request.registry
+        view = make_view('OK')
+        self.assertEqual(self._callFUT(registry, IContext, ''), [])
+        registry.registerAdapter(
+            view, (IExceptionViewClassifier, IRequest, IContext), IView, ''
+        )
+        result = self._callFUT(
+            registry,
+            IContext,
+            '',
+            view_classifier=IExceptionViewClassifier,
+        )
+        self.assertEqual(result, [view])
+
+    def test_clear_view_lookup_cache_forgets_misses(self):
+        request = self._makeRequest()
+        registry = request.registry
+        self.assertEqual(self._callFUT(registry, IContext, 'late'), [])
+        view = make_view('OK')
+        self._registerView(registry, view, 'late')
+        self.assertEqual(self._callFUT(registry, IContext, 'late'), [])
+        registry._clear_view_lookup_cache()
+        self.assertEqual(self._callFUT(registry, IContext, 'late'), [view])
+
+
 class RenderViewToIterableTests(BaseTest, unittest.TestCase):
     def _callFUT(self, *arg, **kw):
         from pyramid.view import render_view_to_iterable
@@ -1196,6 +1274,82 @@ class TestViewMethodsMixin(unittest.TestCase):
             self.fail()
 
 
+class Test_call_view_async(BaseTest, unittest.TestCase):
+    def _callFUT(self, context, request, **kw):
+        import asyncio
+        from zope.interface import providedBy
+        from pyramid.view import _call_view_async
+
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(
+                _call_view_async(
+                    request.registry,
+                    request,
+                    context,
+                    providedBy(context),
+                    '',
+                    **kw
+                )
+            )
+        finally:
+            loop.close()
+
+    def _makeView(self):
+        async def view(context, request):
+            return 'secure'  # pragma: no cover
+
+        async def permissive(context, request):
+            return 'permissive'
+
+        view.__call_permissive__ = permissive
+        return view
+
+    def test_not_secure(self):
+        context = DummyContext()
+        directlyProvides(context, IContext)
+        request = self._makeRequest()
+        self._registerView(request.registry, self._makeView(), '')
+        result = self._callFUT(context, request, secure=False)
+        self.assertEqual(result, 'permissive')
+
+    def test_predicate_mismatch(self):
+        from pyramid.exceptions import PredicateMismatch
+
+        async def view(context, request):
+            raise PredicateMismatch('mismatch')
+
+        context = DummyContext()
+        directlyProvides(context, IContext)
+        request = self._makeRequest()
+        self._registerView(request.registry, view, '')
+        self.assertRaises(PredicateMismatch, self._callFUT, context, request)
+
+    def test_checks_run_in_thread_pool(self):
+        import threading
+
+        threads = []
+
+        async def body():
+            threads.append(threading.current_thread())
+            return 'OK'
+
+        def view(context, request):
+            # a permission check, say, before the async def view callable
+            threads.append(threading.current_thread())
+            return body()
+
+        context = DummyContext()
+        directlyProvides(context, IContext)
+        request = self._makeRequest()
+        self._registerView(request.registry, view, '')
+        result = self._callFUT(context, request)
+        self.assertEqual(result, 'OK')
+        main = threading.current_thread()
+        self.assertNotEqual(threads[0], main)
+        self.assertEqual(threads[1], main)
+
+
 class ExceptionResponse(Exception):
     status = '404 Not Found'
     app_iter = ['Not Found']
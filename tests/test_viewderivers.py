@@ -4,6 +4,7 @@ from zope.interface import implementer
 from pyramid import testing
 from pyramid.exceptions import ConfigurationError
 from pyramid.interfaces import IRequest, IResponse
+from pyramid.registry import Registry
 
 
 class TestDeriveView(unittest.TestCase):
@@ -211,6 +212,76 @@ class TestDeriveView(unittest.TestCase):
         context = testing.DummyResource()
         self.assertEqual(result(context, request), response)
 
+    def test_function_with_renderer_not_needing_system_values(self):
+        response = DummyResponse()
+        renderers = []
+
+        class moo(object):
+            def needs_system_values(inself):
+                return False
+
+            def render_view(inself, req, resp, view_inst, ctx):
+                renderers.append(inself)
+                self.assertEqual(view_inst, view)
+                return response
+
+            def clone(self):  # pragma: no cover
+                raise AssertionError('not cloned')
+
+        def view(request):
+            return 'OK'
+
+        renderer = moo()
+        result = self.config.derive_view(view, renderer=renderer)
+        request = self._makeRequest()
+        context = testing.DummyResource()
+        self.assertEqual(result(context, request), response)
+        self.assertEqual(result(context, request), response)
+        self.assertEqual(renderers, [renderer, renderer])
+
+    def test_function_with_json_renderer(self):
+        def view(request):
+            return {'a': 1}
+
+        result = self.config.derive_view(view, renderer='json')
+        request = testing.DummyRequest()
+        context = testing.DummyResource()
+        response = result(context, request)
+        self.assertEqual(response.body, b'{"a": 1}')
+        self.assertEqual(response.content_type, 'application/json')
+
+    def test_function_with_renderer_request_timings(self):
+        def view(request):
+            return {'a': 1}
+
+        self.config.registry.settings['request_timings'] = True
+        result = self.config.derive_view(view, renderer='json')
+        request = testing.DummyRequest()
+        context = testing.DummyResource()
+        response = result(context, request)
+        self.assertEqual(response.body, b'{"a": 1}')
+        timings = self.config.registry.request_timings
+        self.assertEqual(timings.phase('render').count, 1)
+
+    def test_function_with_renderer_request_tracer(self):
+        from pyramid.interfaces import IRequestTracer
+
+        def view(request):
+            return {'a': 1}
+
+        steps = []
+
+        def tracer(request, step, timing):
+            steps.append((request, step))
+
+        self.config.registry.registerUtility(tracer, IRequestTracer)
+        result = self.config.derive_view(view, renderer='json')
+        request = testing.DummyRequest()
+        context = testing.DummyResource()
+        response = result(context, request)
+        self.assertEqual(response.body, b'{"a": 1}')
+        self.assertEqual(steps, [(request, 'render')])
+
     def test_requestonly_function_with_renderer_request_override(self):
         def moo(info):
             def inner(value, system):
@@ -1694,6 +1765,142 @@ class TestDeriveView(unittest.TestCase):
         response = request.get_response(app)
         self.assertTrue(b'hello' in response.body)
 
+    def _run(self, awaitable):
+        import asyncio
+
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(awaitable)
+        finally:
+            loop.close()
+
+    def test_async_view_with_renderer(self):
+        async def view(request):
+            return {'a': 1}
+
+        result = self.config.derive_view(view, renderer='json')
+        request = testing.DummyRequest()
+        request.registry = self.config.registry
+        response = self._run(result(None, request))
+        self.assertEqual(response.body, b'{"a": 1}')
+
+    def test_async_view_returns_non_adaptable(self):
+        async def view(request):
+            return None
+
+        result = self.config.derive_view(view)
+        request = self._makeRequest()
+        self.assertRaises(ValueError, self._run, result(None, request))
+
+    def test_async_view_with_http_cache(self):
+        from pyramid.response import Response
+
+        async def view(request):
+            return Response('OK')
+
+        result = self.config._derive_view(view, http_cache=3600)
+        request = self._makeRequest()
+        response = self._run(result(None, request))
+        self.assertEqual(response.cache_control.max_age, 3600)
+
+    def test_async_view_with_wrapper(self):
+        from pyramid.interfaces import IView, IViewClassifier
+        from pyramid.response import Response
+
+        async def inner(request):
+            return Response('inner')
+
+        def outer(context, request):
+            return Response(b'outer ' + request.wrapped_body)
+
+        self.config.registry.registerAdapter(
+            outer, (IViewClassifier, None, None), IView, 'owrap'
+        )
+        result = self.config._derive_view(
+            inner, viewname='inner', wrapper_viewname='owrap'
+        )
+        request = self._makeRequest()
+        response = self._run(result(None, request))
+        self.assertEqual(response.body, b'outer inner')
+
+
+class TestCompiledDeriveView(TestDeriveView):
+    # the same behavior with the view derivers compiled together
+    def setUp(self):
+        TestDeriveView.setUp(self)
+        registry = self.config.registry
+        registry.__class__ = CompilingRegistry
+        registry.settings = registry.settings
+
+    def test_compiled_plan(self):
+        from pyramid.renderers import null_renderer
+        from pyramid.response import Response
+
+        def view(request):
+            return Response('OK')
+
+        self._registerSecurityPolicy(True)
+        result = self.config._derive_view(
+            view,
+            permission='view',
+            renderer=null_renderer,
+            require_csrf=True,
+            http_cache=3600,
+            predicates=[lambda context, request: True],
+        )
+        self.assertEqual(
+            result.__deriver_plan__,
+            (
+                (
+                    'predicated_view',
+                    'secured_view',
+                    'csrf_view',
+                    'http_cached_view',
+                ),
+                ('mapped_view',),
+            ),
+        )
+        self.assertEqual(result.__name__, 'view')
+        self.assertEqual(result.__permission__, 'view')
+        self.assertEqual(len(result.__predicates__), 1)
+        # the compiled view calls the mapped view directly
+        self.assertEqual(result.__wraps__.__wraps__, view)
+        request = self._makeRequest()
+        request.method = 'GET'
+        response = result(None, request)
+        self.assertEqual(response.body, b'OK')
+        self.assertEqual(response.cache_control.max_age, 3600)
+        response = result.__unpredicated__(None, request)
+        self.assertEqual(response.cache_control.max_age, 3600)
+        response = result.__call_permissive__(None, request)
+        self.assertEqual(response.cache_control.max_age, 3600)
+
+    def test_compiled_around_decorator(self):
+        def view(request):
+            return DummyResponse()
+
+        def decorator(view):
+            def decorated(context, request):
+                return view(context, request)
+
+            return decorated
+
+        self._registerSecurityPolicy(True)
+        result = self.config._derive_view(
+            view, permission='view', decorator=decorator
+        )
+        self.assertEqual(
+            result.__deriver_plan__,
+            (
+                ('secured_view',),
+                ('decorated_view',),
+                ('rendered_view',),
+                ('mapped_view',),
+            ),
+        )
+        request = self._makeRequest()
+        self.assertIsInstance(result(None, request), DummyResponse)
+
 
 class TestDerivationOrder(unittest.TestCase):
     def setUp(self):
@@ -2045,6 +2252,15 @@ class TestDeriverIntegration(unittest.TestCase):
         )
 
 
+class CompilingRegistry(Registry):
+    # keeps the view derivers compiled when a test replaces the settings
+    def _set_settings(self, settings):
+        settings = dict(settings, compile_view_derivers=True)
+        Registry._set_settings(self, settings)
+
+    settings = property(Registry._get_settings, _set_settings)
+
+
 @implementer(IResponse)
 class DummyResponse(object):
     content_type = None